@@ -1,38 +1,173 @@
 import sqlite3
 import os
+import threading
+import itertools
+import weakref
+import inspect
+from contextlib import contextmanager
 from pathlib import Path
 import bcrypt
 import hashlib
+from app.utils.image_ingest import prepare_profile_photo, needs_ingest
+
+
+# Overrides the default data/database.db location (":memory:" for a throwaway database)
+DATABASE_PATH_ENV = "BCD_DATABASE_PATH"
+_memory_ids = itertools.count(1)
+
+# Per-thread cancellation check for the connections opened by that thread; see cancellable()
+_query_guard = threading.local()
+QUERY_CHECK_INSTRUCTIONS = 1000
+
+
+@contextmanager
+def cancellable(is_cancelled):
+    """
+    Interrupt the queries this thread runs inside the block once is_cancelled() returns True.
+
+    The check runs every QUERY_CHECK_INSTRUCTIONS SQLite VM instructions; an interrupted
+    query raises sqlite3.OperationalError, which the Database methods report like any error.
+    """
+    outer = getattr(_query_guard, "is_cancelled", None)
+    _query_guard.is_cancelled = is_cancelled
+    try:
+        yield
+    finally:
+        _query_guard.is_cancelled = outer
 
 
 class Database:
-    def __init__(self):
-        self.setup_paths()
+    # Photos are streamed through incremental blob handles in chunks of this size
+    PHOTO_CHUNK_SIZE = 64 * 1024
+
+    def __init__(self, db_path=None):
+        """
+        Args:
+            db_path (str | Path): Database file, or ":memory:" for a private in-memory
+                database. Defaults to $BCD_DATABASE_PATH, then data/database.db.
+        """
+        self._change_listeners = []
+        self.setup_paths(db_path or os.environ.get(DATABASE_PATH_ENV))
         self.create_tables()
         self.data_table()
 
+    ############################### Change listeners
+    def add_change_listener(self, listener):
+        """
+        Call listener(tables) after every committed write through this Database.
+
+        tables is the set of table names the write changed. Listeners run on the writing
+        thread; bound methods are held weakly, so a listening window can still be deleted.
+        Derived-data upkeep (refresh_scholar_data) is not reported.
+        """
+        ref = weakref.WeakMethod(listener) if inspect.ismethod(listener) else (lambda: listener)
+        self._change_listeners.append(ref)
+
+    def remove_change_listener(self, listener):
+        self._change_listeners = [ref for ref in self._change_listeners if ref() not in (None, listener)]
+
+    def _notify_change(self, *tables):
+        for ref in list(self._change_listeners):
+            listener = ref()
+            if listener is None:
+                self._change_listeners.remove(ref)
+                continue
+            try:
+                listener(set(tables))
+            except Exception as e:
+                print(f"Error in database change listener: {e}")
+
     ############################### Convert Pictures to Blob
     def _convert_to_blob(self, path: str) -> bytes:
         if not path or not Path(path).is_file():
             print(f"Warning: Photo path '{path}' is invalid or file does not exist.")
             return b''
-        try:
-            with open(path, 'rb') as file:
-                return file.read()
-        except IOError as e:
-            print(f"Error reading image file {path}: {e}")
-            return b''
+        return prepare_profile_photo(path)
+
+    ############################### Incremental photo blob I/O
+    def _write_photo_blob(self, conn, user_id, data):
+        """
+        Store photo bytes into an existing usersInfo row.
+
+        The column is sized with zeroblob() and filled chunk by chunk through
+        Connection.blobopen, so the photo is never bound as one big parameter.
+        """
+        if not data:
+            conn.execute("UPDATE usersInfo SET profile_photo_data = NULL WHERE id = ?", (user_id,))
+            return
+
+        view = memoryview(data)
+        if not hasattr(conn, "blobopen"):
+            # Python < 3.11 has no incremental blob API
+            conn.execute("UPDATE usersInfo SET profile_photo_data = ? WHERE id = ?", (view, user_id))
+            return
+
+        conn.execute("UPDATE usersInfo SET profile_photo_data = zeroblob(?) WHERE id = ?", (len(view), user_id))
+        with conn.blobopen("usersInfo", "profile_photo_data", user_id) as blob:
+            for offset in range(0, len(view), self.PHOTO_CHUNK_SIZE):
+                blob.write(view[offset:offset + self.PHOTO_CHUNK_SIZE])
+
+    def _read_photo_blob(self, conn, user_id):
+        """
+        Read a stored photo chunk by chunk into one preallocated buffer.
+
+        Returns:
+            memoryview | None: A view over the photo bytes, or None if the user has no photo.
+        """
+        size = conn.execute(
+            "SELECT length(profile_photo_data) FROM usersInfo WHERE id = ?", (user_id,)
+        ).fetchone()
+        if not size or not size[0]:
+            return None
+
+        if not hasattr(conn, "blobopen"):
+            row = conn.execute("SELECT profile_photo_data FROM usersInfo WHERE id = ?", (user_id,)).fetchone()
+            return memoryview(row[0])
+
+        view = memoryview(bytearray(size[0]))
+        with conn.blobopen("usersInfo", "profile_photo_data", user_id, readonly=True) as blob:
+            offset = 0
+            while offset < len(view):
+                chunk = blob.read(self.PHOTO_CHUNK_SIZE)
+                if not chunk:
+                    break
+                view[offset:offset + len(chunk)] = chunk
+                offset += len(chunk)
+        return view
 
     ############################### Setup Paths
-    def setup_paths(self):
+    def setup_paths(self, db_path=None):
         current_file_path = Path(__file__).resolve()
         self.project_root = current_file_path.parents[2]
-        self.db_dir = self.project_root / "data"
-        self.db_dir.mkdir(exist_ok=True)
-        self.db_path = self.db_dir / "database.db"
+        self._memory_anchor = None
+
+        if str(db_path) == ":memory:":
+            # Every method opens its own connection, so use a named shared-cache
+            # in-memory database and keep one connection open to hold it alive.
+            self.db_dir = None
+            self.db_path = f"file:bcd-memory-{os.getpid()}-{next(_memory_ids)}?mode=memory&cache=shared"
+            self._memory_anchor = sqlite3.connect(self.db_path, uri=True, check_same_thread=False)
+            return
+
+        self.db_path = Path(db_path) if db_path else self.project_root / "data" / "database.db"
+        self.db_dir = self.db_path.parent
+        self.db_dir.mkdir(parents=True, exist_ok=True)
 
     def connect(self):
-        return sqlite3.connect(self.db_path)
+        if self._memory_anchor is not None:
+            conn = sqlite3.connect(self.db_path, uri=True)
+        else:
+            conn = sqlite3.connect(self.db_path)
+        is_cancelled = getattr(_query_guard, "is_cancelled", None)
+        if is_cancelled is not None:
+            conn.set_progress_handler(is_cancelled, QUERY_CHECK_INSTRUCTIONS)
+        return conn
+
+    def close(self):
+        """Release an in-memory database; file databases need no cleanup."""
+        if self._memory_anchor is not None:
+            self._memory_anchor.close()
+            self._memory_anchor = None
 
     ############################### Table for usersInfo
     def create_tables(self):
@@ -88,7 +223,7 @@ class Database:
 
         try:
             with self.connect() as conn:
-                conn.execute(
+                cursor = conn.execute(
                     """
                     INSERT INTO usersInfo (
                         acctype, username, email, password, scholarship_stat, 
@@ -100,13 +235,15 @@ class Database:
                     """,
                     (
                         acctype, username, email, hashed_pw, scholarship_stat,
-                        profile_photo_data,
+                        None,
                         first_name, last_name, middle_initial, suffix,
                         civil_status, gender, date_of_birth, age, student_id, college,
                         year_level, program, municipality, phone_number
                     )
                 )
+                self._write_photo_blob(conn, cursor.lastrowid, profile_photo_data)
                 conn.commit()
+            self._notify_change("usersInfo")
             return True, "User record imported successfully."
 
         except sqlite3.IntegrityError as e:
@@ -207,7 +344,8 @@ class Database:
                 cursor.execute(insert_query, (username, first_name, last_name, middle_name, suffix, email, municipality,
                                               college, program, year_level, scholarship_name, status, gwa))
                 conn.commit()
-                return True
+            self._notify_change("scholarships")
+            return True
 
         except Exception as e:
             print(f"Error submitting scholarship: {e}")
@@ -219,7 +357,7 @@ class Database:
             with self.connect() as conn:
                 user_record = conn.execute(
                     """SELECT 
-                        id, acctype, username, email, scholarship_stat, profile_photo_data,
+                        id, acctype, username, email, scholarship_stat, NULL,
                         first_name, last_name, middle_initial, suffix, civil_status,
                         gender, date_of_birth, age, student_id, college, 
                         year_level, program, municipality, phone_number
@@ -233,6 +371,7 @@ class Database:
                     return None
 
                 information_list = list(user_record)
+                information_list[5] = self._read_photo_blob(conn, user_record[0])
 
                 return information_list
 
@@ -242,7 +381,7 @@ class Database:
 
     ############################### users status getter for student
     def get_user_scholar_status(self, username):
-        conn = sqlite3.connect(self.db_path)
+        conn = self.connect()
         cursor = conn.cursor()
 
         cursor.execute("""
@@ -257,7 +396,7 @@ class Database:
 
     ############################### status getter for admins
     def get_user_info_for_admin(self):
-        conn = sqlite3.connect(self.db_path)
+        conn = self.connect()
         cursor = conn.cursor()
 
         cursor.execute("""
@@ -272,7 +411,7 @@ class Database:
 
     ############################### admin validator
     def is_Admin(self, username):
-        conn = sqlite3.connect(self.db_path)
+        conn = self.connect()
         cursor = conn.cursor()
         result = cursor.execute("""SELECT acctype FROM usersInfo WHERE username = ?""", (username,)).fetchone()
         AT = result[0]
@@ -300,14 +439,17 @@ class Database:
 
                 username = result[0]
 
+                changed = ["scholarships"]
                 if new_status.upper() == "ACCEPTED":
                     cursor.execute(
                         "UPDATE usersInfo SET scholarship_stat = 'SCHOLAR' WHERE username = ?",
                         (username,)
                     )
+                    changed.append("usersInfo")
 
                 conn.commit()
-                return True
+            self._notify_change(*changed)
+            return True
 
         except Exception as e:
             print(f"Error updating scholarship status: {e}")
@@ -559,11 +701,7 @@ class Database:
                          municipality, phone_number):
         profile_photo_data = None
         if profile_photo_path and Path(profile_photo_path).is_file():
-            try:
-                with open(profile_photo_path, 'rb') as f:
-                    profile_photo_data = f.read()
-            except Exception as e:
-                print(f"Error reading profile photo file: {e}")
+            profile_photo_data = prepare_profile_photo(profile_photo_path) or None
 
         try:
             conn = self.connect()
@@ -576,14 +714,21 @@ class Database:
                 student_id = ?, college = ?, year_level = ?, program = ?, municipality = ?, phone_number = ?
                 WHERE username = ?
             """, (
-                acctype, profile_photo_data, first_name, last_name, middle_initial, suffix,
+                acctype, None, first_name, last_name, middle_initial, suffix,
                 civil_status, gender, date_of_birth, age, student_id, college, year_level,
                 program, municipality, phone_number, username
             ))
 
+            updated = cursor.rowcount > 0
+            if updated and profile_photo_data:
+                user_id = cursor.execute("SELECT id FROM usersInfo WHERE username = ?", (username,)).fetchone()[0]
+                self._write_photo_blob(conn, user_id, profile_photo_data)
+
             conn.commit()
             conn.close()
-            return cursor.rowcount > 0
+            if updated:
+                self._notify_change("usersInfo")
+            return updated
 
         except sqlite3.Error as e:
             print(f"Database error during user profile update: {e}")
@@ -607,10 +752,104 @@ class Database:
 
             conn.commit()
             conn.close()
+            if cursor.rowcount > 0:
+                self._notify_change("users")
             return cursor.rowcount > 0
 
         except sqlite3.Error as e:
             print(f"Database error during password update for {username}: {e}")
             return False
 
-database = Database()
+    ############################### Shrink stored photos
+    def shrink_profile_photos(self, batch_size=50):
+        """
+        Re-run the ingest pipeline over photos already stored in usersInfo.
+
+        Rows are processed in id order, batch_size at a time, each batch in its own
+        transaction. Photos that already fit the ingest limits are skipped, and a photo
+        is only rewritten when the new blob is smaller.
+
+        Returns:
+            tuple: (rows_checked, rows_shrunk, bytes_saved)
+        """
+        checked = shrunk = saved = 0
+        last_id = 0
+
+        while True:
+            try:
+                with self.connect() as conn:
+                    # Only the ids are fetched per batch; photos are streamed in one at a time
+                    ids = [row[0] for row in conn.execute(
+                        """SELECT id FROM usersInfo
+                        WHERE id > ? AND profile_photo_data IS NOT NULL AND length(profile_photo_data) > 0
+                        ORDER BY id LIMIT ?""", (last_id, batch_size)
+                    )]
+
+                    if not ids:
+                        break
+
+                    for user_id in ids:
+                        checked += 1
+                        blob = self._read_photo_blob(conn, user_id)
+                        if blob is None or not needs_ingest(blob):
+                            continue
+                        smaller = prepare_profile_photo(blob)
+                        if smaller and len(smaller) < len(blob):
+                            self._write_photo_blob(conn, user_id, smaller)
+                            shrunk += 1
+                            saved += len(blob) - len(smaller)
+
+                    conn.commit()
+                    last_id = ids[-1]
+                    print(f"Shrunk photos up to id {last_id}: {shrunk}/{checked} rows, {saved} bytes saved.")
+
+            except sqlite3.Error as e:
+                print(f"Database error while shrinking photos: {e}")
+                break
+
+        if shrunk:
+            self._notify_change("usersInfo")
+        return checked, shrunk, saved
+
+
+############################### Shared instance
+class LazyDatabase:
+    """
+    Stand-in for the shared Database that creates it on first attribute access.
+
+    Importing this module no longer touches the disk; the real Database is built the
+    first time it is used, or ahead of time by warm_up() on a background thread.
+    A prepared instance (e.g. Database(":memory:") in tests) can be injected with set().
+    """
+
+    def __init__(self, factory=Database):
+        self._factory = factory
+        self._instance = None
+        self._lock = threading.Lock()
+
+    def get(self):
+        instance = self._instance
+        if instance is None:
+            with self._lock:
+                if self._instance is None:
+                    self._instance = self._factory()
+                instance = self._instance
+        return instance
+
+    def set(self, instance):
+        with self._lock:
+            self._instance = instance
+
+    def is_ready(self):
+        return self._instance is not None
+
+    def warm_up(self):
+        """Create the Database on a daemon thread so the GUI thread never waits on it."""
+        if self._instance is None:
+            threading.Thread(target=self.get, name="database-warmup", daemon=True).start()
+
+    def __getattr__(self, name):
+        return getattr(self.get(), name)
+
+
+database = LazyDatabase()
@@ -0,0 +1,16 @@
+# python -m app.database.shrink_photos --batch-size 50
+import argparse
+from app.database.database import database
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Downscale and recompress profile photos already in the database.")
+    parser.add_argument("--batch-size", type=int, default=50, help="Rows processed per transaction (default: 50).")
+    args = parser.parse_args(argv)
+
+    checked, shrunk, saved = database.shrink_profile_photos(batch_size=args.batch_size)
+    print(f"Done: {shrunk} of {checked} photos shrunk, {saved / 1024:.1f} KiB saved.")
+
+
+if __name__ == "__main__":
+    main()
@@ -10,6 +10,7 @@ from rich import status
 from app.assets import res_rc
 from app.database.database import Database, database
 from app.utils.util import (MyWindow, HoverShadow, setup_profile, load_font, setupComboBox, opac)
+from app.utils.ui_cache import load_ui
 
 
 class FillupWindow(MyWindow):
@@ -48,8 +49,8 @@ class FillupWindow(MyWindow):
 
     ########################################################### This setups the UI -------------------
     def setup_ui(self):
-        uic.loadUi(self.ui_path, self)
-        self.database = Database()
+        load_ui(self.ui_path, self)
+        self.database = database
         opac(self, self.label, 0.75)
 
     ########################################## STYLE AREA ###############################################
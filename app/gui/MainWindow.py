@@ -3,8 +3,9 @@ import sys
 from pathlib import Path
 from io import BytesIO
 from functools import partial
-from PyQt5 import QtWidgets, uic, QtCore
-from PyQt5.QtCore import (QPropertyAnimation, QPoint, QObject, QEvent, Qt, QTimer)
+from collections import Counter
+from PyQt5 import QtWidgets, uic, QtCore, sip
+from PyQt5.QtCore import (QPropertyAnimation, QPoint, QObject, QEvent, Qt, QTimer, pyqtSignal)
 from PyQt5.QtGui import (QFont, QFontDatabase, QColor, QIcon, QImage, QPixmap, QPainter, QBrush)
 from PyQt5.QtWidgets import QGraphicsDropShadowEffect, QMessageBox, QLabel, QFrame, QVBoxLayout
 import sqlite3
@@ -12,34 +13,214 @@ from app.assets import res_rc
 from app.utils.BarGraph import create_bar_chart_widget
 from app.database.database import Database, database
 from app.utils.util import (add_chart_to_dashboard, display_scholarships_admin, display_scholarships_util, MyWindow,
-                            HoverShadow, load_font, DesignShadow, get_rounded_stretched_pixmap)
+                            HoverShadow, load_font, DesignShadow)
 from app.utils.DonutChart import create_donut_chart_widget
 from app.utils.BarGraph2 import create_bar_chart_widget2
 from app.utils.util2 import (display_accepted_scholarships_admin, display_rejected_scholarships_admin, display_dropped_scholarships_admin)
+from app.utils.admin_list import application_store
+from app.utils.pixmap_cache import resource_pixmap, blob_key
+from app.utils.image_loader import image_loader
+from app.utils.ui_cache import load_ui
+from app.utils.refresh_scheduler import RefreshScheduler
+from app.utils.perf_hud import install_perf_hud
 
 
 class MainWindow(QtWidgets.QMainWindow):
-    def __init__(self, username=None, app_manager=None):
+    # stacks page indexes
+    PROFILE_PAGE, HOME_PAGE, DASHBOARD_PAGE, SCHOLAR_PAGE = 0, 1, 2, 3
+    # Idle time before the next likely page is built in the background
+    PREFETCH_DELAY_MS = 400
+    # Filter clicks closer together than this are charted once, for the last selection
+    FILTER_DEBOUNCE_MS = 120
+
+    # Tables written through the Database (any thread), delivered on the GUI thread
+    data_changed = pyqtSignal(object)
+
+    def __init__(self, username=None, app_manager=None, prewarm=False):
         super().__init__()
 
         # Basic props
-        self.username = username or "hrvycstddcll"
+        self.username = None
+        self.user_info = None
+        self.is_admin = False
         self.app_manager = app_manager
+        self._warm_steps = self.prewarm_steps()
+
+        # Heavy page content is built on first activation and rebuilt only when shown while dirty;
+        # see ensure_page() and _on_data_changed()
+        self._built_pages = set()
+        self._dirty_pages = set()
+        self._page_visits = Counter()
+        self._prefetch_timer = QTimer(self)
+        self._prefetch_timer.setSingleShot(True)
+        self._prefetch_timer.setInterval(self.PREFETCH_DELAY_MS)
+        self._prefetch_timer.timeout.connect(self._prefetch_next_page)
+
+        # Dashboard charts, one per slot for the life of the window; refreshes rebind their data
+        self._charts = {}
+        # Dashboard aggregates run off the GUI thread; bursts of refreshes are coalesced per view
+        self.refresh_scheduler = RefreshScheduler(parent=self)
+        self.data_changed.connect(self._on_data_changed)
+
+        # Pre-warm mode: the ApplicationManager runs the user-independent steps in idle slices
+        # and calls bind_user() after login
+        if prewarm:
+            return
 
+        self.finish_prewarm()
+        self.bind_user(username or "hrvycstddcll")
+
+    ########################################################### Pre-warm & user binding
+    def prewarm_steps(self):
+        """Build everything that does not depend on the logged-in user, one slice per yield."""
         # UI & resources
         self.setup_paths_and_icons()
         self.setup_ui()
+        yield
 
         # Styling / behavior
         self.setup_fonts()
+        yield
         self.setup_shadows()
         self.navigations()
+        self.setup_connections()
+        self.perf_hud = install_perf_hud(self)  # hidden; Ctrl+Shift+F12
+        yield
+        self._warm_static_pixmaps()
+        yield
 
-        # Load user info & initial data
-        self.setup_user_info()
+        # Initial data (charts are built with the dashboard page)
         database.refresh_scholar_data()
-        self._refresh_dashboard_chart()
-        self.setup_connections()
+        database.add_change_listener(self._on_database_write)
+
+    def run_prewarm_step(self):
+        """Run one pre-warm slice; returns False once construction is complete."""
+        try:
+            next(self._warm_steps)
+            return True
+        except StopIteration:
+            return False
+
+    def finish_prewarm(self):
+        for _ in self._warm_steps:
+            pass
+
+    def _warm_static_pixmaps(self):
+        for path in (":/images/bsutrans.png", ":/images/bcd.png", ":/images/altlogo.png", ":/images/educ.png",
+                     str(self.profilelabel_path)):
+            resource_pixmap(path)
+
+    def bind_user(self, username):
+        """Attach the logged-in user to a (pre-warmed) window."""
+        self.finish_prewarm()
+        if self.username:
+            self.unbind_user()
+
+        self.username = username
+        self.setup_role()
+        self.setup_user_info()
+        self.stacks.setCurrentIndex(self.HOME_PAGE)
+        self._prefetch_timer.start()
+
+    def unbind_user(self):
+        """Drop user-specific state so the window can be reused for the next login."""
+        if self.username is None:
+            return
+        self._prefetch_timer.stop()
+        self.refresh_scheduler.cancel()
+        self._built_pages.clear()
+        self._dirty_pages.clear()
+        self._page_visits.clear()
+        for btn in (self.applybtn, self.applybtn2, self.applybtn5, self.refreshbtn):
+            self.safe_disconnect(btn)
+        for label in (self.userProfile, self.userProfile2, self.userProfile3, self.bsuprofile):
+            label.clear()
+        for label in (self.userprofilename, self.cpy, self.useremail):
+            label.setText("")
+        self.reset_scholarship_form()
+        self.username = None
+        self.user_info = None
+
+    def is_reusable(self):
+        """False once the window's role-specific widgets are gone (e.g. destroyed with a parent); rebuild instead."""
+        return not (sip.isdeleted(self.AdminArea) or sip.isdeleted(self.StudentStatusArea))
+
+    ########################################################### Lazy pages
+    def page_builders(self):
+        """Heavy content per stacks page for the bound user, built by ensure_page()."""
+        builders = {self.DASHBOARD_PAGE: self._refresh_dashboard_chart}
+        if self.is_admin:
+            builders[self.PROFILE_PAGE] = self.accepted.click
+            builders[self.SCHOLAR_PAGE] = lambda: display_scholarships_admin(self.scholarscrolls, database)
+        else:
+            builders[self.PROFILE_PAGE] = lambda: display_scholarships_util(
+                username=self.username,
+                scroll_area=self.StudentStatusArea,
+                database=database
+            )
+        return builders
+
+    def page_dependencies(self):
+        """Database tables each page's content is derived from, for the bound user's role."""
+        dependencies = {self.DASHBOARD_PAGE: {"usersInfo", "scholarships"}}
+        if not self.is_admin:
+            dependencies[self.PROFILE_PAGE] = {"scholarships"}
+        # The admin lists are views over the ApplicationStore and follow its changes row by row
+        return dependencies
+
+    def ensure_page(self, index):
+        """Build a page's content if it is missing or dirty; returns True if it was built now."""
+        if self.username is None or (index in self._built_pages and index not in self._dirty_pages):
+            return False
+        builder = self.page_builders().get(index)
+        if builder is None:
+            return False
+        self._built_pages.add(index)
+        self._dirty_pages.discard(index)
+        builder()
+        return True
+
+    def mark_pages_dirty(self, pages=None):
+        """Mark built pages stale (all when None); the visible one is rebuilt now, the rest when next shown."""
+        self._dirty_pages |= self._built_pages if pages is None else set(pages) & self._built_pages
+        if self.isVisible():
+            self.ensure_page(self.stacks.currentIndex())
+
+    def invalidate_pages(self):
+        """Explicit refresh: the data may have changed outside this process, so every page is stale."""
+        self.mark_pages_dirty()
+        self._prefetch_timer.start()
+
+    def _on_database_write(self, tables):
+        if not sip.isdeleted(self):
+            self.data_changed.emit(tables)
+
+    def _on_data_changed(self, tables):
+        if self.username is None:
+            return
+        if "usersInfo" in tables:
+            self.setup_user_info()  # the header is on every page
+        self.mark_pages_dirty(page for page, dependencies in self.page_dependencies().items()
+                              if dependencies & tables)
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        # Pages marked dirty while the window was hidden
+        self.ensure_page(self.stacks.currentIndex())
+
+    def likely_next_pages(self):
+        """Unbuilt pages, most visited first, then in the usual order for the role."""
+        usual = ((self.SCHOLAR_PAGE, self.DASHBOARD_PAGE, self.PROFILE_PAGE) if self.is_admin
+                 else (self.PROFILE_PAGE, self.DASHBOARD_PAGE))
+        pending = [index for index in usual
+                   if index not in self._built_pages and index != self.stacks.currentIndex()]
+        return sorted(pending, key=lambda index: -self._page_visits[index])
+
+    def _prefetch_next_page(self):
+        # One page per idle period; the next user action (bind, tab change, refresh) re-arms the timer
+        pending = self.likely_next_pages()
+        if pending:
+            self.ensure_page(pending[0])
 
     ########################################################### Path & UI
     def setup_paths_and_icons(self):
@@ -59,35 +240,60 @@ class MainWindow(QtWidgets.QMainWindow):
 
     ########################################################### Setup UIs
     def setup_ui(self):
-        uic.loadUi(self.ui_path, self)
+        load_ui(self.ui_path, self)
         self.sidebar.setHidden(True)
         self.nextbtn_2.setDisabled(True)
         self.information.setDisabled(True)
         self.appform.setDisabled(True)
         self.finish.setDisabled(True)
 
-        ########################################################### Set up if Admin
-        if database.is_Admin(self.username):
-            display_scholarships_admin(self.scholarscrolls, database)
+        # The profile page hosts both roles: the admin lists (widget_76) and, beside them, a
+        # student's status cards. Each builder fills only its own area, so a window that showed
+        # a student can be rebound to an admin; setup_role() shows the area of the bound role.
+        self.StudentStatusArea = QtWidgets.QScrollArea(self.scroll_layout)
+        self.StudentStatusArea.setObjectName("StudentStatusArea")
+        self.StudentStatusArea.setWidgetResizable(True)
+        self.StudentStatusArea.setFrameShape(QFrame.NoFrame)
+        self.StudentStatusArea.setStyleSheet("#StudentStatusArea, #StudentStatusArea > QWidget > QWidget {background: transparent;}")
+        self.StudentStatusArea.setWidget(QtWidgets.QWidget())
+        self.StudentStatusArea.hide()
+        self.verticalLayout_31.addWidget(self.StudentStatusArea)
+
+    ########################################################### Set up if Admin
+    def setup_role(self):
+        self.is_admin = database.is_Admin(self.username)
+        if self.is_admin:
+            # A snapshot left over from an earlier admin session is brought up to date row by row
+            store = application_store(database)
+            if store.loaded:
+                store.reload()
             self.cpy.setHidden(True)
+            self.StudentStatusArea.setVisible(False)
+            self.widget_76.setVisible(True)
             self.scholar.setVisible(True)
             self.scholar2.setVisible(True)
             self.applybtn.clicked.connect(lambda: QMessageBox.information(self, "Admin", "You're an admin — you don't apply for scholarships."))
             self.applybtn2.clicked.connect(lambda: QMessageBox.information(self, "Admin", "You're an admin — you don't apply for scholarships."))
             self.applybtn5.clicked.connect(lambda: QMessageBox.information(self, "Admin", "You're an admin — you don't apply for scholarships."))
-            self.refreshbtn.clicked.connect(lambda : (self.setup_user_info(), self._refresh_dashboard_chart()))
+            self.refreshbtn.clicked.connect(self.refresh_admin_data)
 
         else:
             self.scholar.setVisible(False)
             self.scholar2.setVisible(False)
             self.cpy.setVisible(True)
+            self.widget_76.setVisible(False)
+            self.StudentStatusArea.setVisible(True)
             # Connect scholarship entry handlers (these only connect once)
             self.applybtn.clicked.connect(self.handleBSU)
             self.applybtn2.clicked.connect(self.handleBCD)
             self.applybtn5.clicked.connect(self.handleDSWD)
-            self.update_scholar_status()
             self.refreshbtn.clicked.connect(self.update_scholar_status)
 
+    def refresh_admin_data(self):
+        self.setup_user_info()
+        application_store(database).reload()
+        self.invalidate_pages()
+
     ########################################################### Styling
     def setup_fonts(self):
         """Register and set fonts on widgets (keeps your original mapping)"""
@@ -145,7 +351,6 @@ class MainWindow(QtWidgets.QMainWindow):
         self.about.clicked.connect(lambda: self.stacks.setCurrentIndex(5))
         self.about2.clicked.connect(lambda: self.stacks.setCurrentIndex(5))
         self.accepted.clicked.connect(lambda: display_accepted_scholarships_admin(self.AdminArea, database))
-        self.accepted.click()
         self.rejected.clicked.connect(lambda: display_rejected_scholarships_admin(self.AdminArea, database))
         self.dropped.clicked.connect(lambda: display_dropped_scholarships_admin(self.AdminArea, database))
 
@@ -213,8 +418,8 @@ class MainWindow(QtWidgets.QMainWindow):
 
     def _setup_dswd_scholarship(self):
         # Set images
-        self.label_11.setPixmap(QPixmap(":/images/educ.png"))
-        self.label_3.setPixmap(QPixmap(":/images/educ.png"))
+        self.label_11.setPixmap(resource_pixmap(":/images/educ.png"))
+        self.label_3.setPixmap(resource_pixmap(":/images/educ.png"))
 
         # Set scholarship name and header
         self.bsutext.setText("DSWD EDUCATIONAL ASSISTANCE")
@@ -260,8 +465,8 @@ class MainWindow(QtWidgets.QMainWindow):
         self.label_32.setText(submission_rules)
 
     def _setup_bcd_scholarship(self):
-        self.label_11.setPixmap(QPixmap(":/images/bcd.png"))
-        self.label_3.setPixmap(QPixmap(":/images/altlogo.png"))
+        self.label_11.setPixmap(resource_pixmap(":/images/bcd.png"))
+        self.label_3.setPixmap(resource_pixmap(":/images/altlogo.png"))
         self.bsutext.setText("BCD SCHOLARSHIP")
         self.label_12.setText("BIO CLICK DONE SCHOLARSHIP")
         self.label_13.setText("Empowering Your Future")
@@ -305,8 +510,8 @@ class MainWindow(QtWidgets.QMainWindow):
         self.label_32.setText(submission_rules)
 
     def _setup_bsu_scholarship(self):
-        self.label_11.setPixmap(QPixmap(":/images/bsutrans.png"))
-        self.label_3.setPixmap(QPixmap(":/images/bsutrans.png"))
+        self.label_11.setPixmap(resource_pixmap(":/images/bsutrans.png"))
+        self.label_3.setPixmap(resource_pixmap(":/images/bsutrans.png"))
         self.bsutext.setText("BATANGAS STATE UNIVERSITY FINANCIAL ASSISTANCE")
         self.label_12.setText("BATANGAS STATE UNIVERSITY FINANCIAL ASSISTANCE")
         self.label_13.setText("The National Engineering University")
@@ -362,9 +567,11 @@ class MainWindow(QtWidgets.QMainWindow):
         if self.user_info:
             profile_blob = self.user_info[5]
             if profile_blob:
-                img = QImage.fromData(profile_blob)
-                pixmap = QPixmap.fromImage(img)
-                self.bsuprofile.setPixmap(pixmap)
+                size = (self.bsuprofile.width(), self.bsuprofile.height())
+                image_loader.load(
+                    self.bsuprofile, profile_blob, size, self.bsuprofile.setPixmap,
+                    cache_key=(blob_key(profile_blob), size, "plain")
+                )
 
             self.bsufirst.setText(self.user_info[6] or "")
             self.bsulast.setText(self.user_info[7] or "")
@@ -472,9 +679,9 @@ class MainWindow(QtWidgets.QMainWindow):
                 return
 
             QMessageBox.information(self, "Success", f"{scholarship_name} application submitted successfully.")
+            # The new application marks the status list and the dashboard dirty (see _on_data_changed)
             self.stacks.setCurrentIndex(1)
             self.bsustacks.setCurrentIndex(0)
-            self.update_scholar_status()
 
             self.bsuconfirm.setEnabled(False)
             self.bsusubmit.setEnabled(False)
@@ -517,54 +724,73 @@ class MainWindow(QtWidgets.QMainWindow):
 
         profile_blob = self.user_info[5]
         if profile_blob:
+            key = blob_key(profile_blob)
             for label in [self.userProfile, self.userProfile2, self.userProfile3]:
                 w, h = label.width(), label.height()
-                pixmap = get_rounded_stretched_pixmap(profile_blob, w, h)
-                if pixmap:
-                    label.setPixmap(pixmap)
+                has_photo = label.pixmap() is not None and not label.pixmap().isNull()
+                image_loader.load(
+                    label, profile_blob, (w, h), label.setPixmap,
+                    aspect_mode=Qt.IgnoreAspectRatio, shape="circle",
+                    cache_key=(key, (w, h), "circle"),
+                    placeholder=None if has_photo else resource_pixmap(str(self.profilelabel_path), (w, h))
+                )
 
     ########################################################### Dashboard Area
     def update_scholar_status(self):
-        display_scholarships_util(
-            username=self.username,
-            scroll_area=self.ProfileScrollArea,
-            database=database
-        )
         self.setup_user_info()
-        self._refresh_dashboard_chart()
+        self.invalidate_pages()
 
     def _on_tab_changed(self, index):
-        DASHBOARD_TAB_INDEX = 2
-        if index == DASHBOARD_TAB_INDEX:
-            self._refresh_dashboard_chart()
+        self._page_visits[index] += 1
+        self.ensure_page(index)
+        self._prefetch_timer.start()
 
     def _refresh_dashboard_chart(self, new_data=None):
-        data, studentcount, bymunicipal = database.get_all_scholars()
-        data2, studentcount2, byprogram = database.get_scholarship_program_stats()
+        """Recompute the dashboard off the GUI thread; refresh clicks and tab changes in one turn run it once."""
+        self.refresh_scheduler.request("dashboard", self._query_dashboard, self._show_dashboard)
+
+    @staticmethod
+    def _query_dashboard():
+        return database.get_all_scholars(), database.get_scholarship_program_stats()
+
+    def _show_dashboard(self, result):
+        (data, studentcount, bymunicipal), (data2, studentcount2, byprogram) = result
         colors = ["#E74C3C", "#2ECC71"]
 
-        if not self.dashboard1.layout():
-            self.dashboard1.setLayout(QVBoxLayout())
         try:
-            barchart = create_bar_chart_widget(data=bymunicipal, title="MUNICIPALITY", colors=colors)
-            barchart2 = create_bar_chart_widget(data=byprogram, title="ACCOUNTS PER MUNICIPALITY")
-            add_chart_to_dashboard(self.dashboardBar3, barchart2)
-            add_chart_to_dashboard(self.dashboardBar, barchart)
+            self._show_chart(self.dashboardBar, partial(create_bar_chart_widget, colors=colors),
+                             bymunicipal, "MUNICIPALITY")
+            self._show_chart(self.dashboardBar3, create_bar_chart_widget, byprogram, "ACCOUNTS PER MUNICIPALITY")
 
             # keep your naming for the labels
             self.totalAcc.setText(str(studentcount[0]))
             self.totalScholars.setText(str(data.get('SCHOLAR', 0)))
             self.totalNonScholars.setText(str(data.get('NON-SCHOLAR', 0)))
-            all_scholars = create_donut_chart_widget(data=data, title="ALL SCHOLARS")
-            add_chart_to_dashboard(self.dashboard1, all_scholars)
+            self._show_chart(self.dashboard1, create_donut_chart_widget, data, "ALL SCHOLARS")
             self.interactive_dashboard()
 
 
         except Exception as e:
             print(f"Error during chart creation: {e}")
 
+    def _show_chart(self, container, create, data, title):
+        """Create the chart for a dashboard slot once; later calls rebind it to the new data."""
+        chart = self._charts.get(container)
+        if chart is None or sip.isdeleted(chart):
+            chart = self._charts[container] = create(data=data, title=title)
+            add_chart_to_dashboard(container, chart)
+        else:
+            chart.set_data(data, title=title)
+        return chart
+
     def interactive_dashboard(self):
-        data = None
+        """
+        Chart the selected scholarship/college filter.
+
+        Connected to every filter's toggled signal, so one click calls it twice; the selection
+        is read now, but only the last one of a burst is queried (off the GUI thread) and drawn.
+        """
+        query = None
         title = "DEFAULT DASHBOARD VIEW"
 
         SCHOLARSHIP_MAP = {
@@ -583,30 +809,33 @@ class MainWindow(QtWidgets.QMainWindow):
             button.setDisabled(is_snone_checked)
 
         if is_snone_checked:
-            data, _, _ = database.get_scholarship_program_stats()
+            query = lambda: database.get_scholarship_program_stats()[0]
             title = "INTERACTIVE DASHBOARD SCHOLARSHIPS"
 
         else:
             for sch_button, sch_name in SCHOLARSHIP_MAP.items():
                 if sch_button.isChecked():
-                    data = database.filter_by_scholarship(scholarship_name=sch_name)
+                    query = partial(database.filter_by_scholarship, scholarship_name=sch_name)
                     title = f"{sch_name} BY COLLEGE"
 
                     for col_button, col_name in COLLEGE_NAME_MAP.items():
                         if col_button.isChecked():
-                            data = database.filter_by_college(
-                                scholarship_name=sch_name,
-                                college_name=col_name
-                            )
+                            query = partial(database.filter_by_college,
+                                            scholarship_name=sch_name,
+                                            college_name=col_name)
                             title = f"{sch_name} PROGRAMS IN {col_name}"
                             break
                     break
 
-        if data is not None and data:
-            intGraph = create_bar_chart_widget2(data=data, title=title)
-            add_chart_to_dashboard(self.dashboardBar4, intGraph)
-        elif data == {}:
-            pass
+        if query is None:
+            self.refresh_scheduler.cancel("filter")
+            return
+        self.refresh_scheduler.request("filter", query, partial(self._show_filtered_chart, title=title),
+                                       delay_ms=self.FILTER_DEBOUNCE_MS)
+
+    def _show_filtered_chart(self, data, title):
+        if data:
+            self._show_chart(self.dashboardBar4, create_bar_chart_widget2, data, title)
 
     ########################################################### Refresh Updated Data
     def reset_scholarship_form(self):
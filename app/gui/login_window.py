@@ -8,6 +8,7 @@ import sqlite3
 from app.assets import res_rc
 from app.database.database import Database, database
 from app.utils.util import (MyWindow, HoverShadow, load_font)
+from app.utils.ui_cache import load_ui
 
 class LogandSign(MyWindow):
     def __init__(self, app_manager=None):
@@ -44,8 +45,8 @@ class LogandSign(MyWindow):
         #-------------------------------------------- This setups the UI -------------------
 
     def setup_ui(self):
-        uic.loadUi(self.ui_path, self)
-        self.database = Database()
+        load_ui(self.ui_path, self)
+        self.database = database
 
         self.viewpass.setIcon(self.icon1)
         self.viewpass2.setIcon(self.icon1)
@@ -3,11 +3,13 @@ import hashlib
 from pathlib import Path
 from PyQt5 import QtWidgets, uic, QtCore
 from PyQt5.QtCore import (QPropertyAnimation, QPoint, QObject, QEvent, Qt, QDate, QByteArray)
-from PyQt5.QtGui import (QFont, QFontDatabase, QColor, QPixmap, QRegion)
+from PyQt5.QtGui import (QFont, QFontDatabase, QColor, QPixmap, QRegion, QImageReader)
 from PyQt5.QtWidgets import (QGraphicsDropShadowEffect, QMessageBox, QComboBox, QFileDialog)
 import sqlite3
 from app.database.database import Database, database
 from app.utils.util import (HoverShadow, setup_profile, load_font, setupComboBox, opac)
+from app.utils.image_loader import image_loader
+from app.utils.ui_cache import load_ui
 
 
 class updateWindow(QtWidgets.QDialog):
@@ -65,7 +67,7 @@ class updateWindow(QtWidgets.QDialog):
     ########################################################################################## set-up uis ##############
     def setup_ui(self):
         try:
-            uic.loadUi(self.ui_path, self)
+            load_ui(self.ui_path, self)
             self.studentbtn.setDisabled(True)
             self.adminbtn.setDisabled(True)
 
@@ -97,15 +99,14 @@ class updateWindow(QtWidgets.QDialog):
             )
 
             if filename:
-                pixmap = QPixmap(filename)
-                if pixmap.isNull():
+                if not QImageReader(filename).canRead():
                     return
 
-                self.profilephoto.setPixmap(pixmap.scaled(
-                    self.profilephoto.size(),
-                    QtCore.Qt.KeepAspectRatio,
-                    QtCore.Qt.SmoothTransformation
-                ))
+                size = self.profilephoto.size()
+                image_loader.load(
+                    self.profilephoto, filename, (size.width(), size.height()), self.profilephoto.setPixmap,
+                    aspect_mode=QtCore.Qt.KeepAspectRatio
+                )
 
                 self.new_photo_path = filename
                 self.existing_photo_blob = None
@@ -259,13 +260,11 @@ class updateWindow(QtWidgets.QDialog):
 
             profile_blob = user_data[5]
             if profile_blob:
-                pixmap = QPixmap()
-                pixmap.loadFromData(profile_blob)
-                self.profilephoto.setPixmap(pixmap.scaled(
-                    self.profilephoto.size(),
-                    Qt.KeepAspectRatio,
-                    Qt.SmoothTransformation
-                ))
+                size = self.profilephoto.size()
+                image_loader.load(
+                    self.profilephoto, profile_blob, (size.width(), size.height()), self.profilephoto.setPixmap,
+                    aspect_mode=Qt.KeepAspectRatio
+                )
                 self.existing_photo_blob = profile_blob
                 self.new_photo_path = None
 
@@ -1,7 +1,12 @@
 import traceback
 from PyQt5.QtWidgets import QWidget, QVBoxLayout, QApplication
-from PyQt5.QtGui import QPainter, QColor, QFont, QPen, QPainterPath
-from PyQt5.QtCore import Qt, QTimer, QRectF, QRect
+from PyQt5.QtGui import QPainter, QColor, QFont, QPen, QPainterPath, QRegion
+from PyQt5.QtCore import Qt, QRectF, QRect
+from app.utils.chart_layers import StaticLayer
+from app.utils.hit_index import IntervalIndex
+from app.utils.chart_density import top_n_with_other, label_stride, draw_scroll_indicator
+from app.utils.animation_clock import AnimationClock, animation_clock
+from app.utils.render_profile import render_profile
 
 
 class AnimatedBarChartWidget(QWidget):
@@ -20,12 +25,20 @@ class AnimatedBarChartWidget(QWidget):
     def __init__(self, data, title="Bar Chart", colors=None, parent=None):
         super().__init__(parent)
 
-        self.data = data
+        self.source_data = data
         self.title = title
         self.custom_colors = colors  # ← NEW
         self.margin = 40
         self.bar_group_width_ratio = 0.8
 
+        # High-cardinality mode: below min_bar_px per bar, keep the top_n groups plus "Other"
+        # and scroll horizontally if they still do not fit
+        self.min_bar_px = 6
+        self.top_n = 30
+        self._dense = False
+        self._scrollable = False
+        self._scroll_x = 0
+
         self.bg_color = QColor(240, 240, 240)
         self.bar_radius = 5
         self.hover_color_diff = 30
@@ -39,18 +52,21 @@ class AnimatedBarChartWidget(QWidget):
         self.setAttribute(Qt.WA_TranslucentBackground)
 
         # Dynamic data processing
-        self.bar_types, self.colors, self.max_value = self._process_data(data)
+        self.data = self._fit_data(data)
+        self.bar_types, self.colors, self.max_value = self._process_data(self.data)
         self.n_types = len(self.bar_types)
 
-        # Animation
+        # Animation: bars move from _start_values to data as the scale goes 0 -> 1
         self._current_height_scale = 0.0
-        self.animation_timer = QTimer(self)
-        self.animation_timer.timeout.connect(self.update_animation)
-        self.animation_step = 0.05
-        self.start_animation()
+        self._start_values = {}
+        self.animation_duration = 900  # ms; driven by the shared animation clock
 
         self._hovered_bar_index = -1
         self._hovered_bar_type = None
+        self._hit_index, self._hit_key = None, None  # bar rects for hover, rebuilt on resize or new data
+
+        self._static_layer = StaticLayer(self, self._paint_static)
+        self.start_animation()
 
     def _process_data(self, data):
         unique_types = set()
@@ -77,19 +93,140 @@ class AnimatedBarChartWidget(QWidget):
 
         return bar_types, colors, max_val
 
+    def _fit_data(self, data):
+        """The groups to draw at the current width; sets the high-cardinality flags."""
+        n_types = len({bar_type for town_data in data.values() for bar_type in town_data}) or 1
+        plot_width = self.width() - 2 * self.margin
+        slots = max(1, int(plot_width * self.bar_group_width_ratio / (self.min_bar_px * n_types)))
+        self._dense = len(data) > slots
+        if self._dense:
+            data = top_n_with_other(data, self.top_n, lambda town_data: sum(town_data.values()), self._merge_groups)
+        self._scrollable = len(data) > slots
+        return data
+
+    @staticmethod
+    def _merge_groups(groups):
+        merged = {}
+        for town_data in groups:
+            for bar_type, value in town_data.items():
+                merged[bar_type] = merged.get(bar_type, 0) + value
+        return merged
+
+    def _refit(self):
+        """Re-run _fit_data after a resize; the chart switches modes without animating."""
+        data = self._fit_data(self.source_data)
+        if list(data) != list(self.data):
+            self.data = data
+            self.bar_types, self.colors, self.max_value = self._process_data(data)
+            self.n_types = len(self.bar_types)
+            self._static_layer.invalidate()
+            self._hit_index = None
+            self._hovered_bar_index, self._hovered_bar_type = -1, None
+        self._scroll_to(self._scroll_x if self._scrollable else 0)
+
+    def set_data(self, data, title=None):
+        """
+        Show new data on this chart, animating the bars from where they are now.
+
+        Args:
+            data (dict): {group: {bar type: value}}, as given to the constructor.
+            title (str): New title; None keeps the current one.
+        """
+        self._start_values = {
+            (town, bar_type): self._displayed_value(town, bar_type)
+            for town in self.data for bar_type in self.bar_types
+        }
+        self.source_data = data
+        self.data = self._fit_data(data)
+        if title is not None:
+            self.title = title
+        self.bar_types, self.colors, self.max_value = self._process_data(self.data)
+        self.n_types = len(self.bar_types)
+        self._static_layer.invalidate()
+        self._hit_index = None
+        self._hovered_bar_index = -1
+        self._hovered_bar_type = None
+        self._current_height_scale = 0.0
+        self._scroll_x = 0
+        animation_clock.start(self, self.update_animation)
+        self.update()
+
+    def _displayed_value(self, town, bar_type):
+        start = self._start_values.get((town, bar_type), 0)
+        target = self.data.get(town, {}).get(bar_type, 0)
+        return start + (target - start) * self._current_height_scale
+
     # ---------------- Animation ----------------
 
     def start_animation(self):
         self._current_height_scale = 0.0
-        self.animation_timer.start(45)
+        self._start_values = {}
+        animation_clock.start(self, self.update_animation)
+        self.update()
 
-    def update_animation(self):
+    def update_animation(self, elapsed_ms=AnimationClock.FRAME_MS):
+        """Advance the bars by one frame; returns False once they reached their values."""
         if self._current_height_scale < 1.0:
-            self._current_height_scale += self.animation_step
-            if self._current_height_scale >= 1.0:
-                self._current_height_scale = 1.0
-                self.animation_timer.stop()
-            self.update()
+            before = self._bar_tops()
+            self._current_height_scale = min(1.0, self._current_height_scale + elapsed_ms / self.animation_duration)
+            dirty = self._moved_bars_region(before)
+            if self._current_height_scale == 1.0:
+                dirty += self._hover_rect()
+            self.update(dirty)
+        return self._current_height_scale < 1.0
+
+    # ---------------- Dirty regions ----------------
+
+    def _bar_x(self, i, j, geometry):
+        chart_left, _, _, bar_group_unit, bar_width, _ = geometry
+        return chart_left + i * bar_group_unit + bar_group_unit / 2 - (bar_width * self.n_types) / 2 + j * bar_width
+
+    def _bar_tops(self):
+        """{(group index, type index): top of the bar as currently displayed}."""
+        if len(self.data) == 0 or self.n_types == 0:
+            return {}
+        geometry = self._chart_geometry()
+        y0, bar_height_unit = geometry[2], geometry[5]
+        towns = list(self.data)
+        return {
+            (i, j): y0 - self._displayed_value(towns[i], bar_type) * bar_height_unit
+            for i in self._visible_groups(self.margin, self.width() - self.margin, geometry)
+            for j, bar_type in enumerate(self.bar_types)
+        }
+
+    def _moved_bars_region(self, before):
+        """Strips between each bar's old and new top, including its rounded corners."""
+        region = QRegion()
+        if not before:
+            return region
+        geometry = self._chart_geometry()
+        bar_width = geometry[4]
+        for key, top in self._bar_tops().items():
+            old = before.get(key, top)
+            if old != top:
+                strip = QRectF(self._bar_x(*key, geometry), min(old, top), bar_width,
+                               abs(old - top) + self.bar_radius)
+                region += strip.adjusted(-1, -1, 1, 1).toAlignedRect()
+        return region
+
+    def _hover_rect(self):
+        """Area covered by the hovered bar's outline and tooltip (empty when nothing is hovered)."""
+        if self._hovered_bar_index < 0 or self._hovered_bar_type not in self.bar_types:
+            return QRect()
+        geometry = self._chart_geometry()
+        y0, bar_width, bar_height_unit = geometry[2], geometry[4], geometry[5]
+        town = list(self.data)[self._hovered_bar_index]
+        x = self._bar_x(self._hovered_bar_index, self.bar_types.index(self._hovered_bar_type), geometry)
+        h = self._displayed_value(town, self._hovered_bar_type) * bar_height_unit
+        bar = QRectF(x, y0 - h, bar_width, h).adjusted(-1, -1, 1, 1).toAlignedRect()
+        return bar.united(self._tooltip_rect(x, y0 - h, bar_width))
+
+    def _set_hovered(self, index, bar_type):
+        if (index, bar_type) == (self._hovered_bar_index, self._hovered_bar_type):
+            return
+        dirty = QRegion(self._hover_rect())
+        self._hovered_bar_index, self._hovered_bar_type = index, bar_type
+        self.update(dirty + self._hover_rect())
 
     # ---------------- Hover color ----------------
 
@@ -104,86 +241,158 @@ class AnimatedBarChartWidget(QWidget):
 
     # ---------------- Painting ----------------
 
-    def paintEvent(self, event):
-        try:
-            painter = QPainter(self)
-            painter.setRenderHints(QPainter.Antialiasing | QPainter.TextAntialiasing)
-            W, H = self.width(), self.height()
+    def _chart_geometry(self):
+        """
+        (chart_left, chart_right, y0, bar_group_unit, bar_width, bar_height_unit) for the current size.
+
+        When the groups scroll, chart_left is where the first group starts (left of the plot
+        area once scrolled) and every group gets the minimum width.
+        """
+        chart_top = self.margin + 40
+        chart_bottom = self.height() - self.margin
+        chart_left = self.margin
+        chart_right = self.width() - self.margin
+        if self._scrollable:
+            bar_group_unit = self.min_bar_px * self.n_types / self.bar_group_width_ratio
+            chart_left -= self._scroll_x
+        else:
+            bar_group_unit = (chart_right - chart_left) / len(self.data)
+        bar_width = (bar_group_unit * self.bar_group_width_ratio) / self.n_types
+        bar_height_unit = (chart_bottom - chart_top) / self.max_value
+        return chart_left, chart_right, chart_bottom, bar_group_unit, bar_width, bar_height_unit
+
+    def _visible_groups(self, left, right, geometry):
+        """Indices of the groups that overlap the x range [left, right]."""
+        chart_left, bar_group_unit = geometry[0], geometry[3]
+        first = max(0, int((left - chart_left) // bar_group_unit))
+        last = min(len(self.data), int((right - chart_left) // bar_group_unit) + 1)
+        return range(first, last)
+
+    def _paint_static(self, painter):
+        """Title, grid, y-axis labels, legend and group labels; cached by self._static_layer."""
+        W = self.width()
+
+        # Title
+        painter.setFont(self.title_font)
+        painter.setPen(QColor("#333"))
+        painter.drawText(0, 10, W, self.margin, Qt.AlignCenter, self.title)
+
+        if len(self.data) == 0 or self.n_types == 0:
+            return
 
-            # Title
-            painter.setFont(self.title_font)
-            painter.setPen(QColor("#333"))
-            painter.drawText(0, 10, W, self.margin, Qt.AlignCenter, self.title)
+        geometry = self._chart_geometry()
+        chart_left, chart_right, y0, bar_group_unit, bar_width, bar_height_unit = geometry
+        plot_left = self.margin
+        max_value = self.max_value
+
+        # Y grid
+        painter.setPen(QPen(QColor(200, 200, 200), 1))
+        painter.setFont(self.font)
+        y_label_count = 5
+        step = max(1, max_value // y_label_count)
+
+        for i in range(0, max_value + step, step):
+            y = y0 - i * bar_height_unit
+            painter.drawLine(plot_left, int(y), chart_right, int(y))
+            painter.setPen(QColor("#555"))
+            painter.drawText(
+                0, int(y) - 7, self.margin - 10, 15,
+                Qt.AlignRight | Qt.AlignVCenter, str(i)
+            )
+            painter.setPen(QPen(QColor(200, 200, 200), 1))
 
-            municipalities = list(self.data.keys())
-            n_groups = len(municipalities)
+        # Legend
+        legend_x = plot_left
+        legend_y = self.margin + 5
+        current_x = legend_x
 
-            if n_groups == 0 or self.n_types == 0:
-                return
+        painter.setFont(self.legend_font)
+        metrics = painter.fontMetrics()
 
-            # Geometry
-            chart_top = self.margin + 40
-            chart_bottom = H - self.margin
-            chart_left = self.margin
-            chart_right = W - self.margin
-            chart_height = chart_bottom - chart_top
-            chart_width = chart_right - chart_left
-
-            max_value = self.max_value
-            bar_group_unit = chart_width / n_groups
-            bar_width = (bar_group_unit * self.bar_group_width_ratio) / self.n_types
-            bar_height_unit = chart_height / max_value
-            y0 = chart_bottom
-
-            # Y grid
-            painter.setPen(QPen(QColor(200, 200, 200), 1))
-            painter.setFont(self.font)
-            y_label_count = 5
-            step = max(1, max_value // y_label_count)
-
-            for i in range(0, max_value + step, step):
-                y = y0 - i * bar_height_unit
-                painter.drawLine(chart_left, int(y), chart_right, int(y))
-                painter.setPen(QColor("#555"))
-                painter.drawText(
-                    0, int(y) - 7, self.margin - 10, 15,
-                    Qt.AlignRight | Qt.AlignVCenter, str(i)
-                )
-                painter.setPen(QPen(QColor(200, 200, 200), 1))
+        for bar_type in self.bar_types:
+            text_display = bar_type.replace("_", " ").title()
+            text_width = metrics.horizontalAdvance(text_display)
+            required_width = 10 + 5 + text_width + 15
 
-            # Legend
-            legend_x = chart_left
-            legend_y = self.margin + 5
-            current_x = legend_x
+            if current_x + required_width > chart_right:
+                break
 
-            painter.setFont(self.legend_font)
-            metrics = painter.fontMetrics()
+            self._draw_legend_item(
+                painter, current_x, legend_y,
+                text_display, required_width, self.colors[bar_type]
+            )
 
-            for bar_type in self.bar_types:
-                text_display = bar_type.replace("_", " ").title()
-                text_width = metrics.horizontalAdvance(text_display)
-                required_width = 10 + 5 + text_width + 15
+            current_x += required_width
 
-                if current_x + required_width > chart_right:
-                    break
+        # Group labels (drawn in the legend font, as before)
+        painter.setPen(QColor("#555"))
+        if self._dense:
+            self._paint_dense_labels(painter, geometry)
+            return
+        for i, town in enumerate(self.data):
+            x_group_center = chart_left + i * bar_group_unit + bar_group_unit / 2
+            x_start = x_group_center - (bar_width * self.n_types) / 2
+            painter.drawText(
+                int(x_start), y0 + 15,
+                int(bar_width * self.n_types), 20,
+                Qt.AlignCenter, town
+            )
 
-                self._draw_legend_item(
-                    painter, current_x, legend_y,
-                    text_display, required_width, self.colors[bar_type]
-                )
+    def _paint_dense_labels(self, painter, geometry):
+        """Every k-th visible group label, elided to its share of the axis, and the scroll position."""
+        chart_left, chart_right, y0, bar_group_unit, _, _ = geometry
+        metrics = painter.fontMetrics()
+        towns = list(self.data)
+        stride = label_stride(metrics, towns, bar_group_unit)
+        label_width = int(stride * bar_group_unit)
+
+        painter.save()
+        if self._scrollable:
+            painter.setClipRect(QRect(self.margin, 0, chart_right - self.margin, self.height()))
+        for i in self._visible_groups(self.margin - label_width, chart_right + label_width, geometry):
+            if i % stride:
+                continue
+            x_group_center = chart_left + i * bar_group_unit + bar_group_unit / 2
+            width = label_width
+            if not self._scrollable:  # end labels may use the margins but stay centered under their group
+                width = int(min(width, 2 * x_group_center, 2 * (self.width() - x_group_center)))
+            text = metrics.elidedText(str(towns[i]), Qt.ElideRight, width - 4)
+            painter.drawText(int(x_group_center - width / 2), y0 + 15, width, 20, Qt.AlignCenter, text)
+        painter.restore()
+
+        if self._scrollable:
+            draw_scroll_indicator(painter, self.margin, self.height() - 8, chart_right - self.margin,
+                                  self._scroll_x, bar_group_unit * len(towns))
 
-                current_x += required_width
+    def paintEvent(self, event):
+        try:
+            painter = QPainter(self)
+            painter.setRenderHints(render_profile.render_hints())
+            self._static_layer.draw(painter)
 
-            # Bars
-            painter.setPen(Qt.NoPen)
+            if len(self.data) == 0 or self.n_types == 0:
+                return
 
-            for i, town in enumerate(municipalities):
+            geometry = self._chart_geometry()
+            chart_left, chart_right, y0, bar_group_unit, bar_width, bar_height_unit = geometry
+            dirty = event.rect()
+
+            # Bars (only the groups in the repainted area)
+            painter.setPen(Qt.NoPen)
+            left, right = dirty.left() - 1, dirty.right() + 1
+            if self._scrollable:
+                painter.setClipRect(QRect(self.margin, 0, chart_right - self.margin, self.height()))
+                left, right = max(left, self.margin), min(right, chart_right)
+            towns = list(self.data)
+
+            for i in self._visible_groups(left, right, geometry):
+                town = towns[i]
                 x_group_center = chart_left + i * bar_group_unit + bar_group_unit / 2
                 x_start = x_group_center - (bar_width * self.n_types) / 2
 
                 for j, bar_type in enumerate(self.bar_types):
                     bar_val = self.data[town].get(bar_type, 0)
-                    bar_h = bar_val * bar_height_unit * self._current_height_scale
+                    bar_h = self._displayed_value(town, bar_type) * bar_height_unit
                     x_bar = x_start + j * bar_width
 
                     hovered = (
@@ -199,20 +408,18 @@ class AnimatedBarChartWidget(QWidget):
                     painter.setBrush(color)
                     self._draw_rounded_bar(painter, x_bar, y0, bar_width, bar_h, hovered)
 
-                    if hovered and self._current_height_scale == 1.0:
-                        self._draw_tooltip_safe(
-                            painter,
-                            x_bar,
-                            y0 - bar_h,
-                            bar_width,
-                            bar_val
-                        )
-
-                painter.setPen(QColor("#555"))
-                painter.drawText(
-                    int(x_start), y0 + 15,
-                    int(bar_width * self.n_types), 20,
-                    Qt.AlignCenter, town
+            # Tooltip last, above every bar and outside the scroll clip
+            painter.setClipping(False)
+            if self._hovered_bar_type in self.bar_types and self._current_height_scale == 1.0:
+                town = towns[self._hovered_bar_index]
+                x_bar = self._bar_x(self._hovered_bar_index, self.bar_types.index(self._hovered_bar_type), geometry)
+                bar_h = self._displayed_value(town, self._hovered_bar_type) * bar_height_unit
+                self._draw_tooltip_safe(
+                    painter,
+                    x_bar,
+                    y0 - bar_h,
+                    bar_width,
+                    self.data[town].get(self._hovered_bar_type, 0)
                 )
 
         except Exception as e:
@@ -256,26 +463,27 @@ class AnimatedBarChartWidget(QWidget):
 
     # ---------------- Tooltip ----------------
 
-    def _draw_tooltip_safe(self, painter, x, y, w, value):
-        try:
-            tooltip_w, tooltip_h = 50, 25
+    def _tooltip_rect(self, x, y, w):
+        tooltip_w, tooltip_h = 50, 25
 
-            tx = x + w / 2 - tooltip_w / 2
-            ty = y - tooltip_h - 5
+        tx = x + w / 2 - tooltip_w / 2
+        ty = y - tooltip_h - 5
 
-            tx = max(5.0, min(tx, self.width() - tooltip_w - 5.0))
-            ty = max(5.0, ty)
+        tx = max(5.0, min(tx, self.width() - tooltip_w - 5.0))
+        ty = max(5.0, ty)
+        return QRect(int(tx), int(ty), tooltip_w, tooltip_h)
+
+    def _draw_tooltip_safe(self, painter, x, y, w, value):
+        try:
+            rect = self._tooltip_rect(x, y, w)
 
             painter.setPen(Qt.NoPen)
             painter.setBrush(QColor(0, 0, 0, 200))
-            painter.drawRoundedRect(int(tx), int(ty), tooltip_w, tooltip_h, 5, 5)
+            painter.drawRoundedRect(rect, 5, 5)
 
             painter.setPen(Qt.white)
             painter.setFont(self.font)
-            painter.drawText(
-                int(tx), int(ty), tooltip_w, tooltip_h,
-                Qt.AlignCenter, str(value)
-            )
+            painter.drawText(rect, Qt.AlignCenter, str(value))
         except:
             pass
 
@@ -284,61 +492,75 @@ class AnimatedBarChartWidget(QWidget):
     def _get_bar_rect(self, x, y0, w, h):
         return QRect(int(x), int(y0 - h), int(w), int(h))
 
+    def _bar_hit_index(self):
+        """Full-height bar rects indexed by x, for the current size and data."""
+        key = (self.width(), self.height(), self._scroll_x)
+        if self._hit_index is None or self._hit_key != key:
+            geometry = self._chart_geometry()
+            y0, bar_width, bar_height_unit = geometry[2], geometry[4], geometry[5]
+            intervals = []
+            for i, town in enumerate(self.data):
+                for j, bar_type in enumerate(self.bar_types):
+                    bar_h = self.data[town].get(bar_type, 0) * bar_height_unit
+                    rect = self._get_bar_rect(self._bar_x(i, j, geometry), y0, bar_width, bar_h)
+                    intervals.append((rect.left(), rect.right(), (i, bar_type, rect)))
+            self._hit_index, self._hit_key = IntervalIndex(intervals), key
+        return self._hit_index
+
     def mouseMoveEvent(self, event):
         if self._current_height_scale < 1.0 or self.n_types == 0:
             return
 
         try:
             pos = event.pos()
-            municipalities = list(self.data.keys())
-            n_groups = len(municipalities)
-
-            chart_top = self.margin + 40
-            chart_bottom = self.height() - self.margin
-            chart_left = self.margin
-            chart_right = self.width() - self.margin
-            chart_height = chart_bottom - chart_top
-            chart_width = chart_right - chart_left
-
-            max_value = self.max_value
-            bar_group_unit = chart_width / n_groups
-            bar_width = (bar_group_unit * self.bar_group_width_ratio) / self.n_types
-            bar_height_unit = chart_height / max_value
-            y0 = chart_bottom
-
             new_index, new_type = -1, None
+            if self._scrollable and not self.margin <= pos.x() <= self.width() - self.margin:
+                self._set_hovered(new_index, new_type)  # bars scrolled under the margins are hidden
+                return
 
-            for i, town in enumerate(municipalities):
-                x_center = chart_left + i * bar_group_unit + bar_group_unit / 2
-                x_start = x_center - (bar_width * self.n_types) / 2
-
-                for j, bar_type in enumerate(self.bar_types):
-                    bar_val = self.data[town].get(bar_type, 0)
-                    bar_h = bar_val * bar_height_unit
-                    x_bar = x_start + j * bar_width
-
-                    rect = self._get_bar_rect(x_bar, y0, bar_width, bar_h)
-
-                    if rect.contains(pos):
-                        new_index, new_type = i, bar_type
-                        break
-
-                if new_index != -1:
+            for i, bar_type, rect in self._bar_hit_index().candidates(pos.x()):
+                if rect.contains(pos):
+                    new_index, new_type = i, bar_type
                     break
 
-            if (new_index, new_type) != (self._hovered_bar_index, self._hovered_bar_type):
-                self._hovered_bar_index = new_index
-                self._hovered_bar_type = new_type
-                self.update()
+            self._set_hovered(new_index, new_type)
 
         except Exception as e:
             print("Hover error:", e)
             traceback.print_exc()
 
     def leaveEvent(self, event):
-        self._hovered_bar_index = -1
-        self._hovered_bar_type = None
+        self._set_hovered(-1, None)
+
+    # ---------------- Scrolling ----------------
+
+    def _scroll_to(self, x):
+        """Clamp and apply the horizontal scroll offset; returns False if it did not move."""
+        if self._scrollable and self.data and self.n_types:
+            geometry = self._chart_geometry()
+            content_width = geometry[3] * len(self.data)
+            x = int(max(0, min(x, content_width - (geometry[1] - self.margin))))
+        else:
+            x = 0
+        if x == self._scroll_x:
+            return False
+        self._scroll_x = x
+        self._hovered_bar_index, self._hovered_bar_type = -1, None
+        self._static_layer.invalidate()
         self.update()
+        return True
+
+    def wheelEvent(self, event):
+        """Scroll the groups sideways; the parent scrolls instead once the chart cannot move."""
+        delta = event.angleDelta().x() or event.angleDelta().y()
+        if self._scroll_to(self._scroll_x - delta):
+            event.accept()
+        else:
+            event.ignore()
+
+    def resizeEvent(self, event):
+        self._refit()
+        super().resizeEvent(event)
 
 
 # ---------------- Utility ----------------
@@ -1,7 +1,12 @@
 import traceback
 from PyQt5.QtWidgets import QWidget, QVBoxLayout, QApplication
-from PyQt5.QtGui import QPainter, QColor, QFont, QPen, QPainterPath
-from PyQt5.QtCore import Qt, QTimer, QRectF, QRect
+from PyQt5.QtGui import QPainter, QColor, QFont, QPen, QPainterPath, QRegion
+from PyQt5.QtCore import Qt, QRectF, QRect
+from app.utils.chart_layers import StaticLayer
+from app.utils.hit_index import IntervalIndex
+from app.utils.chart_density import top_n_with_other, label_stride, draw_scroll_indicator
+from app.utils.animation_clock import AnimationClock, animation_clock
+from app.utils.render_profile import render_profile
 
 
 class SingleSeriesBarChartWidget(QWidget):
@@ -14,11 +19,20 @@ class SingleSeriesBarChartWidget(QWidget):
 
     def __init__(self, data: dict, title="Bar Chart", parent=None):
         super().__init__(parent)
-        self.data = data
+        self.source_data = data
         self.title = title
         self.margin = 40
         self.bar_group_width_ratio = 0.6
 
+        # High-cardinality mode: below min_bar_px per bar, keep the top_n categories plus "Other"
+        # and scroll horizontally if they still do not fit
+        self.min_bar_px = 6
+        self.top_n = 30
+        self._dense = False
+        self._scrollable = False
+        self._scroll_x = 0
+        self.data = self._fit_data(data)
+
         # --- Color Palette (New) ---
         self.color_palette = [
             QColor("#2ECC71"),  # Emerald Green
@@ -44,28 +58,128 @@ class SingleSeriesBarChartWidget(QWidget):
         self.setMouseTracking(True)
         self.setAttribute(Qt.WA_TranslucentBackground)
 
-        # Animation
+        # Animation: bars move from _start_values to data as the scale goes 0 -> 1
         self._current_height_scale = 0.0
-        self.animation_timer = QTimer(self)
-        self.animation_timer.timeout.connect(self.update_animation)
-        self.animation_step = 0.05
-        self.start_animation()
+        self._start_values = {}
+        self.animation_duration = 900  # ms; driven by the shared animation clock
 
         # Hover
         self._hovered_bar_index = -1
+        self._hit_index, self._hit_key = None, None  # bar rects for hover, rebuilt on resize or new data
+
+        self._static_layer = StaticLayer(self, self._paint_static)
+        self.start_animation()
+
+    # --- Data ---
+    def set_data(self, data: dict, title=None):
+        """
+        Show new data on this chart, animating the bars from where they are now.
+
+        Args:
+            data (dict): {category: value}, as given to the constructor.
+            title (str): New title; None keeps the current one.
+        """
+        self._start_values = {category: self._displayed_value(category) for category in self.data}
+        self.source_data = data
+        self.data = self._fit_data(data)
+        if title is not None:
+            self.title = title
+        self._static_layer.invalidate()
+        self._hit_index = None
+        self._hovered_bar_index = -1
+        self._current_height_scale = 0.0
+        self._scroll_x = 0
+        animation_clock.start(self, self.update_animation)
+        self.update()
+
+    # The categories to draw at the current width; sets the high-cardinality flags
+    def _fit_data(self, data):
+        plot_width = self.width() - 2 * self.margin
+        slots = max(1, int(plot_width * self.bar_group_width_ratio / self.min_bar_px))
+        self._dense = len(data) > slots
+        if self._dense:
+            data = top_n_with_other(data, self.top_n, lambda value: value, sum)
+        self._scrollable = len(data) > slots
+        return data
+
+    # Re-run _fit_data after a resize; the chart switches modes without animating
+    def _refit(self):
+        data = self._fit_data(self.source_data)
+        if list(data) != list(self.data):
+            self.data = data
+            self._static_layer.invalidate()
+            self._hit_index = None
+            self._hovered_bar_index = -1
+        self._scroll_to(self._scroll_x if self._scrollable else 0)
+
+    def _displayed_value(self, category):
+        start = self._start_values.get(category, 0)
+        return start + (self.data.get(category, 0) - start) * self._current_height_scale
 
     # --- Animation ---
     def start_animation(self):
         self._current_height_scale = 0.0
-        self.animation_timer.start(45)
+        self._start_values = {}
+        animation_clock.start(self, self.update_animation)
+        self.update()
 
-    def update_animation(self):
+    def update_animation(self, elapsed_ms=AnimationClock.FRAME_MS):
+        """Advance the bars by one frame; returns False once they reached their values."""
         if self._current_height_scale < 1.0:
-            self._current_height_scale += self.animation_step
-            if self._current_height_scale >= 1.0:
-                self._current_height_scale = 1.0
-                self.animation_timer.stop()
-            self.update()
+            before = self._bar_tops()
+            self._current_height_scale = min(1.0, self._current_height_scale + elapsed_ms / self.animation_duration)
+            dirty = self._moved_bars_region(before)
+            if self._current_height_scale == 1.0:
+                dirty += self._hover_rect()
+            self.update(dirty)
+        return self._current_height_scale < 1.0
+
+    # --- Dirty regions ---
+    def _bar_x(self, i, geometry):
+        chart_left, _, _, bar_group_unit, bar_width, _ = geometry
+        return chart_left + i * bar_group_unit + bar_group_unit / 2 - bar_width / 2
+
+    # {bar index: top of the bar as currently displayed}
+    def _bar_tops(self):
+        if len(self.data) == 0:
+            return {}
+        geometry = self._chart_geometry()
+        y0, bar_height_unit = geometry[2], geometry[5]
+        colleges = list(self.data)
+        return {i: y0 - self._displayed_value(colleges[i]) * bar_height_unit
+                for i in self._visible_bars(self.margin, self.width() - self.margin, geometry)}
+
+    # Strips between each bar's old and new top, including its rounded corners
+    def _moved_bars_region(self, before):
+        region = QRegion()
+        if not before:
+            return region
+        geometry = self._chart_geometry()
+        bar_width = geometry[4]
+        for i, top in self._bar_tops().items():
+            old = before.get(i, top)
+            if old != top:
+                strip = QRectF(self._bar_x(i, geometry), min(old, top), bar_width, abs(old - top) + self.bar_radius)
+                region += strip.adjusted(-1, -1, 1, 1).toAlignedRect()
+        return region
+
+    # Area covered by the hovered bar's outline and tooltip (empty when nothing is hovered)
+    def _hover_rect(self):
+        if not 0 <= self._hovered_bar_index < len(self.data):
+            return QRect()
+        geometry = self._chart_geometry()
+        y0, bar_width, bar_height_unit = geometry[2], geometry[4], geometry[5]
+        x = self._bar_x(self._hovered_bar_index, geometry)
+        h = self._displayed_value(list(self.data)[self._hovered_bar_index]) * bar_height_unit
+        bar = QRectF(x, y0 - h, bar_width, h).adjusted(-1, -1, 1, 1).toAlignedRect()
+        return bar.united(self._tooltip_rect(x, y0 - h, bar_width))
+
+    def _set_hovered(self, index):
+        if index == self._hovered_bar_index:
+            return
+        dirty = QRegion(self._hover_rect())
+        self._hovered_bar_index = index
+        self.update(dirty + self._hover_rect())
 
     # --- Hover color ---
     # Calculates a darker version of the input color
@@ -77,60 +191,131 @@ class SingleSeriesBarChartWidget(QWidget):
                       a)
 
     # --- Painting ---
+    def _chart_geometry(self):
+        """
+        (chart_left, chart_right, y0, bar_group_unit, bar_width, bar_height_unit) for the current size.
+
+        When the bars scroll, chart_left is where the first bar's unit starts (left of the plot
+        area once scrolled) and every bar gets the minimum width.
+        """
+        chart_top = self.margin + 40
+        chart_bottom = self.height() - self.margin
+        chart_left = self.margin
+        chart_right = self.width() - self.margin
+
+        # Calculate max value for scaling
+        max_value = max(self.data.values()) or 1
+        max_value_buffered = max_value * 1.1
+
+        if self._scrollable:
+            bar_group_unit = self.min_bar_px / self.bar_group_width_ratio
+            chart_left -= self._scroll_x
+        else:
+            bar_group_unit = (chart_right - chart_left) / len(self.data)
+        bar_width = bar_group_unit * self.bar_group_width_ratio
+        bar_height_unit = (chart_bottom - chart_top) / max_value_buffered
+        return chart_left, chart_right, chart_bottom, bar_group_unit, bar_width, bar_height_unit
+
+    # Indices of the bars whose unit overlaps the x range [left, right]
+    def _visible_bars(self, left, right, geometry):
+        chart_left, bar_group_unit = geometry[0], geometry[3]
+        first = max(0, int((left - chart_left) // bar_group_unit))
+        last = min(len(self.data), int((right - chart_left) // bar_group_unit) + 1)
+        return range(first, last)
+
+    # Title, grid, y-axis labels and category labels; cached by self._static_layer
+    def _paint_static(self, painter):
+        W = self.width()
+
+        # Title
+        painter.setFont(self.title_font)
+        painter.setPen(QColor("#333"))
+        painter.drawText(0, 10, W, self.margin, Qt.AlignCenter, self.title)
+
+        if len(self.data) == 0:
+            return
+
+        geometry = self._chart_geometry()
+        chart_left, chart_right, y0, bar_group_unit, bar_width, bar_height_unit = geometry
+        max_value = max(self.data.values()) or 1
+
+        # Y-Axis grid lines & labels
+        painter.setPen(QPen(QColor(200, 200, 200), 1))
+        painter.setFont(self.font)
+        y_label_count = 5
+        step = max(1, int(max_value / y_label_count))
+        for i in range(0, max_value + step, step):
+            y = y0 - i * bar_height_unit
+            painter.drawLine(self.margin, int(y), chart_right, int(y))
+            painter.setPen(QColor("#555"))
+            painter.drawText(0, int(y) - 7, self.margin - 10, 15,
+                             Qt.AlignRight | Qt.AlignVCenter, str(i))
+            painter.setPen(QPen(QColor(200, 200, 200), 1))
+
+        # X-Axis labels (Centered under each bar)
+        painter.setPen(QColor("#555"))
+        if self._dense:
+            self._paint_dense_labels(painter, geometry)
+            return
+        for i, college in enumerate(self.data):
+            x_group_center = chart_left + i * bar_group_unit + bar_group_unit / 2
+            x0 = x_group_center - bar_width / 2
+            painter.drawText(int(x0), y0 + 15, int(bar_width), 20, Qt.AlignCenter, college)
+
+    # Every k-th visible label, elided to its share of the axis, and the scroll position
+    def _paint_dense_labels(self, painter, geometry):
+        chart_left, chart_right, y0, bar_group_unit, _, _ = geometry
+        metrics = painter.fontMetrics()
+        colleges = list(self.data)
+        stride = label_stride(metrics, colleges, bar_group_unit)
+        label_width = int(stride * bar_group_unit)
+
+        painter.save()
+        if self._scrollable:
+            painter.setClipRect(QRect(self.margin, 0, chart_right - self.margin, self.height()))
+        for i in self._visible_bars(self.margin - label_width, chart_right + label_width, geometry):
+            if i % stride:
+                continue
+            x_group_center = chart_left + i * bar_group_unit + bar_group_unit / 2
+            width = label_width
+            if not self._scrollable:  # end labels may use the margins but stay centered under their group
+                width = int(min(width, 2 * x_group_center, 2 * (self.width() - x_group_center)))
+            text = metrics.elidedText(str(colleges[i]), Qt.ElideRight, width - 4)
+            painter.drawText(int(x_group_center - width / 2), y0 + 15, width, 20, Qt.AlignCenter, text)
+        painter.restore()
+
+        if self._scrollable:
+            draw_scroll_indicator(painter, self.margin, self.height() - 8, chart_right - self.margin,
+                                  self._scroll_x, bar_group_unit * len(colleges))
+
     def paintEvent(self, event):
         try:
             painter = QPainter(self)
-            painter.setRenderHints(QPainter.Antialiasing | QPainter.TextAntialiasing)
-            W, H = self.width(), self.height()
-
-            # Title
-            painter.setFont(self.title_font)
-            painter.setPen(QColor("#333"))
-            painter.drawText(0, 10, W, self.margin, Qt.AlignCenter, self.title)
+            painter.setRenderHints(render_profile.render_hints())
+            self._static_layer.draw(painter)
 
-            categories = list(self.data.keys())
-            n_bars = len(categories)
-            if n_bars == 0:
+            if len(self.data) == 0:
                 return
 
-            chart_top = self.margin + 40
-            chart_bottom = H - self.margin
-            chart_left = self.margin
-            chart_right = W - self.margin
-            chart_height = chart_bottom - chart_top
-            chart_width = chart_right - chart_left
+            geometry = self._chart_geometry()
+            chart_left, chart_right, y0, bar_group_unit, bar_width, bar_height_unit = geometry
+            dirty = event.rect()
 
-            # Calculate max value for scaling
-            max_value = max(self.data.values()) or 1
-            max_value_buffered = max_value * 1.1
-
-            bar_group_unit = chart_width / n_bars
-            bar_width = bar_group_unit * self.bar_group_width_ratio
-            bar_height_unit = chart_height / max_value_buffered
-            y0 = chart_bottom
-
-            # Y-Axis grid lines & labels
-            painter.setPen(QPen(QColor(200, 200, 200), 1))
-            painter.setFont(self.font)
-            y_label_count = 5
-            step = max(1, int(max_value / y_label_count))
-            for i in range(0, max_value + step, step):
-                y = y0 - i * bar_height_unit
-                painter.drawLine(chart_left, int(y), chart_right, int(y))
-                painter.setPen(QColor("#555"))
-                painter.drawText(0, int(y) - 7, self.margin - 10, 15,
-                                 Qt.AlignRight | Qt.AlignVCenter, str(i))
-                painter.setPen(QPen(QColor(200, 200, 200), 1))
-
-            # Draw bars
+            # Draw bars (only the ones in the repainted area)
             painter.setPen(Qt.NoPen)
-            for i, (college, value) in enumerate(self.data.items()):
+            left, right = dirty.left() - 1, dirty.right() + 1
+            if self._scrollable:
+                painter.setClipRect(QRect(self.margin, 0, chart_right - self.margin, self.height()))
+                left, right = max(left, self.margin), min(right, chart_right)
+            colleges = list(self.data)
+            for i in self._visible_bars(left, right, geometry):
+                college = colleges[i]
                 # Calculate x position for the single bar, centered in its unit
                 x_group_center = chart_left + i * bar_group_unit + bar_group_unit / 2
                 x0 = x_group_center - bar_width / 2
 
                 # Bar dimensions
-                bar_height = value * bar_height_unit * self._current_height_scale
+                bar_height = self._displayed_value(college) * bar_height_unit
                 is_hovered = self._hovered_bar_index == i
 
                 # --- Use unique color for each bar, cycling through the palette ---
@@ -142,13 +327,13 @@ class SingleSeriesBarChartWidget(QWidget):
                 )
                 self._draw_rounded_bar(painter, x0, y0, bar_width, bar_height, is_hovered)
 
-                # Draw tooltip only when animation is done and hovered
-                if is_hovered and self._current_height_scale == 1.0:
-                    self._draw_tooltip_safe(painter, x0, y0 - bar_height, bar_width, value)
-
-                # X-Axis labels (Centered under the single bar)
-                painter.setPen(QColor("#555"))
-                painter.drawText(int(x0), y0 + 15, int(bar_width), 20, Qt.AlignCenter, college)
+            # Draw tooltip only when animation is done and hovered; last, above every bar and the scroll clip
+            painter.setClipping(False)
+            if 0 <= self._hovered_bar_index < len(colleges) and self._current_height_scale == 1.0:
+                college = colleges[self._hovered_bar_index]
+                x0 = self._bar_x(self._hovered_bar_index, geometry)
+                bar_height = self._displayed_value(college) * bar_height_unit
+                self._draw_tooltip_safe(painter, x0, y0 - bar_height, bar_width, self.data[college])
         except Exception as e:
             traceback.print_exc()
 
@@ -172,23 +357,23 @@ class SingleSeriesBarChartWidget(QWidget):
         painter.drawPath(path)
 
     # Tooltip with error handling (Kept original logic for drawing tooltip)
-    def _draw_tooltip_safe(self, painter, x, y, w, value):
-        try:
-            tooltip_w, tooltip_h = 50, 25
+    def _tooltip_rect(self, x, y, w):
+        tooltip_w, tooltip_h = 50, 25
 
-            # Calculate coordinates (results in floats)
-            tx = x + w / 2 - tooltip_w / 2
-            ty = y - tooltip_h - 5
+        # Calculate coordinates (results in floats)
+        tx = x + w / 2 - tooltip_w / 2
+        ty = y - tooltip_h - 5
 
-            # Constrain coordinates
-            tx = max(5.0, min(tx, self.width() - tooltip_w - 5.0))
-            ty = max(5.0, ty)
+        # Constrain coordinates
+        tx = max(5.0, min(tx, self.width() - tooltip_w - 5.0))
+        ty = max(5.0, ty)
+        return QRect(int(tx), int(ty), tooltip_w, tooltip_h)
 
+    def _draw_tooltip_safe(self, painter, x, y, w, value):
+        try:
             # Convert all drawing coordinates to integers
-            tx_int = int(tx)
-            ty_int = int(ty)
-            w_int = int(tooltip_w)
-            h_int = int(tooltip_h)
+            rect = self._tooltip_rect(x, y, w)
+            tx_int, ty_int, w_int, h_int = rect.x(), rect.y(), rect.width(), rect.height()
 
             painter.setPen(Qt.NoPen)
             painter.setBrush(QColor(0, 0, 0, 200))
@@ -207,49 +392,69 @@ class SingleSeriesBarChartWidget(QWidget):
         return QRect(int(x), int(y0 - h), int(w), int(h))
 
     # --- Mouse hover ---
+    def _bar_hit_index(self):
+        """Full-height bar rects indexed by x, for the current size and data."""
+        key = (self.width(), self.height(), self._scroll_x)
+        if self._hit_index is None or self._hit_key != key:
+            geometry = self._chart_geometry()
+            y0, bar_width, bar_height_unit = geometry[2], geometry[4], geometry[5]
+            intervals = []
+            for i, value in enumerate(self.data.values()):
+                rect = self._get_bar_rect(self._bar_x(i, geometry), y0, bar_width, value * bar_height_unit)
+                intervals.append((rect.left(), rect.right(), (i, rect)))
+            self._hit_index, self._hit_key = IntervalIndex(intervals), key
+        return self._hit_index
+
     def mouseMoveEvent(self, event):
-        if self._current_height_scale < 1.0:
+        if self._current_height_scale < 1.0 or not self.data:
             return
 
         try:
             pos = event.pos()
-            categories = list(self.data.keys())
-            n_bars = len(categories)
-            chart_top = self.margin + 40
-            chart_bottom = self.height() - self.margin
-            chart_left = self.margin
-            chart_right = self.width() - self.margin
-            chart_height = chart_bottom - chart_top
-            chart_width = chart_right - chart_left
-
-            max_value = max(self.data.values()) or 1
-            max_value_buffered = max_value * 1.1
-            bar_group_unit = chart_width / n_bars
-            bar_width = bar_group_unit * self.bar_group_width_ratio
-            bar_height_unit = chart_height / max_value_buffered
-            y0 = chart_bottom
-
             new_index = -1
-            for i, (college, value) in enumerate(self.data.items()):
-                x_group_center = chart_left + i * bar_group_unit + bar_group_unit / 2
-                x0 = x_group_center - bar_width / 2
-
-                bar_full_height = value * bar_height_unit
-                bar_rect = self._get_bar_rect(x0, y0, bar_width, bar_full_height)
-
-                if bar_rect.contains(pos):
+            if self._scrollable and not self.margin <= pos.x() <= self.width() - self.margin:
+                self._set_hovered(new_index)  # bars scrolled under the margins are hidden
+                return
+            for i, rect in self._bar_hit_index().candidates(pos.x()):
+                if rect.contains(pos):
                     new_index = i
                     break
 
-            if new_index != self._hovered_bar_index:
-                self._hovered_bar_index = new_index
-                self.update()
+            self._set_hovered(new_index)
         except Exception:
             traceback.print_exc()
 
     def leaveEvent(self, event):
+        self._set_hovered(-1)
+
+    # --- Scrolling ---
+    # Clamp and apply the horizontal scroll offset; returns False if it did not move
+    def _scroll_to(self, x):
+        if self._scrollable and self.data:
+            geometry = self._chart_geometry()
+            content_width = geometry[3] * len(self.data)
+            x = int(max(0, min(x, content_width - (geometry[1] - self.margin))))
+        else:
+            x = 0
+        if x == self._scroll_x:
+            return False
+        self._scroll_x = x
         self._hovered_bar_index = -1
+        self._static_layer.invalidate()
         self.update()
+        return True
+
+    # Scroll the bars sideways; the parent scrolls instead once the chart cannot move
+    def wheelEvent(self, event):
+        delta = event.angleDelta().x() or event.angleDelta().y()
+        if self._scroll_to(self._scroll_x - delta):
+            event.accept()
+        else:
+            event.ignore()
+
+    def resizeEvent(self, event):
+        self._refit()
+        super().resizeEvent(event)
 
 
 # Utility function to create the widget
@@ -1,12 +1,16 @@
 import traceback
-from math import cos, sin, radians, atan2
+from bisect import bisect_right
+from math import cos, sin, radians, atan2, hypot, degrees
 from PyQt5.QtWidgets import QWidget
-from PyQt5.QtGui import QPainter, QColor, QFont, QPen
+from PyQt5.QtGui import QPainter, QColor, QFont, QPainterPath, QPainterPathStroker, QRegion
 from PyQt5.QtCore import (
-    Qt, QPropertyAnimation, QParallelAnimationGroup,
-    QObject, pyqtProperty as Property, QRectF, QEasingCurve
+    Qt, QObject, QRectF, QEasingCurve
 )
-from app.utils.util import DesignShadow
+from app.utils.shadow import CachedShadow
+from app.utils.chart_layers import StaticLayer
+from app.utils.animation_clock import AnimationClock, animation_clock
+from app.utils.chart_density import top_n_with_other
+from app.utils.render_profile import render_profile
 
 class AnimatedSlice(QObject):
     def __init__(self, value, color, label, target_angle, start_angle, parent=None):
@@ -16,17 +20,9 @@ class AnimatedSlice(QObject):
         self.label = label
         self.target_angle = target_angle
         self.start_angle_offset = start_angle
-        self._current_span_angle = 0.0
-
-    def get_current_span_angle(self):
-        return self._current_span_angle
-
-    def set_current_span_angle(self, angle):
-        self._current_span_angle = angle
-        if self.parent():
-            self.parent().update()
-
-    current_span_angle = Property(float, get_current_span_angle, set_current_span_angle)
+        self.current_span_angle = 0.0  # advanced by DonutChartWidget.update_animation() on the shared clock
+        self.from_angle = 0.0  # span the current animation started from
+        self.path, self.path_key = None, None  # filled ring segment, see DonutChartWidget._slice_path
 
 
 class DonutChartWidget(QWidget):
@@ -41,15 +37,22 @@ class DonutChartWidget(QWidget):
         self.label_font = QFont("Poppins", 8, QFont.Bold)
         self.donut_thickness_ratio = 0.20
 
-        # Animations
+        # Slices under min_slice_fraction of the total, and any beyond max_slices, become "Other"
+        self.min_slice_fraction = 0.02
+        self.max_slices = 8
+
+        # Animations (driven by the shared animation clock)
         self.slices = []
-        self.animation_group = QParallelAnimationGroup(self)
         self.animation_duration = 1300
+        self.animation_elapsed = self.animation_duration
+        self.easing = QEasingCurve(QEasingCurve.OutCubic)
 
         # Hover
         self.hovered_slice = None
         self.setMouseTracking(True)
+        self._hit_bounds, self._hit_key = None, None  # cumulative slice angles, rebuilt when spans or size change
 
+        self._static_layer = StaticLayer(self, self._paint_static)
         self._prepare_slices()
         self.setMinimumSize(320, 260)
 
@@ -69,99 +72,175 @@ class DonutChartWidget(QWidget):
         ]
 
     def _prepare_slices(self):
-        total = sum(self._data_raw.values())
-        if total <= 0:
-            return
-
-        self.slices.clear()
+        """
+        Point one slice per label at its share of the data and queue the span animations.
+
+        Slices are matched by label, so rebinding animates each span from its current
+        value; labels that disappear are dropped and new ones grow from zero.
+        """
+        data = self._merge_small_slices(self._data_raw)
+        total = sum(data.values())
         colors = self._get_default_colors()
+        existing = {sl.label: sl for sl in self.slices}
+        slices = []
         angle_offset = 90 * 16
-        color_i = 0
-
-        for label, value in self._data_raw.items():
-            pct = value / total
-            span = round(pct * 5760)
 
+        for color_i, (label, value) in enumerate(data.items()):
+            span = round(value / total * 5760) if total > 0 else 0
             sl_color = colors[color_i % len(colors)]
-            color_i += 1
-
-            sl = AnimatedSlice(value, sl_color, label, span, angle_offset, parent=self)
-            self.slices.append(sl)
 
-            anim = QPropertyAnimation(sl, b"current_span_angle")
-            anim.setDuration(self.animation_duration)
-            anim.setStartValue(0.0)
-            anim.setEndValue(float(span))
-            anim.setEasingCurve(QEasingCurve.OutCubic)
-            self.animation_group.addAnimation(anim)
+            sl = existing.pop(label, None)
+            if sl is None:
+                sl = AnimatedSlice(value, sl_color, label, span, angle_offset, parent=self)
+            sl.value, sl.color, sl.target_angle, sl.start_angle_offset = value, sl_color, span, angle_offset
+            sl.from_angle = sl.current_span_angle
+            slices.append(sl)
 
             angle_offset += span
 
+        for sl in existing.values():
+            if sl is self.hovered_slice:
+                self.hovered_slice = None
+            sl.deleteLater()
+        self.slices = slices
+        self._hit_bounds = None
+        self._static_layer.invalidate()
+
+    def _merge_small_slices(self, data):
+        """Fold slices too thin to see or to hover, and any past max_slices, into one "Other" slice."""
+        total = sum(data.values())
+        small = sum(1 for value in data.values() if total > 0 and value / total < self.min_slice_fraction)
+        keep = len(data) - small if small > 1 else len(data)
+        if keep == 0:  # all slices are thin: show the largest ones rather than a single "Other"
+            keep = self.max_slices - 1
+        if len(data) > self.max_slices:
+            keep = min(keep, self.max_slices - 1)
+        return top_n_with_other(data, keep, lambda value: value, sum)
+
+    def set_data(self, data: dict, title=None):
+        """
+        Show new data on this chart, animating the slices from their current spans.
+
+        Args:
+            data (dict): {label: value}, as given to the constructor.
+            title (str): New title; None keeps the current one.
+        """
+        self._data_raw = data
+        if title is not None:
+            self.title = title
+        self._prepare_slices()
+        self.animation_elapsed = 0
+        animation_clock.start(self, self.update_animation)
+        self.update()
+
     # ---------- Animation ----------
     def start_animation(self):
+        """Replay the grow-from-zero animation."""
         try:
-            self.animation_group.start()
+            for sl in self.slices:
+                sl.from_angle = 0.0
+                sl.current_span_angle = 0.0
+            self._hit_bounds = None
+            self.animation_elapsed = 0
+            animation_clock.start(self, self.update_animation)
+            self.update()
         except Exception:
             traceback.print_exc()
 
-    # ---------- Hover (Logic remains the same to detect hover) ----------
-    def mouseMoveEvent(self, event):
-        pos = event.pos()
-        W, H = self.width(), self.height()
-
-        # Recalculate size to match paintEvent logic
-        available_chart_height = H - 40  # Reserve 40px for legend
-        chart_size = min(W, available_chart_height) * 0.75
-        donut_thickness = chart_size * self.donut_thickness_ratio
-        chart_rect = QRectF(
-            (W - chart_size) / 2,
-            (available_chart_height - chart_size) / 2 - 10,  # Shifted up slightly
-            chart_size,
-            chart_size
-        )
-        radius = chart_size / 2
+    def update_animation(self, elapsed_ms=AnimationClock.FRAME_MS):
+        """Advance every slice by one frame (OutCubic); returns False once all spans are final."""
+        self.animation_elapsed = min(self.animation_duration, self.animation_elapsed + elapsed_ms)
+        progress = self.easing.valueForProgress(self.animation_elapsed / self.animation_duration)
+        for sl in self.slices:
+            sl.current_span_angle = sl.from_angle + (sl.target_angle - sl.from_angle) * progress
+        self._hit_bounds = None
+        self.update(self._ring_rect())  # title and legend do not move
+        return self.animation_elapsed < self.animation_duration
+
+    # ---------- Hover ----------
+    def _slice_hit_bounds(self):
+        """Angle (degrees from 12 o'clock, CCW) at which each slice ends, for the current spans."""
+        key = (self.width(), self.height())
+        if self._hit_bounds is None or self._hit_key != key:
+            bounds, cumulative_deg = [], 0.0
+            for sl in self.slices:
+                cumulative_deg += sl.current_span_angle / 16.0
+                bounds.append(cumulative_deg)
+            self._hit_bounds, self._hit_key = bounds, key
+        return self._hit_bounds
+
+    def _slice_at(self, pos):
+        chart_rect = self._chart_rect()
+        radius = chart_rect.width() / 2
+        donut_thickness = chart_rect.width() * self.donut_thickness_ratio
         chart_center = chart_rect.center()
 
         dx = pos.x() - chart_center.x()
         dy = chart_center.y() - pos.y()  # Y positive UP for atan2
 
-        dist = (dx ** 2 + dy ** 2) ** 0.5
-
-        self.hovered_slice = None
-
-        # 1. Check if mouse is inside donut ring
-        # Use radius and donut_thickness derived from chart_size
-        if radius - donut_thickness / 2 <= dist <= radius + donut_thickness / 2:
+        # 1. Mouse must be inside the donut ring
+        if not radius - donut_thickness / 2 <= hypot(dx, dy) <= radius + donut_thickness / 2:
+            return None
 
-            # Standard Cartesian angle (0 deg at 3 o'clock, CCW)
-            angle_rad = atan2(dy, dx)
-            angle_deg = (angle_rad * 180 / 3.14159265 + 360) % 360
+        # 2. Angle from 12 o'clock, CCW: the scale the slices accumulate in
+        hover_deg = (degrees(atan2(dy, dx)) - 90 + 360) % 360
 
-            # Convert to 0 deg at top (12 o'clock), CCW (The scale used by the slice accumulation logic)
-            final_hover_deg = (angle_deg - 90 + 360) % 360
-
-            # 2. Track the cumulative angle and check against slices
-            cumulative_deg = 0.0
-            gap_deg = 6 / 16.0
-
-            for sl in self.slices:
-                span_deg_full = sl.current_span_angle / 16.0
+        # 3. First slice ending after that angle, unless the angle falls in its trailing gap
+        bounds = self._slice_hit_bounds()
+        i = bisect_right(bounds, hover_deg)
+        gap_deg = 6 / 16.0
+        if i < len(bounds) and hover_deg < bounds[i] - gap_deg:
+            return self.slices[i]
+        return None
 
-                hover_start_deg = cumulative_deg
-                hover_end_deg = cumulative_deg + span_deg_full - gap_deg  # Exclude gap
-
-                if hover_start_deg < hover_end_deg:
-                    if hover_start_deg <= final_hover_deg < hover_end_deg:
-                        self.hovered_slice = sl
-                        break
-                else:  # Slice crosses 360/0
-                    if final_hover_deg >= hover_start_deg or final_hover_deg < hover_end_deg:
-                        self.hovered_slice = sl
-                        break
+    def mouseMoveEvent(self, event):
+        previous = self.hovered_slice
+        self.hovered_slice = self._slice_at(event.pos())
+
+        if self.hovered_slice is not previous:
+            dirty = QRegion()
+            for sl in (previous, self.hovered_slice):
+                if sl is not None:
+                    dirty += self._slice_rect(sl)
+            self.update(dirty)
+
+    # ---------- Dirty regions ----------
+    def _chart_rect(self):
+        """Bounding box of the donut arc, as laid out by paintEvent."""
+        W, H = self.width(), self.height()
+        available_chart_height = H - 40
+        chart_size = min(W, available_chart_height) * 0.75
+        return QRectF(
+            (W - chart_size) / 2,
+            (40 + available_chart_height - chart_size) / 2 - 10,
+            chart_size,
+            chart_size
+        )
 
-                cumulative_deg += span_deg_full
+    def _ring_rect(self):
+        """Area the slices can paint into, including a hovered slice's wider pen and pop-out."""
+        chart_rect = self._chart_rect()
+        margin = chart_rect.width() * self.donut_thickness_ratio * 1.3 / 2 + 10 + 2
+        return chart_rect.adjusted(-margin, -margin, margin, margin).toAlignedRect()
 
-        self.update()
+    def _slice_rect(self, sl):
+        """Area one slice covers, hovered or not."""
+        chart_rect = self._chart_rect()
+        angle = 90 * 16
+        for other in self.slices:
+            if other is sl:
+                break
+            angle += round(other.current_span_angle)
+        rad = radians(angle / 16 + sl.current_span_angle / 32)
+        popped = chart_rect.translated(10 * cos(rad), -10 * sin(rad))
+
+        path = QPainterPath()
+        for rect in (chart_rect, popped):
+            path.arcMoveTo(rect, angle / 16)
+            path.arcTo(rect, angle / 16, sl.current_span_angle / 16)
+        stroker = QPainterPathStroker()
+        stroker.setWidth(chart_rect.width() * self.donut_thickness_ratio * 1.3)
+        return stroker.createStroke(path).boundingRect().adjusted(-2, -2, 2, 2).toAlignedRect()
 
     # ---------- Painting ----------
     def paintEvent(self, event):
@@ -172,32 +251,18 @@ class DonutChartWidget(QWidget):
 
     def _safe_paint(self, event):
         painter = QPainter(self)
-        painter.setRenderHints(QPainter.Antialiasing | QPainter.TextAntialiasing)
+        painter.setRenderHints(render_profile.render_hints())
         W, H = self.width(), self.height()
         if W < 50 or H < 50:
             return
 
-        # 1. Draw Title (RE-ADDED)
-        painter.setFont(self.title_font)
-        painter.setPen(QColor("#333"))
-        painter.drawText(0, 0, W, 40, Qt.AlignCenter | Qt.AlignVCenter, self.title)
+        # 1. Title and legend come from the cached static layer
+        self._static_layer.draw(painter)
 
         # 2. Calculate Chart Geometry
-        # Reserve about 40px at the bottom for the legend
-        available_chart_height = H - 40
-        chart_size = min(W, available_chart_height) * 0.75  # Size of the bounding box for the arc
-        donut_thickness = chart_size * self.donut_thickness_ratio
-
-        # Center the chart horizontally, and shift it up slightly vertically
-        # Note: Chart positioning is slightly adjusted here to account for the top margin used by the title
-        chart_rect = QRectF(
-            (W - chart_size) / 2,
-            (40 + available_chart_height - chart_size) / 2 - 10, # Start Y adjusted for top 40px used by title
-            chart_size,
-            chart_size
-        )
-        radius = chart_size / 2
-        center_x, center_y = chart_rect.center().x(), chart_rect.center().y()
+        # The bounding box of the arc sits between the title (top 40px) and the legend (bottom 40px)
+        chart_rect = self._chart_rect()
+        donut_thickness = chart_rect.width() * self.donut_thickness_ratio
 
         # 3. Draw slices with hover effect
         angle = 90 * 16
@@ -216,8 +281,8 @@ class DonutChartWidget(QWidget):
 
                 pen_width = donut_thickness * 1.3 if sl == self.hovered_slice else donut_thickness
                 pen_color = sl.color.lighter(150) if sl == self.hovered_slice else sl.color
-                pen = QPen(pen_color, pen_width, Qt.SolidLine, Qt.FlatCap)
-                painter.setPen(pen)
+                painter.setPen(Qt.NoPen)
+                painter.setBrush(pen_color)
 
                 # Adjusted rectangle for pop-out
                 shifted_rect = QRectF(
@@ -226,12 +291,41 @@ class DonutChartWidget(QWidget):
                     chart_rect.width(),
                     chart_rect.height()
                 )
-                painter.drawArc(shifted_rect, angle, span)
+                painter.drawPath(self._slice_path(sl, shifted_rect, angle, span, pen_width))
                 angle += round(sl.current_span_angle)
             except Exception:
                 traceback.print_exc()
 
-        # 4. Draw Legend (Horizontal, centered at the bottom)
+    def _slice_path(self, sl, rect, angle, span, width):
+        """
+        The slice's arc stroked with a flat-capped pen of the given width, as a fillable path.
+
+        Filling the cached outline costs about half of drawArc with a wide pen; it is rebuilt
+        only when the size, angles or hover state change (every frame while animating).
+        """
+        key = (rect.x(), rect.y(), rect.width(), angle, span, width)
+        if sl.path_key != key:
+            arc = QPainterPath()
+            arc.arcMoveTo(rect, angle / 16)
+            arc.arcTo(rect, angle / 16, span / 16)
+            stroker = QPainterPathStroker()
+            stroker.setWidth(width)
+            stroker.setCapStyle(Qt.FlatCap)
+            sl.path, sl.path_key = stroker.createStroke(arc), key
+        return sl.path
+
+    def _paint_static(self, painter):
+        """Title and legend; cached by self._static_layer until the data, size or DPI changes."""
+        W, H = self.width(), self.height()
+        if W < 50 or H < 50:
+            return
+
+        # Draw Title
+        painter.setFont(self.title_font)
+        painter.setPen(QColor("#333"))
+        painter.drawText(0, 0, W, 40, Qt.AlignCenter | Qt.AlignVCenter, self.title)
+
+        # Draw Legend (Horizontal, centered at the bottom)
         total_value = max(1, sum(self._data_raw.values()))
 
         painter.setFont(self.label_font)
@@ -285,5 +379,6 @@ class DonutChartWidget(QWidget):
 def create_donut_chart_widget(data: dict, title="", colors=None, parent=None):
     w = DonutChartWidget(data, title=title, colors=colors, parent=parent)
     w.start_animation()
-    DesignShadow(w, blur=50, offset=(0, 0), color=QColor(0, 0, 0, 180))
+    if render_profile.shadows:
+        CachedShadow(w, blur=50, offset=(0, 0), color=QColor(0, 0, 0, 180))
     return w
\ No newline at end of file
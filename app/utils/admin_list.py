@@ -0,0 +1,532 @@
+# Admin application lists (pending / accepted / rejected / dropped) on Qt's model/view classes.
+# Cards are painted by a delegate, so only rows inside the viewport cost anything.
+import bisect
+import weakref
+from PyQt5 import QtWidgets
+from PyQt5.QtCore import (Qt, QObject, QRect, QRectF, QSize, QAbstractListModel, QModelIndex, QEvent,
+                          pyqtSignal)
+from PyQt5.QtGui import QColor, QFont, QFontMetrics, QPainter, QPen
+from PyQt5.QtWidgets import QStyledItemDelegate, QListView, QMessageBox
+from app.utils.theme import install_theme
+from app.utils.shadow import draw_shadow
+from app.utils.render_profile import render_profile
+
+
+RecordRole = Qt.UserRole + 1
+
+STATUS_COLORS = {"ACCEPTED": "#4CAF50", "REJECTED": "#FF5252", "DROPPED": "#795548"}
+
+
+def _font(family=None, pixel_size=None, point_size=None, weight=QFont.Normal):
+    font = QFont(family) if family else QFont()
+    if pixel_size:
+        font.setPixelSize(pixel_size)
+    if point_size:
+        font.setPointSize(point_size)
+    font.setWeight(weight)
+    return font
+
+
+############################### Card styles (match the old widget cards)
+def pending_card_style():
+    """Pending card from display_scholarships_admin: status pill with Accept/Reject in one row."""
+    return {
+        "width": 900, "height": 220, "gap": 15, "radius": 15, "margin": 20, "spacing": 30,
+        "background": QColor(255, 255, 255, 220), "border": QColor(200, 200, 200, 128),
+        "shadow_blur": 25, "shadow_color": QColor(0, 0, 0, 80),
+        "title_font": _font(pixel_size=16, weight=QFont.Bold), "title_color": QColor("#1f3a5f"),
+        "id_font": _font(pixel_size=14), "id_color": QColor("#555"),
+        "name_font": _font(pixel_size=18, weight=QFont.DemiBold), "name_color": QColor("#334e68"),
+        "key_font": _font(pixel_size=14, weight=QFont.DemiBold), "key_color": QColor("#000"),
+        "value_font": _font(pixel_size=14, weight=QFont.Medium), "value_color": QColor("#586c87"),
+        "status_font": _font(pixel_size=16, weight=QFont.Bold), "status_radius": 10,
+        "right": "row", "box_size": (None, 40), "box_spacing": 8,
+        "status_color": lambda record: QColor("#2196F3"),
+        "status_text": lambda record: str(record[11]).upper(),
+        "actions": [
+            ("Accept", "ACCEPTED", QColor("#4CAF50"), QColor("#388E3C"), QColor("#388E3C")),
+            ("Reject", "REJECTED", QColor("#FF5252"), QColor("#D32F2F"), QColor("#D32F2F")),
+        ],
+        "action_font": _font(pixel_size=16, weight=QFont.DemiBold), "action_radius": 10,
+        "empty_text": "No pending scholarship applications found.",
+    }
+
+
+def reviewed_card_style(status_type):
+    """Accepted/rejected/dropped card from util2: status box, plus a Drop button for accepted."""
+    actions = []
+    if status_type == "ACCEPTED":
+        actions.append(("Drop", "DROPPED", QColor("#D32F2F"), QColor("#B71C1C"), QColor("#9A0007")))
+    return {
+        "width": 900, "height": 300, "gap": 15, "radius": 18, "margin": 18, "spacing": 18,
+        "background": QColor("white"), "border": QColor(0, 0, 0, 20),
+        "shadow_blur": 18, "shadow_color": QColor(0, 0, 0, 90),
+        "title_font": _font("Segoe UI", point_size=14, weight=QFont.Bold), "title_color": QColor("#000"),
+        "id_font": _font("Segoe UI", point_size=10), "id_color": QColor("#000"),
+        "name_font": _font("Segoe UI", point_size=12, weight=QFont.DemiBold), "name_color": QColor("#000"),
+        "key_font": _font("Segoe UI", point_size=10, weight=QFont.Bold), "key_color": QColor("#000"),
+        "value_font": _font("Segoe UI", point_size=10), "value_color": QColor("#000"),
+        "status_font": _font(), "status_radius": 8,
+        "right": "column", "box_size": (150, 100), "box_spacing": 6,
+        "status_color": lambda record: QColor(STATUS_COLORS.get(status_type, "#795548")),
+        "status_text": lambda record: status_type.upper(),
+        "actions": actions,
+        "action_font": _font(), "action_radius": 6,
+        "empty_text": f"No {status_type.lower()} scholarship applications found.",
+    }
+
+
+############################### Model
+def validate_record_for_display(rec):
+    """
+    Ensure record has exactly 14 fields in expected order:
+    (id, username, first_name, last_name, middle_name, email,
+     municipality, college, program, year_level, scholarship_name, status, gwa, suffix)
+    """
+    if not rec:
+        return False, "Empty record"
+    if not isinstance(rec, (list, tuple)):
+        return False, f"Record is not tuple/list: {type(rec)}"
+    if len(rec) != 14:
+        return False, f"Expected 14 fields but got {len(rec)}"
+    return True, None
+
+
+def is_pending(record):
+    # Same rule as the old pending list: anything not yet ACCEPTED/REJECTED (DROPPED can be reviewed again)
+    return record[11] not in ("ACCEPTED", "REJECTED")
+
+
+def has_status(status_type):
+    return lambda record: len(record) >= 12 and bool(record[11]) and str(record[11]).upper() == status_type
+
+
+class ApplicationStore(QObject):
+    """
+    In-memory snapshot of get_user_info_for_admin(), keyed by scholarship id.
+
+    All admin lists are filtered views over one store, so switching between them never
+    re-queries the database. A status change is written through to the database and
+    reported per row through record_changed(id, old record, new record), where a missing
+    side is None (insert/remove).
+    """
+    record_changed = pyqtSignal(int, object, object)
+    reloaded = pyqtSignal()
+
+    def __init__(self, database, parent=None):
+        super().__init__(parent)
+        self.database = database
+        self._records = {}
+        self._models = {}
+        self.loaded = False
+
+    def _query(self):
+        records = {}
+        for rec in self.database.get_user_info_for_admin():
+            ok, err = validate_record_for_display(rec)
+            if ok:
+                records[rec[0]] = tuple(rec)
+            else:
+                print(f"Skipping invalid record: {err}")
+        return records
+
+    def ensure_loaded(self):
+        if not self.loaded:
+            self._records = self._query()
+            self.loaded = True
+            self.reloaded.emit()
+
+    def reload(self):
+        """Re-query and apply only the differences as row-level changes."""
+        if not self.loaded:
+            self.ensure_loaded()
+            return
+        fresh = self._query()
+        old = self._records
+        self._records = fresh
+        for scholar_id in old.keys() - fresh.keys():
+            self.record_changed.emit(scholar_id, old[scholar_id], None)
+        for scholar_id, record in fresh.items():
+            if old.get(scholar_id) != record:
+                self.record_changed.emit(scholar_id, old.get(scholar_id), record)
+
+    def record(self, scholar_id):
+        return self._records.get(scholar_id)
+
+    def records(self):
+        return self._records.values()
+
+    def set_status(self, scholar_id, new_status):
+        """Write a status change through to the database; returns the database result."""
+        ok = self.database.update_scholarship_status(scholar_id, new_status)
+        old = self._records.get(scholar_id)
+        if ok and old is not None:
+            new = old[:11] + (new_status,) + old[12:]
+            self._records[scholar_id] = new
+            self.record_changed.emit(scholar_id, old, new)
+        return ok
+
+    def model(self, key):
+        """Shared list model for "PENDING", "ACCEPTED", "REJECTED" or "DROPPED"."""
+        model = self._models.get(key)
+        if model is None:
+            predicate = is_pending if key == "PENDING" else has_status(key)
+            model = self._models[key] = ApplicationListModel(self, predicate, parent=self)
+        return model
+
+
+_stores = weakref.WeakKeyDictionary()
+
+
+def application_store(database):
+    """The ApplicationStore for a database, created (but not loaded) on first use."""
+    store = _stores.get(database)
+    if store is None:
+        store = _stores[database] = ApplicationStore(database)
+    return store
+
+
+class ApplicationListModel(QAbstractListModel):
+    """Rows of an ApplicationStore that match predicate, in id order; kept in sync row by row."""
+
+    def __init__(self, store, predicate, parent=None):
+        super().__init__(parent)
+        self.store = store
+        self.predicate = predicate
+        self._ids = []
+        self._rebuild()
+        store.reloaded.connect(self._rebuild)
+        store.record_changed.connect(self._on_record_changed)
+
+    def _rebuild(self):
+        self.beginResetModel()
+        self._ids = sorted(rec[0] for rec in self.store.records() if self.predicate(rec))
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._ids)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        record = self.store.record(self._ids[index.row()])
+        if role == RecordRole:
+            return record
+        if role == Qt.DisplayRole:
+            return f"{record[10]} (ID: {record[0]})"
+        return None
+
+    def record(self, row):
+        return self.store.record(self._ids[row])
+
+    def row_of(self, scholar_id):
+        row = bisect.bisect_left(self._ids, scholar_id)
+        return row if row < len(self._ids) and self._ids[row] == scholar_id else -1
+
+    def _on_record_changed(self, scholar_id, old, new):
+        was_in = old is not None and self.predicate(old)
+        is_in = new is not None and self.predicate(new)
+        if was_in and is_in:
+            row = self.row_of(scholar_id)
+            self.dataChanged.emit(self.index(row), self.index(row))
+        elif was_in:
+            row = self.row_of(scholar_id)
+            self.beginRemoveRows(QModelIndex(), row, row)
+            del self._ids[row]
+            self.endRemoveRows()
+        elif is_in:
+            row = bisect.bisect_left(self._ids, scholar_id)
+            self.beginInsertRows(QModelIndex(), row, row)
+            self._ids.insert(row, scholar_id)
+            self.endInsertRows()
+
+
+############################### Delegate
+class ApplicationCardDelegate(QStyledItemDelegate):
+    """
+    Paints one application card per row and handles its inline action buttons by hit-testing.
+
+    action_triggered(scholar_id, new_status) is emitted when an action button is clicked.
+    """
+    action_triggered = pyqtSignal(int, str)
+
+    def __init__(self, style, parent=None):
+        super().__init__(parent)
+        self._hover = None  # (row, action index)
+        self._pressed = None
+        self.set_style(style)
+
+    def set_style(self, style):
+        self.card_style = style
+        self._hover = self._pressed = None
+        self._key_width = QFontMetrics(style["key_font"]).horizontalAdvance("Municipality:") + 10
+
+    def sizeHint(self, option, index):
+        return QSize(self.card_style["width"] + self.card_style["shadow_blur"], self.card_style["height"] + self.card_style["gap"])
+
+    ############################### Geometry
+    def card_rect(self, rect):
+        s = self.card_style
+        x = rect.x() + max(0, (rect.width() - s["width"]) // 2)
+        return QRect(x, rect.y() + s["gap"] // 2, s["width"], s["height"])
+
+    def layout_card(self, rect):
+        """Return (card, left column, status box, [action boxes]) for an item rect."""
+        s = self.card_style
+        card = self.card_rect(rect)
+        inner = card.adjusted(s["margin"], s["margin"], -s["margin"], -s["margin"])
+        left_width = (inner.width() - s["spacing"]) * 2 // 5
+        left = QRect(inner.x(), inner.y(), left_width, inner.height())
+        right = QRect(left.right() + 1 + s["spacing"], inner.y(), inner.width() - left_width - s["spacing"],
+                      inner.height())
+
+        count = 1 + len(s["actions"])
+        box_w, box_h = s["box_size"]
+        if s["right"] == "row":
+            # status and buttons share the row in equal parts, like the stretch-1 QHBoxLayout
+            box_w = (right.width() - s["box_spacing"] * (count - 1)) // count
+            boxes = [QRect(right.x() + i * (box_w + s["box_spacing"]), right.y(), box_w, box_h)
+                     for i in range(count)]
+        else:
+            # right-aligned column of fixed-size boxes
+            boxes = [QRect(right.right() + 1 - box_w, right.y() + i * (box_h + s["box_spacing"]), box_w, box_h)
+                     for i in range(count)]
+        return card, left, boxes[0], boxes[1:]
+
+    def action_at(self, rect, pos):
+        _, _, _, actions = self.layout_card(rect)
+        for i, box in enumerate(actions):
+            if box.contains(pos):
+                return i
+        return None
+
+    ############################### Painting
+    def _draw_shadow(self, painter, option, card):
+        s = self.card_style
+        if not render_profile.shadows:
+            return
+        # Kept inside the row so a single-row update repaints the whole shadow
+        painter.save()
+        painter.setClipRect(option.rect)
+        draw_shadow(painter, card, s["radius"], s["shadow_blur"], s["shadow_color"])
+        painter.restore()
+
+    def _draw_box(self, painter, box, color, radius, text, font):
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(color)
+        painter.drawRoundedRect(QRectF(box), radius, radius)
+        painter.setPen(QColor("white"))
+        painter.setFont(font)
+        painter.drawText(box, Qt.AlignCenter, text)
+
+    def _draw_text(self, painter, rect, text, font, color, flags=Qt.AlignLeft | Qt.AlignVCenter):
+        painter.setFont(font)
+        painter.setPen(color)
+        text = QFontMetrics(font).elidedText(text, Qt.ElideRight, rect.width())
+        painter.drawText(rect, flags, text)
+        return QFontMetrics(font).horizontalAdvance(text)
+
+    def paint(self, painter, option, index):
+        s = self.card_style
+        record = index.data(RecordRole)
+        (scholar_id, username, first_name, last_name, middle_name, email,
+         municipality, college, program, year_level, scholar_name,
+         status, gwa, suffix) = record
+
+        painter.save()
+        painter.setRenderHints(render_profile.render_hints())
+        card, left, status_box, action_boxes = self.layout_card(option.rect)
+
+        self._draw_shadow(painter, option, card)
+        painter.setPen(QPen(s["border"], 1))
+        painter.setBrush(s["background"])
+        painter.drawRoundedRect(QRectF(card).adjusted(0.5, 0.5, -0.5, -0.5), s["radius"], s["radius"])
+
+        # Title + ID
+        title_h = QFontMetrics(s["title_font"]).height() + 4
+        y = left.y()
+        advance = self._draw_text(painter, QRect(left.x(), y, left.width(), title_h), str(scholar_name),
+                                  s["title_font"], s["title_color"])
+        self._draw_text(painter, QRect(left.x() + advance + 6, y, max(0, left.width() - advance - 6), title_h),
+                        f"(ID: {scholar_id})", s["id_font"], s["id_color"])
+        y += title_h + 5
+
+        # Full name
+        full_name = " ".join(str(part) for part in (first_name, middle_name, last_name, suffix) if part).strip()
+        name_h = QFontMetrics(s["name_font"]).height() + 4
+        self._draw_text(painter, QRect(left.x(), y, left.width(), name_h), full_name, s["name_font"], s["name_color"])
+        y += name_h + 5
+
+        # Details grid
+        row_h = max(QFontMetrics(s["key_font"]).height(), QFontMetrics(s["value_font"]).height()) + 3
+        details = (("Municipality:", municipality), ("College:", college), ("Program:", program),
+                   ("Year Level:", year_level), ("GWA:", gwa))
+        for key, value in details:
+            self._draw_text(painter, QRect(left.x(), y, self._key_width, row_h), key, s["key_font"], s["key_color"])
+            self._draw_text(painter, QRect(left.x() + self._key_width, y, left.width() - self._key_width, row_h),
+                            "" if value is None else str(value), s["value_font"], s["value_color"])
+            y += row_h
+
+        # Status + actions
+        self._draw_box(painter, status_box, s["status_color"](record), s["status_radius"],
+                       s["status_text"](record), s["status_font"])
+        for i, (box, (text, _, normal, hover, pressed)) in enumerate(zip(action_boxes, s["actions"])):
+            color = normal
+            if self._pressed == (index.row(), i):
+                color = pressed
+            elif self._hover == (index.row(), i):
+                color = hover
+            self._draw_box(painter, box, color, s["action_radius"], text, s["action_font"])
+
+        painter.restore()
+
+    ############################### Inline actions
+    def editorEvent(self, event, model, option, index):
+        if event.type() not in (QEvent.MouseMove, QEvent.MouseButtonPress, QEvent.MouseButtonRelease):
+            return False
+
+        view = self.parent()
+        hit = self.action_at(option.rect, event.pos())
+        target = None if hit is None else (index.row(), hit)
+
+        if target != self._hover:
+            self._hover = target
+            if view is not None:
+                view.viewport().setCursor(Qt.PointingHandCursor if target else Qt.ArrowCursor)
+                view.viewport().update(option.rect)
+
+        if event.type() == QEvent.MouseButtonPress and event.button() == Qt.LeftButton and target:
+            self._pressed = target
+            if view is not None:
+                view.viewport().update(option.rect)
+            return True
+
+        if event.type() == QEvent.MouseButtonRelease and self._pressed is not None:
+            pressed, self._pressed = self._pressed, None
+            if view is not None:
+                view.viewport().update(option.rect)
+            if pressed == target:
+                record = index.data(RecordRole)
+                self.action_triggered.emit(record[0], self.card_style["actions"][hit][1])
+            return True
+
+        return False
+
+
+############################### View
+class ApplicationListView(QListView):
+    """QListView of application cards with an empty-state message."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        install_theme()
+        self.setObjectName("application_list")
+        self.setFrameShape(QtWidgets.QFrame.NoFrame)
+        self.setUniformItemSizes(True)
+        self.setVerticalScrollMode(QtWidgets.QAbstractItemView.ScrollPerPixel)
+        self.verticalScrollBar().setSingleStep(20)
+        self.setSelectionMode(QtWidgets.QAbstractItemView.NoSelection)
+        self.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
+        self.setMouseTracking(True)
+        self.viewport().setAutoFillBackground(False)
+
+        self.delegate = ApplicationCardDelegate(pending_card_style(), self)
+        self.setItemDelegate(self.delegate)
+
+    def setModel(self, model):
+        # The store's models outlive the view's use of them; only the shown one may drive it
+        if self.model() is not None:
+            for signal in self._row_signals(self.model()):
+                try:
+                    signal.disconnect(self._rows_moved)
+                except TypeError:
+                    pass
+        super().setModel(model)
+        # Row indexes shift on insert/remove/move; drop any hover/press state tied to them
+        if model is not None:
+            for signal in self._row_signals(model):
+                signal.connect(self._rows_moved)
+
+    @staticmethod
+    def _row_signals(model):
+        return model.rowsInserted, model.rowsRemoved, model.rowsMoved, model.modelReset
+
+    def _rows_moved(self, *args):
+        self.delegate._hover = self.delegate._pressed = None
+        self.viewport().update()
+
+    def leaveEvent(self, event):
+        self.delegate._hover = None
+        self.viewport().update()
+        super().leaveEvent(event)
+
+    def paintEvent(self, event):
+        if self.model() is None or self.model().rowCount() == 0:
+            painter = QPainter(self.viewport())
+            painter.setFont(_font(pixel_size=18))
+            painter.setPen(QColor("#555"))
+            painter.drawText(self.viewport().rect().adjusted(18, 38, -18, -18), Qt.AlignHCenter | Qt.AlignTop,
+                             self.delegate.card_style["empty_text"])
+            return
+        super().paintEvent(event)
+
+
+def application_list_view(scroll_area):
+    """
+    Return the ApplicationListView hosted in scroll_area, creating it on first use.
+
+    The view becomes the scroll area's (resizable) widget, so the .ui geometry and
+    styling of the scroll area are kept while the list scrolls itself.
+    """
+    view = scroll_area.widget()
+    if isinstance(view, ApplicationListView):
+        return view
+    view = ApplicationListView()
+    scroll_area.setWidgetResizable(True)
+    scroll_area.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+    scroll_area.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+    scroll_area.setWidget(view)
+    return view
+
+
+def show_applications(scroll_area, model, style, on_action):
+    """
+    Show a store-backed list model in scroll_area using the given card style.
+
+    Args:
+        scroll_area (QScrollArea): Container from the .ui (e.g. scholarscrolls, AdminArea).
+        model (ApplicationListModel): From ApplicationStore.model().
+        style (dict): pending_card_style() or reviewed_card_style(status).
+        on_action (callable): on_action(store, scholar_id, new_status).
+    """
+    view = application_list_view(scroll_area)
+    try:
+        view.delegate.action_triggered.disconnect()
+    except TypeError:
+        pass
+    view.delegate.set_style(style)
+    if view.model() is not model:
+        view.setModel(model)
+        view.scrollToTop()
+    view.delegate.action_triggered.connect(
+        lambda scholar_id, new_status: on_action(model.store, scholar_id, new_status))
+    return view
+
+
+############################### Action handlers
+def review_application(store, scholar_id, new_status):
+    """Accept/Reject from the pending list."""
+    store.set_status(scholar_id, new_status)
+
+
+def drop_application(store, scholar_id, new_status):
+    """
+    Called when admin clicks 'Drop' on an accepted scholar.
+    This safely updates DB; the store moves the row to the dropped list.
+    """
+    try:
+        ok = store.set_status(scholar_id, new_status)
+        if not ok:
+            QMessageBox.critical(None, "Error", "Failed to update database status.")
+    except Exception as e:
+        QMessageBox.critical(None, "Error", f"DB error: {e}")
@@ -0,0 +1,113 @@
+# One application-wide frame clock for chart animations.
+# Charts register a step callback instead of owning a QTimer or animation group; the clock
+# only advances widgets that are on screen and stops its timer when none of them animate.
+import weakref
+from functools import partial
+from PyQt5 import sip
+from PyQt5.QtCore import QObject, QTimer, QElapsedTimer, QEvent, Qt
+
+
+class AnimationClock(QObject):
+    """
+    Drives every registered animation from a single precise timer.
+
+    step(elapsed_ms) is called once per frame for each running animation and returns
+    True while the animation still has frames to play. Widgets that are hidden, in a
+    minimized window, scrolled out of view or completely covered are skipped, so their
+    animation resumes where it stopped when they come back. The timer runs only while
+    at least one registered widget is on screen; a Show or Paint event on a registered
+    widget (it was shown, scrolled into view or uncovered) starts it again.
+
+    With enabled False (the low render profile) start() plays the animation to its last
+    frame at once and nothing is registered.
+    """
+
+    FRAME_MS = 16
+    MAX_STEP_MS = 100  # a stalled event loop does not make animations jump to the end
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._timer = None
+        self._elapsed = QElapsedTimer()
+        self._entries = {}  # id(widget) -> (weakref to widget, weak step)
+        self._watched = set()
+        self.ticks = 0
+        self.enabled = True
+
+    def start(self, widget, step):
+        """Run step for widget on every frame until it returns False (replaces widget's current step)."""
+        key = id(widget)
+        if not self.enabled:
+            self._entries.pop(key, None)
+            while step(self.MAX_STEP_MS):
+                pass
+            return
+        if key not in self._watched:
+            self._watched.add(key)
+            widget.installEventFilter(self)
+            widget.destroyed.connect(partial(self._forget, key))
+        # Bound methods are held weakly so a registered chart can still be garbage collected
+        step_ref = weakref.WeakMethod(step) if hasattr(step, "__self__") else (lambda: step)
+        self._entries[key] = (weakref.ref(widget), step_ref)
+        self._wake()
+
+    def stop(self, widget):
+        self._entries.pop(id(widget), None)
+
+    def _forget(self, key, *_):
+        self._entries.pop(key, None)
+        self._watched.discard(key)
+
+    def is_running(self, widget):
+        return id(widget) in self._entries
+
+    @property
+    def active(self):
+        return self._timer is not None and self._timer.isActive()
+
+    ############################### Frames
+    def _wake(self):
+        if self._timer is None:
+            self._timer = QTimer(self)
+            self._timer.setTimerType(Qt.PreciseTimer)
+            self._timer.setInterval(self.FRAME_MS)
+            self._timer.timeout.connect(self.tick)
+        if not self._timer.isActive() and self._any_on_screen():
+            self._elapsed.start()
+            self._timer.start()
+
+    def _live_widgets(self):
+        for key, entry in list(self._entries.items()):
+            widget, step = entry[0](), entry[1]()
+            if widget is None or step is None or sip.isdeleted(widget):
+                self._entries.pop(key, None)
+                continue
+            yield key, entry, widget, step
+
+    def _any_on_screen(self):
+        return any(self._on_screen(widget) for _, _, widget, _ in self._live_widgets())
+
+    @staticmethod
+    def _on_screen(widget):
+        return (widget.isVisible() and not widget.window().isMinimized()
+                and not widget.visibleRegion().isEmpty())
+
+    def tick(self, elapsed_ms=None):
+        """Advance every on-screen animation by one frame."""
+        if elapsed_ms is None:
+            elapsed_ms = min(self._elapsed.restart(), self.MAX_STEP_MS) if self._elapsed.isValid() else self.FRAME_MS
+        self.ticks += 1
+        for key, entry, widget, step in self._live_widgets():
+            # a step may restart its own animation; only drop the entry it finished
+            if self._on_screen(widget) and not step(elapsed_ms) and self._entries.get(key) is entry:
+                del self._entries[key]
+        if self._timer is not None and not self._any_on_screen():
+            self._timer.stop()
+
+    def eventFilter(self, obj, event):
+        if event.type() in (QEvent.Show, QEvent.Paint) and not self.active:
+            self._wake()
+        return False
+
+
+animation_clock = AnimationClock()
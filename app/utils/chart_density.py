@@ -0,0 +1,47 @@
+# Helpers for bar charts with more groups than their width can show.
+# A chart that would draw bars narrower than its minimum keeps its top N groups, folds the
+# rest into one "Other" group, scrolls horizontally if that still does not fit, and only
+# labels every k-th group.
+import heapq
+from math import ceil
+from PyQt5.QtCore import Qt, QRectF
+from PyQt5.QtGui import QColor
+
+OTHER_LABEL = "Other ({})"
+
+
+def top_n_with_other(data, n, total, merge):
+    """
+    Keep the n groups with the largest total and fold the rest into one "Other (k)" group.
+
+    Args:
+        data (dict): {group: value}, in display order.
+        n (int): Groups to keep; None keeps all of them.
+        total (callable): value -> number used to rank the groups.
+        merge (callable): list of values -> the value of the "Other" group.
+
+    Returns:
+        dict: The kept groups in their original order, then "Other (k)".
+    """
+    if n is None or len(data) <= n:
+        return data
+    keep = set(heapq.nlargest(n, data, key=lambda group: total(data[group])))
+    shown = {group: value for group, value in data.items() if group in keep}
+    rest = [value for group, value in data.items() if group not in keep]
+    shown[OTHER_LABEL.format(len(rest))] = merge(rest)
+    return shown
+
+
+def label_stride(metrics, labels, unit, padding=8):
+    """Draw every k-th group label so that labels `unit` pixels apart do not overlap."""
+    widest = max((metrics.horizontalAdvance(str(label)) for label in labels), default=0)
+    return max(1, ceil((widest + padding) / unit)) if unit > 0 else 1
+
+
+def draw_scroll_indicator(painter, left, y, width, offset, content_width):
+    """Thin track with a thumb showing which part of content_width the plot area shows."""
+    painter.setPen(Qt.NoPen)
+    painter.setBrush(QColor(0, 0, 0, 25))
+    painter.drawRoundedRect(QRectF(left, y, width, 4), 2, 2)
+    painter.setBrush(QColor(0, 0, 0, 90))
+    painter.drawRoundedRect(QRectF(left + width * offset / content_width, y, width * width / content_width, 4), 2, 2)
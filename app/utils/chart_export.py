@@ -0,0 +1,212 @@
+# python -m app.utils.chart_export --out reports --format pdf --workers 4
+# Headless chart rendering for reports: the dashboard chart widgets drawn straight to PNG, SVG
+# or PDF on the offscreen platform plugin, on their final frame, optionally in worker processes.
+import os
+import re
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+from pathlib import Path
+from PyQt5.QtWidgets import QApplication, QWidget
+from PyQt5.QtGui import QPainter, QImage, QColor, QRegion, QPdfWriter, QPageSize
+from PyQt5.QtCore import Qt, QPoint, QRect, QRectF, QSize, QSizeF, QMarginsF
+from app.utils.BarGraph import AnimatedBarChartWidget
+from app.utils.BarGraph2 import SingleSeriesBarChartWidget
+from app.utils.DonutChart import DonutChartWidget
+from app.utils.animation_clock import animation_clock
+
+FORMATS = ("png", "svg", "pdf")
+DEFAULT_SIZE = (800, 500)
+
+_app = None
+
+
+def _application():
+    """The running QApplication, or a new one on the offscreen platform plugin."""
+    global _app
+    if QApplication.instance() is None:
+        os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+        _app = QApplication([])
+    return QApplication.instance()
+
+
+def _slug(title):
+    return re.sub(r"[^A-Za-z0-9]+", "_", str(title)).strip("_").lower() or "chart"
+
+
+############################### Single charts
+def build_chart(kind, data, title="", colors=None, size=DEFAULT_SIZE):
+    """
+    A chart widget at its final frame (no animation), ready to be rendered.
+
+    Args:
+        kind (str): "bar" ({group: {series: value}}), "single" ({category: value})
+                    or "donut" ({label: value}).
+        data (dict): As returned by the Database methods the dashboard charts use.
+        title (str): Chart title.
+        colors (list): Optional colors for "bar" and "donut" charts.
+        size (tuple): Width and height in pixels (the charts' minimum sizes still apply).
+    """
+    _application()
+    if kind == "bar":
+        chart = AnimatedBarChartWidget(data, title=title, colors=colors)
+    elif kind == "single":
+        chart = SingleSeriesBarChartWidget(data, title=title)
+    elif kind == "donut":
+        chart = DonutChartWidget(data, title=title, colors=colors)
+    else:
+        raise ValueError(f"Unknown chart kind: {kind}")
+
+    chart.resize(*size)
+    while chart.update_animation(chart.animation_duration):
+        pass
+    animation_clock.stop(chart)
+    return chart
+
+
+def _paint(chart, device, background):
+    painter = QPainter(device)
+    painter.setRenderHints(QPainter.Antialiasing | QPainter.TextAntialiasing)
+    if background:
+        painter.fillRect(QRectF(0, 0, chart.width(), chart.height()), QColor(background))
+    chart.render(painter, QPoint(), QRegion(), QWidget.DrawChildren)
+    painter.end()
+
+
+def render_chart(kind, data, path, title="", colors=None, size=DEFAULT_SIZE, scale=2, background="white"):
+    """
+    Render one chart to path; the format follows its suffix (.png, .svg or .pdf).
+
+    Args:
+        kind, data, title, colors, size: As for build_chart.
+        path (str | Path): Output file; missing directories are created.
+        scale (float): Pixel density of PNG output.
+        background (str): Fill color; None keeps PNG and SVG output transparent.
+
+    Returns:
+        Path: The written file.
+    """
+    path = Path(path)
+    fmt = path.suffix.lower().lstrip(".")
+    if fmt not in FORMATS:
+        raise ValueError(f"Unsupported chart format: {path.suffix or path.name}")
+
+    chart = build_chart(kind, data, title=title, colors=colors, size=size)
+    w, h = chart.width(), chart.height()
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    if fmt == "png":
+        image = QImage(round(w * scale), round(h * scale), QImage.Format_ARGB32_Premultiplied)
+        image.setDevicePixelRatio(scale)
+        image.fill(Qt.transparent)
+        _paint(chart, image, background)
+        if not image.save(str(path)):
+            raise OSError(f"Could not write {path}")
+
+    elif fmt == "svg":
+        from PyQt5.QtSvg import QSvgGenerator
+        generator = QSvgGenerator()
+        generator.setFileName(str(path))
+        generator.setSize(QSize(w, h))
+        generator.setViewBox(QRect(0, 0, w, h))
+        generator.setTitle(title)
+        _paint(chart, generator, background)
+
+    else:
+        writer = QPdfWriter(str(path))
+        writer.setPageSize(QPageSize(QSizeF(w, h), QPageSize.Point))
+        writer.setPageMargins(QMarginsF(0, 0, 0, 0))
+        writer.setResolution(72)  # one chart pixel per point
+        writer.setTitle(title)
+        _paint(chart, writer, background)
+
+    return path
+
+
+############################### Batches
+def _render_job(job):
+    try:
+        return render_chart(**job)
+    except Exception as e:
+        print(f"Error rendering {job.get('path')}: {e}")
+        return None
+
+
+def _init_worker():
+    os.environ["QT_QPA_PLATFORM"] = "offscreen"
+    _application()
+
+
+def render_batch(jobs, workers=None):
+    """
+    Render many charts, in parallel worker processes when workers > 1.
+
+    Workers are spawned, so a calling script needs the usual `if __name__ == "__main__":` guard.
+
+    Args:
+        jobs (list): dicts of render_chart keyword arguments.
+        workers (int): Worker processes; None uses one per CPU, 1 renders in this process.
+
+    Returns:
+        list: The written path for each job, or None where it failed.
+    """
+    jobs = list(jobs)
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(jobs) < 2:
+        _application()
+        return [_render_job(job) for job in jobs]
+
+    # Spawned, not forked: a forked copy of a process that already runs Qt is not safe to use
+    with ProcessPoolExecutor(max_workers=min(workers, len(jobs)), mp_context=get_context("spawn"),
+                             initializer=_init_worker) as pool:
+        return list(pool.map(_render_job, jobs, chunksize=max(1, len(jobs) // (workers * 4))))
+
+
+def report_jobs(db, out_dir, fmt="png"):
+    """
+    The dashboard charts plus one chart per municipality and per scholarship, as render_batch jobs.
+
+    Args:
+        db: The Database (app.database.database.database).
+        out_dir (str | Path): Directory the files go to, named after the chart titles.
+        fmt (str): One of FORMATS.
+    """
+    out_dir = Path(out_dir)
+    jobs = []
+
+    def add(kind, data, title, **options):
+        if data:
+            jobs.append(dict(kind=kind, data=data, title=title, path=out_dir / f"{_slug(title)}.{fmt}", **options))
+
+    counts, _, by_municipality = db.get_all_scholars()
+    program_counts, _, programs_by_municipality = db.get_scholarship_program_stats()
+
+    add("donut", counts, "ALL SCHOLARS")
+    add("bar", by_municipality, "MUNICIPALITY", colors=["#E74C3C", "#2ECC71"])
+    add("bar", programs_by_municipality, "ACCOUNTS PER MUNICIPALITY")
+    add("single", program_counts, "SCHOLARSHIPS")
+    for municipality, programs in programs_by_municipality.items():
+        add("single", programs, f"{municipality} SCHOLARSHIPS")
+    for scholarship in program_counts:
+        add("single", db.filter_by_scholarship(scholarship), f"{scholarship} BY COLLEGE")
+    return jobs
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Render the dashboard charts to files without opening the application.")
+    parser.add_argument("--out", default="reports", help="Output directory (default: reports).")
+    parser.add_argument("--format", choices=FORMATS, default="png", help="File format (default: png).")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="Worker processes (default: one per CPU; 1 renders in this process).")
+    args = parser.parse_args(argv)
+
+    from app.database.database import database
+    jobs = report_jobs(database, args.out, args.format)
+    written = render_batch(jobs, workers=args.workers)
+    failed = written.count(None)
+    print(f"Done: {len(written) - failed} of {len(jobs)} charts written to {args.out}"
+          + (f", {failed} failed." if failed else "."))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+# Offscreen layer for the parts of a chart that do not move (title, grid, axis labels, legend).
+# Animation ticks and hover moves only composite this pixmap and repaint the bars or slices.
+from PyQt5.QtCore import Qt
+from PyQt5.QtGui import QPainter, QPixmap, QPaintEngine
+from app.utils.render_profile import render_profile
+
+
+class StaticLayer:
+    """
+    Cached QPixmap of a chart's static elements.
+
+    render(painter) draws them in widget coordinates. The pixmap is rebuilt on first use
+    after invalidate() (data or title changed), or when the widget size or the pixel scale
+    of the target (device pixel ratio, or an export rendered at a higher resolution) no
+    longer matches the one it was rendered for. Vector targets (SVG, PDF) are drawn directly.
+    """
+
+    def __init__(self, widget, render):
+        self.widget = widget
+        self.render = render
+        self._pixmap = None
+        self._key = None
+        self.renders = 0
+
+    def invalidate(self):
+        self._pixmap = None
+
+    def pixmap(self, dpr=None):
+        widget = self.widget
+        dpr = dpr or widget.devicePixelRatioF()
+        key = (widget.width(), widget.height(), dpr, render_profile.antialiasing)
+        if self._pixmap is None or self._key != key:
+            pixmap = QPixmap(max(1, round(widget.width() * dpr)), max(1, round(widget.height() * dpr)))
+            pixmap.setDevicePixelRatio(dpr)
+            pixmap.fill(Qt.transparent)
+            painter = QPainter(pixmap)
+            painter.setRenderHints(render_profile.render_hints())
+            self.render(painter)
+            painter.end()
+            self._pixmap, self._key = pixmap, key
+            self.renders += 1
+        return self._pixmap
+
+    def draw(self, painter):
+        if painter.paintEngine().type() != QPaintEngine.Raster:
+            painter.save()
+            self.render(painter)
+            painter.restore()
+            return
+        painter.drawPixmap(0, 0, self.pixmap(painter.deviceTransform().m11()))
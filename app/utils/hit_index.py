@@ -0,0 +1,27 @@
+# Sorted interval lookup for chart hover hit-testing.
+# Charts build one index per layout (size + data) and query it on every mouse move in O(log n).
+from bisect import bisect_left
+
+
+class IntervalIndex:
+    """
+    Non-overlapping closed intervals [start, end] sorted by position, each carrying an item.
+
+    Neighbouring intervals may share an endpoint; candidates() then yields both, in order.
+    """
+
+    def __init__(self, intervals=()):
+        intervals = sorted(intervals, key=lambda interval: interval[0])
+        self.starts = [start for start, _, _ in intervals]
+        self.ends = [end for _, end, _ in intervals]
+        self.items = [item for _, _, item in intervals]
+
+    def __len__(self):
+        return len(self.items)
+
+    def candidates(self, x):
+        """Items whose interval contains x."""
+        i = bisect_left(self.ends, x)
+        while i < len(self.items) and self.starts[i] <= x:
+            yield self.items[i]
+            i += 1
@@ -0,0 +1,105 @@
+from io import BytesIO
+from pathlib import Path
+from PIL import Image, ImageOps, UnidentifiedImageError
+
+# Largest on-screen use is the 300px application-form photo; keep 2x for HiDPI screens.
+PROFILE_PHOTO_MAX_SIDE = 600
+PROFILE_PHOTO_QUALITY = 85
+PROFILE_PHOTO_MIN_QUALITY = 50
+PROFILE_PHOTO_BUDGET = 150 * 1024
+# Transparent photos that still miss the budget at this size are stored anyway
+PROFILE_PHOTO_MIN_SIDE = 64
+
+
+def _has_alpha(image):
+    if image.mode in ("RGBA", "LA"):
+        return image.getchannel("A").getextrema()[0] < 255
+    if image.mode == "P" and "transparency" in image.info:
+        return True
+    return False
+
+
+def normalize_profile_photo(image: Image.Image, max_side=PROFILE_PHOTO_MAX_SIDE) -> Image.Image:
+    """
+    Apply EXIF orientation, drop metadata and cap the longest side to max_side.
+
+    Returns a new RGB (or RGBA when the photo has real transparency) image.
+    """
+    image = ImageOps.exif_transpose(image)
+    keep_alpha = _has_alpha(image)
+    image = image.convert("RGBA" if keep_alpha else "RGB")
+    image.thumbnail((max_side, max_side), Image.LANCZOS)
+
+    # Rebuild from raw pixels so no EXIF/ICC/text chunks survive into the blob
+    clean = Image.new(image.mode, image.size)
+    clean.paste(image)
+    return clean
+
+
+def encode_profile_photo(image: Image.Image, quality=PROFILE_PHOTO_QUALITY,
+                         budget=PROFILE_PHOTO_BUDGET, min_quality=PROFILE_PHOTO_MIN_QUALITY) -> bytes:
+    """
+    Encode an already normalized image, lowering JPEG quality until it fits the byte budget.
+
+    Transparent photos are stored as optimized PNG since JPEG cannot keep the alpha channel;
+    PNG has no quality knob, so they are downscaled instead until they fit.
+    """
+    buffer = BytesIO()
+    if image.mode == "RGBA":
+        while True:
+            buffer.seek(0)
+            buffer.truncate()
+            image.save(buffer, format="PNG", optimize=True)
+            if buffer.tell() <= budget or max(image.size) <= PROFILE_PHOTO_MIN_SIDE:
+                return buffer.getvalue()
+            # PNG size follows the pixel count: shrink both sides by about the square root of the overshoot
+            scale = min(0.9, max(0.5, (budget / buffer.tell()) ** 0.5))
+            image = image.resize((max(1, round(image.width * scale)), max(1, round(image.height * scale))),
+                                 Image.LANCZOS)
+
+    while True:
+        buffer.seek(0)
+        buffer.truncate()
+        image.save(buffer, format="JPEG", quality=quality, optimize=True, progressive=True)
+        if buffer.tell() <= budget or quality <= min_quality:
+            return buffer.getvalue()
+        quality = max(min_quality, quality - 10)
+
+
+def needs_ingest(blob, max_side=PROFILE_PHOTO_MAX_SIDE, budget=PROFILE_PHOTO_BUDGET) -> bool:
+    """Return True if a stored blob is over budget or larger than max_side (reads the header only)."""
+    if len(blob) > budget:
+        return True
+    try:
+        with Image.open(BytesIO(blob)) as image:
+            return max(image.size) > max_side
+    except (UnidentifiedImageError, OSError):
+        return False
+
+
+def prepare_profile_photo(source, max_side=PROFILE_PHOTO_MAX_SIDE, quality=PROFILE_PHOTO_QUALITY,
+                          budget=PROFILE_PHOTO_BUDGET) -> bytes:
+    """
+    Run the ingest pipeline on a file path or raw image bytes.
+
+    Args:
+        source (str | Path | bytes): Picked file or an existing blob.
+        max_side (int): Longest side in pixels after downscaling.
+        quality (int): Starting JPEG quality.
+        budget (int): Target size in bytes; quality is lowered until the blob fits.
+
+    Returns:
+        bytes: The recompressed photo, or b'' if the source is not a readable image.
+    """
+    try:
+        if isinstance(source, (bytes, bytearray, memoryview)):
+            image = Image.open(BytesIO(source))
+        else:
+            image = Image.open(Path(source))
+        with image:
+            image.load()
+            normalized = normalize_profile_photo(image, max_side)
+        return encode_profile_photo(normalized, quality, budget)
+    except (UnidentifiedImageError, OSError, ValueError) as e:
+        print(f"Error processing profile photo: {e}")
+        return b''
@@ -0,0 +1,176 @@
+import itertools
+from PyQt5.QtCore import (QObject, QRunnable, QThreadPool, QByteArray, QBuffer, QIODevice, QSize, Qt,
+                          pyqtSignal, pyqtSlot)
+from PyQt5.QtGui import QImage, QImageReader, QPainter, QBrush, QPixmap
+from app.utils.pixmap_cache import pixmap_cache
+
+
+def decode_image(source, size=None, aspect_mode=Qt.KeepAspectRatio, shape="plain"):
+    """
+    Decode an image file or blob at (close to) the target size. Safe to call off the GUI thread.
+
+    Args:
+        source (str | bytes | bytearray | memoryview): File path or image data.
+        size (tuple): Target (width, height); None decodes at the natural size.
+        aspect_mode (Qt.AspectRatioMode): How the image is fitted into size.
+        shape (str): "plain", or "circle" to clip the result to a circle.
+
+    Returns:
+        QImage: The decoded image (null if the source could not be read).
+    """
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        # Wraps the blob's own memory (no copy); source outlives the reader
+        buffer = QBuffer()
+        buffer.setData(QByteArray.fromRawData(source))
+        buffer.open(QIODevice.ReadOnly)
+        reader = QImageReader(buffer)
+    else:
+        reader = QImageReader(str(source))
+    reader.setAutoTransform(True)
+
+    target = QSize(*size) if size else QSize()
+    original = reader.size()
+    if target.isValid() and original.isValid():
+        # Let the codec decode straight to the needed resolution (JPEG does this in the DCT)
+        decode_size = original.scaled(target, aspect_mode)
+        if decode_size.width() < original.width():
+            reader.setScaledSize(decode_size)
+
+    image = reader.read()
+    if image.isNull():
+        return image
+
+    if target.isValid():
+        image = image.scaled(target, aspect_mode, Qt.SmoothTransformation)
+
+    if shape == "circle":
+        side = min(image.width(), image.height())
+        rounded = QImage(side, side, QImage.Format_ARGB32_Premultiplied)
+        rounded.fill(Qt.transparent)
+        painter = QPainter(rounded)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setBrush(QBrush(image))
+        painter.setPen(Qt.NoPen)
+        painter.drawEllipse(0, 0, side, side)
+        painter.end()
+        image = rounded
+
+    return image
+
+
+class _DecodeSignals(QObject):
+    finished = pyqtSignal(int, QImage)
+
+
+class _DecodeTask(QRunnable):
+    def __init__(self, request_id, source, size, aspect_mode, shape):
+        super().__init__()
+        self.request_id = request_id
+        self.source = source
+        self.size = size
+        self.aspect_mode = aspect_mode
+        self.shape = shape
+        self.cancelled = False
+        self.signals = _DecodeSignals()
+
+    def run(self):
+        if self.cancelled:
+            return
+        image = decode_image(self.source, self.size, self.aspect_mode, self.shape)
+        if not self.cancelled:
+            self.signals.finished.emit(self.request_id, image)
+
+
+class AsyncImageLoader(QObject):
+    """
+    Decodes and scales images on a QThreadPool and hands the result back on the GUI thread.
+
+    Each target widget has at most one live request: a newer load() for the same
+    target cancels the older one, and destroying the target cancels its request.
+    Finished images are converted to QPixmap on the GUI thread and stored in the
+    application pixmap cache when a cache_key is given.
+
+    Decoding runs on a pool of its own: Qt hands smooth-scaling segments to the
+    global pool, and a Python task waiting for the GIL there can block the GUI thread.
+    """
+
+    def __init__(self, thread_pool=None, parent=None):
+        super().__init__(parent)
+        if thread_pool is None:
+            thread_pool = QThreadPool(self)
+            thread_pool.setMaxThreadCount(2)
+        self.thread_pool = thread_pool
+        self._ids = itertools.count(1)
+        self._tasks = {}  # request id -> (task, target key, on_ready, cache_key)
+        self._current = {}  # target key -> request id
+        self._watched = set()
+
+    def load(self, target, source, size, on_ready, aspect_mode=Qt.KeepAspectRatio, shape="plain",
+             cache_key=None, placeholder=None):
+        """
+        Request an image for target; on_ready(QPixmap) is called on the GUI thread.
+
+        Args:
+            target (QObject): Widget the image is for; used for supersede/cancel bookkeeping.
+            source (str | bytes | memoryview): File path or image data.
+            size (tuple): Target (width, height) or None.
+            on_ready (callable): Receives the finished QPixmap (and the placeholder, if any).
+            cache_key (tuple): Pixmap cache key; a cached pixmap is delivered synchronously.
+            placeholder (QPixmap): Shown through on_ready until the real image is ready.
+        """
+        target_key = id(target)
+        self.cancel(target)
+
+        if cache_key is not None:
+            cached = pixmap_cache.get(cache_key)
+            if cached is not None:
+                on_ready(cached)
+                return
+
+        if placeholder is not None:
+            on_ready(placeholder)
+
+        if target_key not in self._watched:
+            self._watched.add(target_key)
+            target.destroyed.connect(lambda *_, key=target_key: self._forget_target(key))
+
+        request_id = next(self._ids)
+        task = _DecodeTask(request_id, source, size, aspect_mode, shape)
+        task.signals.finished.connect(self._on_finished)
+        self._tasks[request_id] = (task, target_key, on_ready, cache_key)
+        self._current[target_key] = request_id
+        self.thread_pool.start(task)
+
+    def cancel(self, target):
+        self._cancel_key(id(target))
+
+    def _cancel_key(self, target_key):
+        request_id = self._current.pop(target_key, None)
+        entry = self._tasks.pop(request_id, None)
+        if entry:
+            entry[0].cancelled = True
+
+    def _forget_target(self, target_key):
+        self._cancel_key(target_key)
+        self._watched.discard(target_key)
+
+    @pyqtSlot(int, QImage)
+    def _on_finished(self, request_id, image):
+        entry = self._tasks.pop(request_id, None)
+        if entry is None:
+            return  # superseded or target destroyed
+        task, target_key, on_ready, cache_key = entry
+        if self._current.get(target_key) == request_id:
+            del self._current[target_key]
+
+        if image.isNull():
+            print("Error: Invalid image or file path.")
+            return
+
+        pixmap = QPixmap.fromImage(image)
+        if cache_key is not None:
+            pixmap_cache.put(cache_key, pixmap)
+        on_ready(pixmap)
+
+
+image_loader = AsyncImageLoader()
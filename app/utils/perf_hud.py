@@ -0,0 +1,254 @@
+# Live performance overlay for support sessions ("the dashboard is slow").
+# Ctrl+Shift+F12 in the MainWindow shows frame times, event-loop latency, chart paint times,
+# the last Database calls, cache hit rates and the live widget count. The instrumentation is
+# patched in when the HUD is shown and taken out when it is hidden, so it costs nothing while off.
+import threading
+import weakref
+from collections import deque
+from functools import wraps
+from time import perf_counter
+from PyQt5.QtCore import Qt, QObject, QEvent, QTimer, QElapsedTimer, QRectF
+from PyQt5.QtGui import QColor, QFont, QFontMetrics, QKeySequence, QPainter
+from PyQt5.QtWidgets import QApplication, QWidget, QShortcut
+from app.database.database import Database, database
+from app.utils.pixmap_cache import pixmap_cache
+from app.utils.BarGraph import AnimatedBarChartWidget
+from app.utils.BarGraph2 import SingleSeriesBarChartWidget
+from app.utils.DonutChart import DonutChartWidget
+
+HUD_SHORTCUT = "Ctrl+Shift+F12"
+CHART_CLASSES = (AnimatedBarChartWidget, SingleSeriesBarChartWidget, DonutChartWidget)
+# Database methods that are plumbing rather than calls worth listing
+_UNTIMED = {"connect", "close", "setup_paths", "add_change_listener", "remove_change_listener"}
+
+
+class PerfMonitor(QObject):
+    """
+    Collects the HUD's numbers between start(window) and stop().
+
+    Frames are timed by handling the window's UpdateRequest inside an event filter, chart
+    paints by wrapping the chart classes' paintEvent, Database calls by wrapping the shared
+    instance's public methods; event-loop latency is how late a 100 ms timer fires.
+    """
+
+    FRAMES = 60
+    DB_CALLS = 8
+    LAG_INTERVAL_MS = 100
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.active = False
+        self.frame_ms = deque(maxlen=self.FRAMES)
+        self.lag_ms = deque(maxlen=self.FRAMES)
+        self.db_calls = deque(maxlen=self.DB_CALLS)  # (method, ms, on GUI thread)
+        self.chart_paints = {}  # id(chart) -> [weakref, label, paints, last ms, total ms, layer renders at start]
+        self._window = None
+        self._restore = []  # (owner, name, original or None) for every patched attribute
+        self._cache_start = (0, 0)
+        self._lag_clock = QElapsedTimer()
+        self._lag_timer = QTimer(self)
+        self._lag_timer.setTimerType(Qt.PreciseTimer)
+        self._lag_timer.setInterval(self.LAG_INTERVAL_MS)
+        self._lag_timer.timeout.connect(self._on_lag_tick)
+
+    ############################### Install / remove
+    def start(self, window):
+        if self.active:
+            return
+        self.active = True
+        self._window = window
+        for samples in (self.frame_ms, self.lag_ms, self.db_calls):
+            samples.clear()
+        self.chart_paints.clear()
+        self._cache_start = (pixmap_cache.hits, pixmap_cache.misses)
+
+        window.installEventFilter(self)
+        for cls in CHART_CLASSES:
+            self._patch(cls, "paintEvent", self._timed_paint(cls.paintEvent))
+        db = database.get() if hasattr(database, "get") else database
+        for name, method in vars(Database).items():
+            if callable(method) and not name.startswith("_") and name not in _UNTIMED:
+                self._patch(db, name, self._timed_call(name, getattr(db, name)))
+        self._lag_clock.start()
+        self._lag_timer.start()
+
+    def stop(self):
+        if not self.active:
+            return
+        self.active = False
+        self._lag_timer.stop()
+        if self._window is not None:
+            self._window.removeEventFilter(self)
+            self._window = None
+        for owner, name, original in reversed(self._restore):
+            if original is None:
+                delattr(owner, name)
+            else:
+                setattr(owner, name, original)
+        self._restore.clear()
+
+    def _patch(self, owner, name, replacement):
+        self._restore.append((owner, name, vars(owner).get(name)))
+        setattr(owner, name, replacement)
+
+    ############################### Probes
+    def _timed_paint(self, original):
+        monitor = self
+
+        @wraps(original)
+        def paintEvent(widget, event):
+            started = perf_counter()
+            original(widget, event)
+            monitor._record_paint(widget, (perf_counter() - started) * 1000)
+        return paintEvent
+
+    def _record_paint(self, widget, ms):
+        entry = self.chart_paints.get(id(widget))
+        if entry is None or entry[0]() is not widget:
+            layer = getattr(widget, "_static_layer", None)
+            label = getattr(widget, "title", "") or type(widget).__name__
+            entry = self.chart_paints[id(widget)] = [weakref.ref(widget), label, 0, 0.0, 0.0,
+                                                     layer.renders if layer else 0]
+        entry[2] += 1
+        entry[3] = ms
+        entry[4] += ms
+
+    def _timed_call(self, name, method):
+        calls = self.db_calls
+
+        @wraps(method)
+        def timed(*args, **kwargs):
+            started = perf_counter()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                calls.append((name, (perf_counter() - started) * 1000,
+                              threading.current_thread() is threading.main_thread()))
+        return timed
+
+    def eventFilter(self, obj, event):
+        if obj is self._window and event.type() == QEvent.UpdateRequest:
+            # Deliver the event here so the whole repaint of the window is timed
+            started = perf_counter()
+            obj.event(event)
+            self.frame_ms.append((perf_counter() - started) * 1000)
+            return True
+        return False
+
+    def _on_lag_tick(self):
+        self.lag_ms.append(max(0, self._lag_clock.restart() - self.LAG_INTERVAL_MS))
+
+    ############################### Report
+    def report(self):
+        """The HUD text, one line per entry."""
+        lines = [
+            f"frame    {_avg(self.frame_ms):6.1f} ms avg {_max(self.frame_ms):6.1f} max  ({len(self.frame_ms)})",
+            f"loop lag {_avg(self.lag_ms):6.1f} ms avg {_max(self.lag_ms):6.1f} max",
+            f"widgets  {len(QApplication.allWidgets())}",
+        ]
+        first_window_ms = getattr(QApplication.instance(), "first_window_ms", None)  # set by ApplicationManager
+        if first_window_ms is not None:
+            lines.append(f"startup  {first_window_ms:6.0f} ms to the login window")
+        hits, misses = pixmap_cache.hits - self._cache_start[0], pixmap_cache.misses - self._cache_start[1]
+        lines.append(f"pixmaps  {_rate(hits, hits + misses)} of {hits + misses} lookups, "
+                     f"{pixmap_cache.used_bytes / 1048576:.1f} MB")
+
+        lines.append("charts")
+        for key, (ref, label, paints, last, total, renders) in list(self.chart_paints.items()):
+            widget = ref()
+            if widget is None:
+                del self.chart_paints[key]
+                continue
+            layer = getattr(widget, "_static_layer", None)
+            layer_hits = paints - (layer.renders - renders) if layer else 0
+            lines.append(f"  {label[:30]:30} {last:5.1f} ms  avg {total / paints:5.1f}  x{paints}"
+                         f"  layer {_rate(layer_hits, paints)}")
+
+        lines.append("database")
+        for name, ms, on_gui in reversed(self.db_calls):
+            lines.append(f"  {name[:30]:30} {ms:6.1f} ms{'' if on_gui else '  (worker)'}")
+        return lines
+
+
+def _avg(samples):
+    return sum(samples) / len(samples) if samples else 0.0
+
+
+def _max(samples):
+    return max(samples, default=0.0)
+
+
+def _rate(hits, total):
+    return f"{100 * hits / total:3.0f}%" if total else "  -"
+
+
+class PerfHud(QWidget):
+    """Translucent panel in the top-right corner of window; ignores the mouse."""
+
+    REFRESH_MS = 500
+    MARGIN = 12
+
+    def __init__(self, window, monitor=None):
+        super().__init__(window)
+        self.window_ = window
+        self.monitor = monitor or PerfMonitor(self)
+        self.lines = []
+        self.font = QFont("Consolas", 9)
+        self.font.setStyleHint(QFont.Monospace)
+        self.setAttribute(Qt.WA_TransparentForMouseEvents)
+        self.setFocusPolicy(Qt.NoFocus)
+        self.hide()
+
+        self._timer = QTimer(self)
+        self._timer.setInterval(self.REFRESH_MS)
+        self._timer.timeout.connect(self.refresh)
+
+    def toggle(self):
+        if self.isVisible():
+            self._timer.stop()
+            self.window_.removeEventFilter(self)
+            self.monitor.stop()
+            self.hide()
+        else:
+            self.monitor.start(self.window_)
+            self.window_.installEventFilter(self)
+            self.refresh()
+            self.show()
+            self.raise_()
+            self._timer.start()
+
+    def refresh(self):
+        self.lines = self.monitor.report()
+        metrics = QFontMetrics(self.font)
+        width = max(metrics.horizontalAdvance(line) for line in self.lines) + 2 * self.MARGIN
+        height = metrics.lineSpacing() * len(self.lines) + 2 * self.MARGIN
+        self.setGeometry(self.window_.width() - width - self.MARGIN, self.MARGIN, width, height)
+        self.raise_()
+        self.update()
+
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.Resize:
+            self.refresh()
+        return False
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(QColor(0, 0, 0, 190))
+        painter.drawRoundedRect(QRectF(self.rect()), 8, 8)
+        painter.setFont(self.font)
+        painter.setPen(QColor("#b7f7c8"))
+        metrics = QFontMetrics(self.font)
+        y = self.MARGIN + metrics.ascent()
+        for line in self.lines:
+            painter.drawText(self.MARGIN, y, line)
+            y += metrics.lineSpacing()
+        painter.end()
+
+
+def install_perf_hud(window, shortcut=HUD_SHORTCUT):
+    """Attach a hidden PerfHud to window, toggled by shortcut; returns the HUD."""
+    hud = PerfHud(window)
+    QShortcut(QKeySequence(shortcut), window, hud.toggle)
+    return hud
@@ -0,0 +1,93 @@
+import hashlib
+from collections import OrderedDict
+from PyQt5.QtCore import Qt
+from PyQt5.QtGui import QPixmap
+
+
+class PixmapCache:
+    """
+    Application-wide LRU cache of decoded pixmaps with a byte budget.
+
+    Keys are (source, size, shape) tuples where source is a resource path or the
+    content hash of an image blob, size is (width, height) or None for the natural
+    size, and shape names the post-processing applied (e.g. "plain", "circle").
+    """
+
+    def __init__(self, budget_bytes=32 * 1024 * 1024):
+        self.budget_bytes = budget_bytes
+        self._entries = OrderedDict()
+        self._used_bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _cost(pixmap):
+        if pixmap is None or pixmap.isNull():
+            return 0
+        return pixmap.width() * pixmap.height() * max(1, pixmap.depth() // 8)
+
+    @property
+    def used_bytes(self):
+        return self._used_bytes
+
+    def get(self, key):
+        pixmap = self._entries.get(key)
+        if pixmap is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._entries.move_to_end(key)
+        return pixmap
+
+    def put(self, key, pixmap):
+        if key in self._entries:
+            self._used_bytes -= self._cost(self._entries.pop(key))
+
+        cost = self._cost(pixmap)
+        if cost > self.budget_bytes:
+            return pixmap
+
+        self._entries[key] = pixmap
+        self._used_bytes += cost
+        while self._used_bytes > self.budget_bytes and self._entries:
+            _, evicted = self._entries.popitem(last=False)
+            self._used_bytes -= self._cost(evicted)
+        return pixmap
+
+    def get_or_create(self, key, factory):
+        pixmap = self.get(key)
+        if pixmap is None:
+            pixmap = factory()
+            if pixmap is not None:
+                self.put(key, pixmap)
+        return pixmap
+
+    def clear(self):
+        self._entries.clear()
+        self._used_bytes = 0
+
+
+pixmap_cache = PixmapCache()
+
+
+def blob_key(blob):
+    """Stable content hash used to key decoded image blobs."""
+    return hashlib.blake2b(blob, digest_size=16).hexdigest()
+
+
+def resource_pixmap(path, size=None):
+    """
+    Return a cached QPixmap for a file or Qt resource path (e.g. ":/images/bcd.png").
+
+    Args:
+        path (str): File or resource path.
+        size (tuple): Optional (width, height) to scale to, keeping aspect ratio.
+    """
+    def load():
+        pixmap = QPixmap(path)
+        if size and not pixmap.isNull():
+            pixmap = pixmap.scaled(size[0], size[1], Qt.KeepAspectRatio, Qt.SmoothTransformation)
+        return pixmap
+
+    return pixmap_cache.get_or_create((path, size, "plain"), load)
+
@@ -0,0 +1,125 @@
+# Coalesced, cancellable refreshes for views backed by database aggregates.
+# A burst of requests for the same view (both toggled signals of one radio click, a double
+# click on refresh, a tab switch during a refresh) runs its query once, off the GUI thread,
+# and only the newest result is applied.
+import itertools
+from PyQt5.QtCore import QObject, QRunnable, QThreadPool, QTimer, pyqtSignal, pyqtSlot
+from app.database.database import cancellable
+
+
+class _QuerySignals(QObject):
+    finished = pyqtSignal(int, object)
+
+
+class _QueryTask(QRunnable):
+    def __init__(self, request_id, query):
+        super().__init__()
+        self.request_id = request_id
+        self.query = query
+        self.cancelled = False
+        self.signals = _QuerySignals()
+
+    def run(self):
+        if self.cancelled:
+            return
+        try:
+            # A superseded task stops inside SQLite instead of finishing a query nobody will see
+            with cancellable(lambda: self.cancelled):
+                result = self.query()
+        except Exception as e:
+            if not self.cancelled:
+                print(f"Error running refresh query: {e}")
+            return
+        if not self.cancelled:
+            self.signals.finished.emit(self.request_id, result)
+
+
+class RefreshScheduler(QObject):
+    """
+    Runs refresh queries by key: at most one pending and one current request per key.
+
+    request() (re)starts the key's debounce timer, so the query of the last request in a
+    burst runs once the burst settles: on the next event-loop turn with delay_ms 0, or
+    after delay_ms without further requests. A newer request also cancels the key's
+    running query; its result is dropped even if it finishes. apply(result) is called
+    on the GUI thread with the newest result only.
+
+    Queries run one at a time on a pool of their own, like the image loader's decodes.
+    """
+
+    def __init__(self, thread_pool=None, parent=None):
+        super().__init__(parent)
+        if thread_pool is None:
+            thread_pool = QThreadPool(self)
+            thread_pool.setMaxThreadCount(1)
+        self.thread_pool = thread_pool
+        self._ids = itertools.count(1)
+        self._pending = {}  # key -> (query, apply)
+        self._timers = {}  # key -> debounce QTimer
+        self._running = {}  # key -> (request id, task, apply)
+        self.started = 0
+        self.dropped = 0
+
+    def request(self, key, query, apply, delay_ms=0):
+        """
+        Schedule query() for key; supersedes every earlier request for key.
+
+        Args:
+            key (str): The view being refreshed.
+            query (callable): Runs on a worker thread; must not touch widgets.
+            apply (callable): Receives the query result on the GUI thread.
+            delay_ms (int): Debounce window; 0 coalesces the requests of one event-loop turn.
+        """
+        self._cancel_running(key)
+        self._pending[key] = (query, apply)
+        timer = self._timers.get(key)
+        if timer is None:
+            timer = self._timers[key] = QTimer(self)
+            timer.setSingleShot(True)
+            timer.timeout.connect(lambda key=key: self._start(key))
+        timer.start(delay_ms)
+
+    def cancel(self, key=None):
+        """Drop the pending and running requests for key (all keys when None)."""
+        for key in ([key] if key is not None else list(self._timers)):
+            if key in self._timers:
+                self._timers[key].stop()
+            self._pending.pop(key, None)
+            self._cancel_running(key)
+
+    def is_busy(self, key):
+        return key in self._pending or key in self._running
+
+    def flush(self, key=None):
+        """Start pending requests now instead of when their timers fire."""
+        for key in ([key] if key is not None else list(self._pending)):
+            if key in self._pending:
+                self._timers[key].stop()
+                self._start(key)
+
+    def _cancel_running(self, key):
+        entry = self._running.pop(key, None)
+        if entry:
+            entry[1].cancelled = True
+            self.dropped += 1
+
+    def _start(self, key):
+        entry = self._pending.pop(key, None)
+        if entry is None:
+            return
+        query, apply = entry
+        request_id = next(self._ids)
+        task = _QueryTask(request_id, query)
+        task.signals.finished.connect(self._on_finished)
+        self._running[key] = (request_id, task, apply)
+        self.started += 1
+        self.thread_pool.start(task)
+
+    @pyqtSlot(int, object)
+    def _on_finished(self, request_id, result):
+        for key, (current_id, _, apply) in list(self._running.items()):
+            if current_id == request_id:
+                del self._running[key]
+                apply(result)
+                return
+        # superseded or cancelled: a newer request owns the key
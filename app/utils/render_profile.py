@@ -0,0 +1,139 @@
+# Rendering profile: how much visual polish the machine can afford.
+# "normal" draws everything; "low" is for old lab PCs and turns off drop shadows, hover
+# shadows, chart animations and antialiased shapes. Chosen once at startup from
+# $BCD_RENDER_PROFILE, or from a short paint benchmark when it is unset or "auto".
+# python -m app.utils.render_profile [--profile auto] prints what was picked and what both profiles cost.
+import argparse
+import os
+import time
+from statistics import median
+from PyQt5.QtCore import Qt, QRectF
+from PyQt5.QtGui import QColor, QFont, QImage, QPainter, QPen
+from PyQt5.QtWidgets import QApplication
+from app.utils.animation_clock import animation_clock
+from app.utils.shadow import draw_shadow
+
+RENDER_PROFILE_ENV = "BCD_RENDER_PROFILE"
+
+PROFILES = {
+    "normal": dict(shadows=True, hover_effects=True, animations=True, antialiasing=True),
+    "low": dict(shadows=False, hover_effects=False, animations=False, antialiasing=False),
+}
+
+
+class RenderProfile:
+    """
+    The active profile; widgets read its flags when they build shadows or start painting.
+
+    Attributes:
+        shadows (bool): Cached drop shadows behind cards, charts and list rows.
+        hover_effects (bool): HoverShadow effects on line edits, buttons and combo boxes.
+        animations (bool): Chart animations; off, charts jump straight to their last frame.
+        antialiasing (bool): Antialiased shapes in charts and list rows (text stays antialiased).
+    """
+
+    LOW_END_FRAME_MS = 4.0  # benchmark frames slower than this select the low profile (~0.8 ms on a current desktop)
+    BENCHMARK_FRAMES = 5
+
+    def __init__(self):
+        self.name = None
+        self.frame_ms = {}  # profile name -> benchmark frame time, once measured
+        self.select("normal")
+
+    def select(self, name):
+        if name not in PROFILES:
+            raise ValueError(f"Unknown render profile: {name} (expected one of {', '.join(PROFILES)})")
+        self.name = name
+        for flag, value in PROFILES[name].items():
+            setattr(self, flag, value)
+        animation_clock.enabled = self.animations
+
+    def configure(self, setting=None):
+        """
+        Select the profile named by setting (default $BCD_RENDER_PROFILE), or benchmark
+        the machine when it is unset or "auto". Call before the windows are built.
+
+        Returns:
+            str: The selected profile name.
+        """
+        setting = (setting or os.environ.get(RENDER_PROFILE_ENV) or "auto").strip().lower()
+        if setting == "auto":
+            setting = "low" if self.benchmark("normal") > self.LOW_END_FRAME_MS else "normal"
+        self.select(setting)
+        return self.name
+
+    def render_hints(self):
+        """Hints for a painter drawing chart or list shapes under this profile."""
+        if self.antialiasing:
+            return QPainter.Antialiasing | QPainter.TextAntialiasing
+        return QPainter.TextAntialiasing
+
+    ############################### Benchmark
+    def benchmark(self, name):
+        """Median time (ms) to paint a dashboard-like frame with the given profile's settings."""
+        options = PROFILES[name]
+        image = QImage(480, 320, QImage.Format_ARGB32_Premultiplied)
+        times = []
+        for _ in range(self.BENCHMARK_FRAMES + 1):  # the first frame also blurs the shadow patch
+            started = time.perf_counter()
+            _paint_sample_frame(image, **options)
+            times.append((time.perf_counter() - started) * 1000)
+        self.frame_ms[name] = median(times[1:])
+        return self.frame_ms[name]
+
+    def report(self):
+        """One line with the active profile and the frame times of both profiles."""
+        for name in PROFILES:
+            if name not in self.frame_ms:
+                self.benchmark(name)
+        normal, low = self.frame_ms["normal"], self.frame_ms["low"]
+        return (f"Render profile: {self.name} (benchmark frame {normal:.1f} ms normal, {low:.1f} ms low, "
+                f"{normal - low:+.1f} ms)")
+
+
+def _paint_sample_frame(image, shadows, antialiasing, **_):
+    # A card with a drop shadow, a bar chart and a donut: what a dashboard repaint costs
+    image.fill(QColor("#dbefe1"))
+    painter = QPainter(image)
+    painter.setRenderHints(QPainter.Antialiasing | QPainter.TextAntialiasing if antialiasing
+                           else QPainter.TextAntialiasing)
+    card = QRectF(40, 30, 400, 260)
+    if shadows:
+        draw_shadow(painter, card, 18, 50, QColor(0, 0, 0, 180))
+    painter.setPen(Qt.NoPen)
+    painter.setBrush(Qt.white)
+    painter.drawRoundedRect(card, 18, 18)
+
+    painter.setBrush(QColor("#2ECC71"))
+    for i in range(40):
+        height = 20 + (i * 37) % 150
+        painter.drawRoundedRect(QRectF(60 + i * 5, 270 - height, 4, height), 2, 2)
+
+    for i, color in enumerate(("#E74C3C", "#2ECC71", "#3498DB", "#F1C40F", "#9B59B6", "#1ABC9C")):
+        painter.setPen(QPen(QColor(color), 28, Qt.SolidLine, Qt.FlatCap))
+        painter.drawArc(QRectF(290, 90, 120, 120), i * 960, 900)
+
+    painter.setPen(Qt.black)
+    painter.setFont(QFont("Arial", 10))
+    for i in range(8):
+        painter.drawText(QRectF(60 + i * 25, 275, 25, 14), Qt.AlignCenter, f"T{i}")
+    painter.end()
+
+
+render_profile = RenderProfile()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark both render profiles and show which one this machine gets.")
+    parser.add_argument("--profile", default=None,
+                        help=f"Setting to resolve: normal, low or auto (default: ${RENDER_PROFILE_ENV}, else auto).")
+    args = parser.parse_args(argv)
+
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    app = QApplication.instance() or QApplication([])  # the shadow patch is blurred with a widget effect
+    render_profile.configure(args.profile)
+    print(render_profile.report())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,209 @@
+# Drop shadows painted from cached nine-patch pixmaps.
+# A QGraphicsDropShadowEffect re-renders the widget offscreen and blurs it on every repaint
+# of anything inside it (a chart frame, a hover); here the blur runs once per
+# (radius, blur, color) and each shadow is nine pixmap blits.
+import re
+from PyQt5.QtCore import Qt, QObject, QEvent, QRectF, QPointF
+from PyQt5.QtGui import QColor, QImage, QPainter, QPainterPath, QPen, QPixmap
+from PyQt5.QtWidgets import QWidget, QGraphicsScene, QGraphicsPathItem, QGraphicsDropShadowEffect
+from app.utils.pixmap_cache import pixmap_cache
+
+
+############################### Nine-patch
+def shadow_patch(radius, blur, color):
+    """
+    Return (pixmap, corner) for a rounded-rect shadow.
+
+    The patch is a (2 * corner + 1) square: corners hold the full blur falloff around a
+    rounded corner, the middle row/column is constant and is stretched to any size.
+    It is blurred by QGraphicsDropShadowEffect itself so it matches the old look.
+    """
+    radius, blur = max(0, int(round(radius))), max(0, int(round(blur)))
+    color = QColor(color)
+    key = ("shadow", (radius, blur, color.rgba()), "ninepatch")
+    corner = radius + 2 * blur
+    cached = pixmap_cache.get(key)
+    if cached is not None:
+        return cached, corner
+
+    side = 2 * (radius + blur) + 1
+    path = QPainterPath()
+    path.addRoundedRect(QRectF(0, 0, side, side), radius, radius)
+    item = QGraphicsPathItem(path)
+    item.setBrush(Qt.black)
+    item.setPen(QPen(Qt.NoPen))
+
+    # Cast the shadow beside its source and keep only the shadow half; the effect needs
+    # its source on the paint device, so both are rendered
+    shift = side + 2 * blur + 1
+    effect = QGraphicsDropShadowEffect()
+    effect.setBlurRadius(blur)
+    effect.setColor(color)
+    effect.setOffset(shift, 0)
+    item.setGraphicsEffect(effect)
+
+    scene = QGraphicsScene()
+    scene.addItem(item)
+    patch_side = side + 2 * blur
+    source = QRectF(-blur, -blur, shift + patch_side, patch_side)
+    image = QImage(int(source.width()), patch_side, QImage.Format_ARGB32_Premultiplied)
+    image.fill(Qt.transparent)
+    painter = QPainter(image)
+    painter.setRenderHint(QPainter.Antialiasing)
+    scene.render(painter, QRectF(image.rect()), source)
+    painter.end()
+    image = image.copy(shift, 0, patch_side, patch_side)
+
+    pixmap = QPixmap.fromImage(image)
+    pixmap_cache.put(key, pixmap)
+    return pixmap, corner
+
+
+def draw_shadow(painter, rect, radius, blur, color, offset=(0, 0)):
+    """
+    Paint the shadow a QGraphicsDropShadowEffect would cast for a rounded rect.
+
+    Args:
+        painter (QPainter): Active painter.
+        rect (QRect | QRectF): The shape casting the shadow.
+        radius (float): Corner radius of the shape.
+        blur (float): Blur radius, as in QGraphicsDropShadowEffect.setBlurRadius.
+        color (QColor): Shadow color (alpha included).
+        offset (tuple): Shadow (x, y) offset.
+    """
+    pixmap, corner = shadow_patch(radius, blur, color)
+    blur = max(0, int(round(blur)))
+    outer = QRectF(rect).translated(*offset).adjusted(-blur, -blur, blur, blur)
+    if outer.isEmpty():
+        return
+
+    # Small shapes: shrink the corners so they never overlap
+    cx = min(corner, outer.width() / 2)
+    cy = min(corner, outer.height() / 2)
+    side = pixmap.width()
+    xs = ((outer.left(), cx, 0, cx), (outer.left() + cx, outer.width() - 2 * cx, corner, 1),
+          (outer.right() - cx, cx, side - cx, cx))
+    ys = ((outer.top(), cy, 0, cy), (outer.top() + cy, outer.height() - 2 * cy, corner, 1),
+          (outer.bottom() - cy, cy, side - cy, cy))
+    for x, w, sx, sw in xs:
+        for y, h, sy, sh in ys:
+            if w > 0 and h > 0:
+                painter.drawPixmap(QRectF(x, y, w, h), pixmap, QRectF(sx, sy, sw, sh))
+
+
+############################### Widget shadows
+_RULE = re.compile(r"([^{}]*)\{([^{}]*)\}")
+_RADIUS = re.compile(r"border-radius\s*:\s*([\d.]+)px")
+
+
+def border_radius(widget):
+    """
+    Corner radius a widget gets from its stylesheets (0 when none is found).
+
+    Looks at the widget's own sheet (bare declarations or #name rules) and then at
+    #name rules in its ancestors' sheets, which is where the .ui files put them.
+    """
+    name = widget.objectName()
+    owner = widget
+    while owner is not None:
+        sheet = owner.styleSheet() or ""
+        if owner is widget and "{" not in sheet:
+            match = _RADIUS.search(sheet)
+            if match:
+                return float(match.group(1))
+        for selectors, body in _RULE.findall(re.sub(r"/\*.*?\*/", "", sheet, flags=re.S)):
+            match = _RADIUS.search(body)
+            if not match:
+                continue
+            for selector in selectors.split(","):
+                selector = selector.strip()
+                if name and re.fullmatch(rf"(\w+)?#{re.escape(name)}", selector):
+                    return float(match.group(1))
+                if owner is widget and not name and selector in ("", "*", type(widget).__name__):
+                    return float(match.group(1))
+        owner = owner.parentWidget()
+    return 0.0
+
+
+class _Underlay(QWidget):
+    """Sibling painted right below the target; never takes input or focus."""
+
+    def __init__(self, radius, blur, color, parent):
+        super().__init__(parent)
+        self.radius, self.blur, self.color = radius, blur, color
+        self.hole = QRectF()  # target rect in local coordinates
+        self.setAttribute(Qt.WA_TransparentForMouseEvents)
+        self.setAttribute(Qt.WA_NoSystemBackground)
+        self.setFocusPolicy(Qt.NoFocus)
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        # Nothing is painted under the target itself: the effect's shadow never showed
+        # through translucent widgets or images with transparent areas
+        area, hole = QPainterPath(), QPainterPath()
+        area.addRect(QRectF(self.rect()))
+        hole.addRoundedRect(self.hole.adjusted(1, 1, -1, -1), self.radius, self.radius)
+        painter.setClipPath(area.subtracted(hole))
+        m = self.blur
+        draw_shadow(painter, QRectF(self.rect()).adjusted(m, m, -m, -m), self.radius, self.blur, self.color)
+        painter.end()
+
+
+class CachedShadow(QObject):
+    """
+    Drop shadow for a widget, painted from a cached nine-patch by an underlay sibling.
+
+    The underlay follows the target's geometry, visibility and stacking through an event
+    filter, so the shadow is only repainted when the target moves or resizes; repaints
+    inside the target no longer re-blur anything. Owned by the target.
+    """
+
+    _TRACKED = (QEvent.Move, QEvent.Resize, QEvent.Show, QEvent.Hide, QEvent.ParentChange, QEvent.ZOrderChange)
+
+    def __init__(self, widget, blur=50, offset=(0, 20), color=QColor(0, 0, 0, 180), radius=None):
+        super().__init__(widget)
+        self.widget = widget
+        self.blur = max(0, int(round(blur)))
+        self.offset = QPointF(*offset).toPoint()
+        self.color = QColor(color)
+        self.radius = border_radius(widget) if radius is None else radius
+        self.underlay = None
+
+        if widget.graphicsEffect() is not None:
+            widget.setGraphicsEffect(None)
+        widget.installEventFilter(self)
+        self.sync()
+
+    def eventFilter(self, obj, event):
+        if obj is self.widget and event.type() in self._TRACKED:
+            self.sync(restack=event.type() in (QEvent.Show, QEvent.ParentChange, QEvent.ZOrderChange))
+        return False
+
+    def sync(self, restack=True):
+        parent = self.widget.parentWidget()
+        if parent is None:
+            if self.underlay is not None:
+                self.underlay.hide()
+            return
+        if self.underlay is None:
+            self.underlay = _Underlay(self.radius, self.blur, self.color, parent)
+            self.widget.destroyed.connect(self.underlay.deleteLater)
+        elif self.underlay.parentWidget() is not parent:
+            self.underlay.setParent(parent)
+            restack = True
+
+        m = self.blur
+        target = self.widget.geometry()
+        self.underlay.setGeometry(target.translated(self.offset).adjusted(-m, -m, m, m))
+        self.underlay.hole = QRectF(target.translated(-self.underlay.pos()))
+        if restack:
+            self.underlay.stackUnder(self.widget)
+        self.underlay.setVisible(not self.widget.isHidden())
+
+    def remove(self):
+        """Take the shadow off the widget."""
+        self.widget.removeEventFilter(self)
+        if self.underlay is not None:
+            self.underlay.deleteLater()
+            self.underlay = None
+        self.deleteLater()
@@ -0,0 +1,88 @@
+# Application-wide stylesheet for widgets built in code (cards, pills, list views).
+# Installed once on the QApplication; widgets pick rules up through object names and
+# switch appearance through dynamic properties instead of carrying their own sheets.
+from PyQt5.QtWidgets import QApplication
+
+THEME_QSS = """
+/* ---------- Student scholarship status cards (display_scholarships_util) ---------- */
+QFrame#status_card {
+    background: white;
+    border: 1.5px solid #74c69d;
+    padding: 10px;
+}
+QFrame#status_card QLabel#name_label {
+    color: black;
+    font-weight: 600;
+    font-size: 16px;
+    padding-left: 10px;
+}
+QFrame#status_card QLabel#info_label {
+    color: black;
+    font-weight: 400;
+    font-size: 12px;
+    padding-left: 10px;
+}
+QFrame#status_card QLabel#status_pill {
+    background-color: #f44336;
+    color: white;
+    font-weight: 700;
+    font-size: 14px;
+    border-radius: 20px;
+    padding: 6px 15px;
+    max-width: 150px;
+    max-height: 50px;
+}
+QFrame#status_card QLabel#status_pill[status="PENDING"] { background-color: #2196f3; }
+QFrame#status_card QLabel#status_pill[status="ACCEPTED"] { background-color: #4caf50; }
+
+/* ---------- Admin application lists (admin_list.py) ---------- */
+QListView#application_list {
+    background: transparent;
+    border: none;
+}
+"""
+
+
+def install_theme(app=None):
+    """
+    Append THEME_QSS to the application stylesheet (once per QApplication).
+
+    Safe to call from any builder that relies on the theme; later calls are no-ops.
+    """
+    app = app or QApplication.instance()
+    if app is None or app.property("theme_installed"):
+        return
+    app.setStyleSheet((app.styleSheet() or "") + THEME_QSS)
+    app.setProperty("theme_installed", True)
+
+
+def apply_theme(container):
+    """
+    Scope THEME_QSS to a container that sits under a .ui stylesheet.
+
+    Qt prefers the closest ancestor's stylesheet over the application one regardless of
+    selector specificity (MainWindow's "QScrollArea QWidget { background-color:
+    transparent; }" on stacks would win), so list containers inside the .ui get the
+    theme appended once to their own sheet. Cards added later need no sheet of their own.
+    """
+    if container.property("theme_applied"):
+        return
+    container.setStyleSheet((container.styleSheet() or "") + THEME_QSS)
+    container.setProperty("theme_applied", True)
+
+
+def set_state(widget, name, value):
+    """
+    Set a dynamic property used by a theme selector (e.g. [status="ACCEPTED"]).
+
+    Qt only re-evaluates property selectors on polish, so an already shown widget is
+    re-polished when the value actually changes.
+    """
+    if widget.property(name) == value:
+        return
+    widget.setProperty(name, value)
+    if widget.isVisible():
+        style = widget.style()
+        style.unpolish(widget)
+        style.polish(widget)
+        widget.update()
@@ -0,0 +1,84 @@
+import hashlib
+import importlib.util
+import os
+from pathlib import Path
+from PyQt5 import uic
+
+UI_CACHE_DIR = Path(__file__).resolve().parents[1] / "assets" / "__uicache__"
+
+# (ui path, source hash) -> generated Ui_* form class, kept for the life of the process
+_form_classes = {}
+_unusable = set()
+
+
+def _source_hash(ui_path):
+    return hashlib.sha1(ui_path.read_bytes()).hexdigest()[:16]
+
+
+def _module_path(ui_path, digest):
+    return UI_CACHE_DIR / f"ui_{ui_path.stem}_{digest}.py"
+
+
+def _import_form_class(ui_path, module_path):
+    spec = importlib.util.spec_from_file_location(f"app.assets.__uicache__.{module_path.stem}", module_path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return next(getattr(module, name) for name in vars(module) if name.startswith("Ui_"))
+
+
+def compile_ui(ui_path, module_path):
+    """
+    Compile a .ui file to a Python module next to the other cached forms.
+
+    Older modules compiled from a previous version of the same .ui are removed.
+    Resource imports are generated as 'from app.assets import res_rc'.
+    """
+    try:
+        UI_CACHE_DIR.mkdir(exist_ok=True)
+        tmp_path = module_path.with_suffix(".tmp")
+        with open(ui_path, "r", encoding="utf-8") as ui_file, open(tmp_path, "w", encoding="utf-8") as py_file:
+            uic.compileUi(ui_file, py_file, from_imports=True, import_from="app.assets")
+        os.replace(tmp_path, module_path)
+
+        for stale in UI_CACHE_DIR.glob(f"ui_{ui_path.stem}_*.py"):
+            if stale != module_path:
+                stale.unlink()
+    except Exception as e:
+        print(f"Warning: Could not compile {ui_path.name}: {e}")
+
+
+def load_ui(ui_path, baseinstance):
+    """
+    Drop-in replacement for uic.loadUi(ui_path, baseinstance).
+
+    The .ui file is compiled to a Python module keyed by its content hash on first
+    use; later constructions import that module (once per process) and run its
+    setupUi instead of parsing the XML again. When the .ui has changed since it was
+    compiled, or the compiled module cannot be used, this falls back to uic.loadUi
+    and recompiles for the next run.
+    """
+    ui_path = Path(ui_path)
+    digest = _source_hash(ui_path)
+    key = (str(ui_path), digest)
+    module_path = _module_path(ui_path, digest)
+
+    form_class = _form_classes.get(key)
+    if form_class is None and key not in _unusable and module_path.exists():
+        try:
+            form_class = _form_classes[key] = _import_form_class(ui_path, module_path)
+        except Exception as e:
+            _unusable.add(key)
+            print(f"Warning: Compiled form for {ui_path.name} is unusable, using loadUi: {e}")
+
+    if form_class is not None:
+        form = form_class()
+        form.setupUi(baseinstance)
+        # loadUi exposes every named widget on the base instance; do the same
+        for name, value in vars(form).items():
+            setattr(baseinstance, name, value)
+        return baseinstance
+
+    uic.loadUi(str(ui_path), baseinstance)
+    if not module_path.exists():
+        compile_ui(ui_path, module_path)
+    return baseinstance
@@ -6,7 +6,7 @@ from PyQt5.QtCore import QObject, QEvent, Qt
 from PyQt5.QtGui import QFont, QFontDatabase, QColor, QRegion, QPixmap
 from PyQt5.QtWidgets import (QLabel, QGraphicsDropShadowEffect, QLineEdit, QPushButton, QComboBox, QGraphicsOpacityEffect)
 from PyQt5.QtWidgets import QLabel, QFileDialog
-from PyQt5.QtGui import QPixmap, QRegion, QImage, QPainter, QBrush
+from PyQt5.QtGui import QPixmap, QRegion, QImage, QPainter, QBrush, QImageReader
 from PyQt5.QtCore import Qt, QSize
 from PyQt5.QtWidgets import QWidget
 from PyQt5 import QtWidgets, QtCore
@@ -14,6 +14,12 @@ from PyQt5.QtWidgets import QLabel
 from PyQt5.QtCore import QTimer
 from PyQt5.QtWidgets import QVBoxLayout
 from app.assets import res_rc
+from app.utils.pixmap_cache import resource_pixmap
+from app.utils.image_loader import image_loader
+from app.utils.theme import apply_theme, set_state
+from app.utils.admin_list import application_store, show_applications, pending_card_style, review_application
+from app.utils.shadow import CachedShadow
+from app.utils.render_profile import render_profile
 
 def add_chart_to_dashboard(container_widget, chart_widget, start_animation=True, delay=100):
     """
@@ -25,8 +31,8 @@ def add_chart_to_dashboard(container_widget, chart_widget, start_animation=True,
         start_animation (bool): Whether to start the chart's animation automatically (if it has one).
         delay (int): Delay in milliseconds before starting animation.
     """
-    # Ensure the container has a layout
-    if not container_widget.layout():
+    # Ensure the container has a layout (an empty QLayout is falsy, so compare with None)
+    if container_widget.layout() is None:
         container_widget.setLayout(QVBoxLayout())
 
     layout = container_widget.layout()
@@ -45,222 +51,16 @@ def add_chart_to_dashboard(container_widget, chart_widget, start_animation=True,
         QTimer.singleShot(delay, chart_widget.start_animation)
 
 def display_scholarships_admin(scroll_area, database):
-    scroll_content = scroll_area.widget()
-    scroll_layout = scroll_content.layout()
-
-    if scroll_layout is None:
-        scroll_layout = QtWidgets.QVBoxLayout(scroll_content)
-        scroll_content.setLayout(scroll_layout)
-
-    scroll_layout.setSpacing(15)
-    scroll_layout.setContentsMargins(0, 20, 0, 20)
-    scroll_layout.setAlignment(QtCore.Qt.AlignTop)
-
-    # Clear previous items
-    while scroll_layout.count():
-        item = scroll_layout.takeAt(0)
-        widget = item.widget()
-        if widget:
-            widget.deleteLater()
+    """Show pending applications (anything not yet ACCEPTED/REJECTED) with Accept/Reject actions."""
+    store = application_store(database)
+    store.ensure_loaded()
+    show_applications(scroll_area, store.model("PENDING"), pending_card_style(), review_application)
 
-    scholarships = database.get_user_info_for_admin()
-
-    # Filter pending scholarships
-    pending_scholarships = [rec for rec in scholarships if rec[11] not in ("ACCEPTED", "REJECTED")]
-
-    # Stylesheet
-    qss = """
-        QScrollArea {
-            background: transparent;
-            border: none;
-        }
-
-        QScrollArea > QWidget {
-            background: transparent;
-            border: none;
-        }
-    
-        QFrame#scholarship_card {
-            background-color: rgba(255, 255, 255, 220);
-            border-radius: 15px;
-            border: 1px solid rgba(200,200,200,0.5);
-        }
-        QLabel#scholarship_name {
-            font-weight: 700;
-            font-size: 16px;
-            color: #1f3a5f;
-        }
-        QLabel#id_label {
-            font-size: 14px;
-            color: #555;
-        }
-        QLabel#name_label {
-            font-weight: 600;
-            font-size: 18px;
-            color: #334e68;
-        }
-        QLabel#detail_label {
-            font-weight: 500;
-            font-size: 14px;
-            color: #586c87;
-        }
-        QLabel#status_label {
-            font-weight: 700;
-            font-size: 16px;
-            color: white;
-            border-radius: 10px;
-            padding: 8px 12px;
-            min-width: 100px;
-            text-align: center;
-        }
-        QPushButton#accept_btn {
-            background-color: #4CAF50;
-            color: white;
-            font-weight: 600;
-            border-radius: 10px;
-            padding: 8px 16px;
-        }
-        QPushButton#accept_btn:hover { background-color: #388E3C; }
-        QPushButton#reject_btn {
-            background-color: #FF5252;
-            color: white;
-            font-weight: 600;
-            border-radius: 10px;
-            padding: 8px 16px;
-        }
-        QPushButton#reject_btn:hover { background-color: #D32F2F; }
-    """
-    scroll_area.setStyleSheet(qss)
-
-    def add_empty_message():
-        lbl = QtWidgets.QLabel("No pending scholarship applications found.")
-        lbl.setAlignment(QtCore.Qt.AlignCenter)
-        lbl.setStyleSheet("font-size: 18px; color: #555;")
-        scroll_layout.addWidget(lbl)
-
-    if pending_scholarships:
-        for record in pending_scholarships:
-            (scholar_id, username, first_name, last_name, middle_name, email,
-             municipality, college, program, year_level, scholar_name,
-             status, gwa, suffix) = record
-
-            # Card container
-            container = QtWidgets.QFrame()
-            container.setObjectName("scholarship_card")
-            container.setFixedHeight(220)
-            container.setFixedWidth(900)
-
-            # Apply shadow
-            DesignShadow(container, 25, (0,0), QColor(0,0,0,80))
-
-            # Main layout
-            main_layout = QtWidgets.QHBoxLayout(container)
-            main_layout.setContentsMargins(20, 20, 20, 20)
-            main_layout.setSpacing(30)
-
-            # Left Info
-            info_layout = QtWidgets.QVBoxLayout()
-            info_layout.setSpacing(5)
-            info_layout.setAlignment(QtCore.Qt.AlignTop)
-
-            # Title + ID
-            title_layout = QtWidgets.QHBoxLayout()
-            scholarship_label = QtWidgets.QLabel(f"{scholar_name}")
-            scholarship_label.setObjectName("scholarship_name")
-            id_label = QtWidgets.QLabel(f"(ID: {scholar_id})")
-            id_label.setObjectName("id_label")
-            title_layout.addWidget(scholarship_label)
-            title_layout.addWidget(id_label)
-            title_layout.addStretch()
-            info_layout.addLayout(title_layout)
-
-            # Full Name
-            full_name = f"{first_name} {middle_name} {last_name} {suffix}".strip()
-            name_label = QtWidgets.QLabel(full_name)
-            name_label.setObjectName("name_label")
-            info_layout.addWidget(name_label)
-
-            # Details grid
-            details_grid = QtWidgets.QGridLayout()
-            details_grid.setSpacing(3)
-            details_data = [
-                ("Municipality:", municipality),
-                ("College:", college),
-                ("Program:", program),
-                ("Year Level:", year_level),
-                ("GWA:", gwa)
-            ]
-            for i, (key, value) in enumerate(details_data):
-                key_lbl = QtWidgets.QLabel(key)
-                key_lbl.setStyleSheet("font-weight: 600; font-size: 14px;")
-                value_lbl = QtWidgets.QLabel(str(value))
-                value_lbl.setObjectName("detail_label")
-                details_grid.addWidget(key_lbl, i, 0)
-                details_grid.addWidget(value_lbl, i, 1)
-            info_layout.addLayout(details_grid)
-            info_layout.addStretch()
-            main_layout.addLayout(info_layout, 2)
-
-            # Right layout (status + buttons)
-            right_layout = QtWidgets.QVBoxLayout()
-            right_layout.setSpacing(10)
-            right_layout.setAlignment(QtCore.Qt.AlignTop | QtCore.Qt.AlignRight)
-
-            status_label = QtWidgets.QLabel(status.upper())
-            status_label.setObjectName("status_label")
-            status_label.setAlignment(QtCore.Qt.AlignCenter)
-            status_color = "#2196F3"
-            status_label.setStyleSheet(f"QLabel#status_label {{ background-color: {status_color}; }}")
-
-            # Action buttons
-            action_layout = QtWidgets.QHBoxLayout()
-            action_layout.setSpacing(8)
-            accept_btn = QtWidgets.QPushButton("Accept")
-            accept_btn.setObjectName("accept_btn")
-            reject_btn = QtWidgets.QPushButton("Reject")
-            reject_btn.setObjectName("reject_btn")
-            action_layout.addWidget(status_label, 1)
-            action_layout.addWidget(accept_btn, 1)
-            action_layout.addWidget(reject_btn, 1)
-
-            right_layout.addLayout(action_layout)
-            right_layout.addStretch()
-            main_layout.addLayout(right_layout, 3)
-
-            # Handler function
-            def make_handler(scholar_id, container, new_status):
-                def handler():
-                    database.update_scholarship_status(scholar_id, new_status)
-                    container.setParent(None)
-                    container.deleteLater()
-                    scroll_content.adjustSize()
-                    scroll_area.ensureVisible(0, 0)
-                    scroll_area.repaint()
-
-                    if scroll_layout.count() == 0:
-                        add_empty_message()
-                return handler
-
-            accept_btn.clicked.connect(make_handler(scholar_id, container, "ACCEPTED"))
-            reject_btn.clicked.connect(make_handler(scholar_id, container, "REJECTED"))
-
-            # Center card
-            centering_layout = QtWidgets.QHBoxLayout()
-            centering_layout.addStretch()
-            centering_layout.addWidget(container)
-            centering_layout.addStretch()
-            scroll_layout.addLayout(centering_layout)
-
-    else:
-        add_empty_message()
-
-    scroll_content.adjustSize()
-    scroll_area.ensureVisible(0, 0)
-    scroll_area.repaint()
 
 def display_scholarships_util(username, scroll_area, database):
 
     scroll_content = scroll_area.widget()
+    apply_theme(scroll_content)
     scroll_layout = scroll_content.layout()
 
     if scroll_layout is None:
@@ -283,43 +83,9 @@ def display_scholarships_util(username, scroll_area, database):
         for scholarname, status in scholarships:
             # Container card
             container = QtWidgets.QFrame()
-            container.setObjectName("container")
+            container.setObjectName("status_card")
             container.setFixedHeight(150)
 
-            container.setStyleSheet("""
-                #container {
-                    background: white;
-                    border: 1.5px solid #74c69d;
-                    padding: 10px;
-                }
-
-                QLabel#name_label {
-                    color: black;
-                    font-weight: 600;
-                    font-size: 16px;
-                    padding-left: 10px;
-                }
-                
-                QLabel#info_label {
-                    color: black;
-                    font-weight: 400;
-                    font-size: 12px;
-                    padding-left: 10px;
-                }
-
-                QLabel#status_label {
-                    background-color: #5bc26a;
-                    color: white;
-                    font-weight: 700;
-                    font-size: 14px;
-                    border-radius: 20px;
-                    padding: 8px 20px;
-                    max-width: 150px;
-                    max-height: 50px;
-                    text-align: center;
-                }
-            """)
-
             layout = QtWidgets.QHBoxLayout(container)
             layout.setContentsMargins(20, 20, 20, 20)
 
@@ -331,11 +97,11 @@ def display_scholarships_util(username, scroll_area, database):
             logo.setScaledContents(True)
 
             if scholarname == "BSU FINANCIAL ASSISTANCE":
-                logo.setPixmap(QPixmap(":/images/bsutrans.png"))
+                logo.setPixmap(resource_pixmap(":/images/bsutrans.png"))
             elif scholarname == "BCD SCHOLARSHIP":
-                logo.setPixmap(QPixmap(":/images/altlogo.png"))
+                logo.setPixmap(resource_pixmap(":/images/altlogo.png"))
             elif scholarname == "DSWD EDUCATIONAL ASSISTANCE":
-                logo.setPixmap(QPixmap(":/images/educ.png"))
+                logo.setPixmap(resource_pixmap(":/images/educ.png"))
 
             name_label = QLabel(scholarname)
             name_label.setObjectName("name_label")
@@ -343,19 +109,11 @@ def display_scholarships_util(username, scroll_area, database):
             info_label = QLabel("Amount - Php. 7,000.00\nDeadline - 23/11/26")
             info_label.setObjectName("info_label")
 
+            # Colour comes from the theme's [status=...] selector
             status_label = QLabel(status)
-            status_label.setObjectName("status_label")
+            status_label.setObjectName("status_pill")
             status_label.setAlignment(QtCore.Qt.AlignCenter)
-
-            status_color = (
-                "#2196f3" if status == "PENDING"
-                else "#4caf50" if status == "ACCEPTED"
-                else "#f44336"
-            )
-
-            status_label.setStyleSheet(
-                f"background-color: {status_color}; color: white; border-radius: 20px; padding: 6px 15px;"
-            )
+            set_state(status_label, "status", status)
 
             vlayout.addWidget(name_label)
             vlayout.addWidget(info_label)
@@ -377,42 +135,6 @@ def display_scholarships_util(username, scroll_area, database):
     scroll_area.ensureVisible(0, 0)
     scroll_area.repaint()
 
-def get_rounded_stretched_pixmap(blob, width, height):
-    """
-    Convert an image blob to a rounded (circular) pixmap that stretches to fit the label.
-
-    Args:
-        blob (bytes): Image data.
-        width (int): Width of the target QLabel.
-        height (int): Height of the target QLabel.
-
-    Returns:
-        QPixmap: Rounded, stretched pixmap.
-    """
-    if not blob:
-        return None
-
-    # Convert blob to QPixmap
-    image = QImage.fromData(blob)
-    pixmap = QPixmap.fromImage(image)
-
-    # Stretch the pixmap to fit the label
-    pixmap = pixmap.scaled(width, height, Qt.IgnoreAspectRatio, Qt.SmoothTransformation)
-
-    # Make a rounded mask
-    size = min(width, height)
-    rounded = QPixmap(size, size)
-    rounded.fill(Qt.transparent)
-
-    painter = QPainter(rounded)
-    painter.setRenderHint(QPainter.Antialiasing)
-    painter.setBrush(QBrush(pixmap))
-    painter.setPen(Qt.NoPen)
-    painter.drawEllipse(0, 0, size, size)
-    painter.end()
-
-    return rounded
-
 class setup_profile(QLabel):
     def __init__(self, target_label: QLabel, default_path: str, parent=None):
         # ✔ Correct super() — pass parent properly
@@ -463,9 +185,7 @@ class setup_profile(QLabel):
         return self._current_path
 
     def _set_profile_photo_internal(self, image_path: str):
-        pixmap = QPixmap(image_path)
-
-        if pixmap.isNull():
+        if not QImageReader(image_path).canRead():
             print("Error: Invalid image or file path.")
             return
 
@@ -483,14 +203,11 @@ class setup_profile(QLabel):
 
         radius = size // 2
 
-        # ✔ FIX: Prevent weird stretching — always expand then crop
-        scaled_pixmap = pixmap.scaled(
-            label_size,
-            Qt.KeepAspectRatioByExpanding,
-            Qt.SmoothTransformation
+        # ✔ FIX: Prevent weird stretching — always expand then crop (decoded off the GUI thread)
+        image_loader.load(
+            self.label, image_path, (label_size.width(), label_size.height()), self.label.setPixmap,
+            aspect_mode=Qt.KeepAspectRatioByExpanding
         )
-
-        self.label.setPixmap(scaled_pixmap)
         self.label.setAlignment(Qt.AlignCenter)
 
         self.label.setStyleSheet(f"""
@@ -553,17 +270,10 @@ class MyWindow(QtWidgets.QDialog):
         self._drag_pos = None
 
 class DesignShadow:
-    def __init__(self, widget, blur=50, offset=(0, 20), color=QColor(0, 0, 0, 180)):
-        # QGraphicsDropShadowEffect requires the parent or widget for context
-        shadow = QGraphicsDropShadowEffect(widget)
-
-        # Set the permanent shadow properties
-        shadow.setBlurRadius(blur)
-        shadow.setOffset(*offset)
-        shadow.setColor(color)
-
-        # Apply the permanent effect
-        widget.setGraphicsEffect(shadow)
+    def __init__(self, widget, blur=50, offset=(0, 20), color=QColor(0, 0, 0, 180), radius=None):
+        # Permanent shadow painted from a cached nine-patch behind the widget; the corner
+        # radius is taken from the widget's stylesheet unless given. None in the low render profile
+        self.shadow = CachedShadow(widget, blur, offset, color, radius) if render_profile.shadows else None
 
 class HoverShadow(QObject):
     def __init__(self, lineedit: QLineEdit, blur=25, offset_x=0, offset_y=0, color=QColor(0, 0, 0, 160)):
@@ -575,6 +285,10 @@ class HoverShadow(QObject):
         self.target_offset_y = offset_y
         self.target_color = color
 
+        # The effect re-renders the widget offscreen on every repaint; the low render profile goes without
+        self.shadow = None
+        if not render_profile.hover_effects:
+            return
         self.shadow = QGraphicsDropShadowEffect()
 
         self.shadow.setBlurRadius(0)
@@ -604,23 +318,38 @@ class HoverShadow(QObject):
 
         return False
 
-def load_font(font_path, size=12, bold=False):
+# Process-wide font registry: each TTF is registered once, QFonts are handed out per (family, size, weight)
+_font_families = {}
+_font_cache = {}
+
+def register_font(font_path):
+    """Register a TTF with QFontDatabase once per process and return its family names."""
     font_path = Path(font_path).resolve()
+    families = _font_families.get(font_path)
+    if families is not None:
+        return families
+
     if not font_path.exists():
         print(f"⚠️ Font not found: {font_path}")
-        return QFont()
+        return []
 
     font_id = QFontDatabase.addApplicationFont(str(font_path))
-    families = QFontDatabase.applicationFontFamilies(font_id)
+    families = QFontDatabase.applicationFontFamilies(font_id) if font_id != -1 else []
+    _font_families[font_path] = families
+    return families
+
+def load_font(font_path, size=12, bold=False):
+    families = register_font(font_path)
     if not families:
         return QFont()
 
-    font = QFont(families[0], size)
-    if bold:
-        font.setWeight(QFont.Weight.Bold)
-    else:
-        font.setWeight(QFont.Weight.Normal)
-    return font
+    weight = QFont.Weight.Bold if bold else QFont.Weight.Normal
+    key = (families[0], size, weight)
+    font = _font_cache.get(key)
+    if font is None:
+        font = _font_cache[key] = QFont(families[0], size)
+        font.setWeight(weight)
+    return QFont(font)
 
 def opac(self, label, opacity_value):
     opacity_effect = QGraphicsOpacityEffect()
@@ -1,13 +1,24 @@
+import time
+STARTED_AT = time.perf_counter()  # before the GUI imports, so they count toward startup time
+
+from PyQt5.QtCore import QTimer
 from PyQt5.QtWidgets import QApplication
 from app.gui.login_window import LogandSign
 from app.gui.Fillup import FillupWindow
 from app.gui.MainWindow import MainWindow
 from app.gui.update import updateWindow
+from app.database.database import database
+from app.utils.theme import install_theme
+from app.utils.render_profile import render_profile
 
 
 class ApplicationManager(QApplication):
     def __init__(self, argv):
         super().__init__(argv)
+        install_theme(self)
+        # Shadows, hover effects, animations and antialiasing are decided before any window is built
+        # (python -m app.utils.render_profile benchmarks both profiles on demand)
+        render_profile.configure()
 
         self.logandsign = LogandSign(app_manager=self)
 
@@ -15,10 +26,37 @@ class ApplicationManager(QApplication):
         self.mainwindow = None
         self.updatewindow = None # Initialize the update window attribute
         self.current_main_window = None
+        self.first_window_ms = None
+
+        # Builds the MainWindow in idle slices while the login screen waits for input
+        self._prewarm_timer = QTimer(self)
+        self._prewarm_timer.setInterval(0)
+        self._prewarm_timer.timeout.connect(self._prewarm_step)
 
 
     def start(self):
         self._show_window(self.logandsign)
+        # Runs once the login window has been painted
+        QTimer.singleShot(0, self._after_first_frame)
+
+    def _after_first_frame(self):
+        self.first_window_ms = (time.perf_counter() - STARTED_AT) * 1000  # shown in the perf HUD
+
+        # Open/create the database off the GUI thread, then build the MainWindow in idle slices
+        database.warm_up()
+        self.prewarm_mainwindow()
+
+
+    # ----------------- PRE-WARM MAIN WINDOW -----------------
+    def prewarm_mainwindow(self):
+        """Start constructing the user-independent parts of MainWindow in idle time."""
+        if not self.mainwindow:
+            self.mainwindow = MainWindow(app_manager=self, prewarm=True)
+        self._prewarm_timer.start()
+
+    def _prewarm_step(self):
+        if not self.mainwindow.run_prewarm_step():
+            self._prewarm_timer.stop()
 
 
     # ----------------- LOGIN → FILLUP WINDOW -----------------
@@ -44,7 +82,14 @@ class ApplicationManager(QApplication):
     # ----------------- LOGIN/UPDATE → MAIN WINDOW -----------------
     def show_mainwindow(self, username):
         """Primary method to show the main application window."""
-        self.mainwindow = MainWindow(username=username, app_manager=self)
+        if self.mainwindow and not self.mainwindow.is_reusable():
+            self.mainwindow.deleteLater()
+            self.mainwindow = None
+        if not self.mainwindow:
+            self.mainwindow = MainWindow(app_manager=self, prewarm=True)
+        # Finish whatever the idle pre-warm has not built yet, then bind only the user data
+        self._prewarm_timer.stop()
+        self.mainwindow.bind_user(username)
         self._show_window(self.mainwindow, maximized=True)
         # Assuming the caller (login or update) will handle its own closure
         if self.logandsign.isVisible():
@@ -0,0 +1,161 @@
+# pytest -v tests/test_admin_list.py
+import sys
+from pathlib import Path
+import pytest
+from PyQt5.QtWidgets import QApplication, QScrollArea
+from PyQt5.QtCore import Qt
+from PyQt5.QtTest import QTest
+
+######################### path setup
+project_root = Path(__file__).resolve().parent.parent
+sys.path.append(str(project_root))
+
+from app.database.database import Database
+from app.utils.admin_list import application_store, show_applications, pending_card_style, review_application
+from app.utils.util2 import (display_accepted_scholarships_admin, display_rejected_scholarships_admin,
+                             display_dropped_scholarships_admin)
+
+######################### mock app
+app = QApplication.instance() or QApplication([])
+
+
+def submit(db, username, status):
+    db.sumbitScholarship(username, "Juan", "Dela Cruz", "M", "", f"{username}@test.com", "Lipa", "CICS",
+                         "BSIT", "1st Year", "BCD SCHOLARSHIP", status, 1.5)
+
+
+class TestAdminLists:
+
+    ######################### setup
+    def setup_method(self):
+        self.db = Database(":memory:")
+        for i in range(3):
+            submit(self.db, f"pending{i}", "PENDING")
+        submit(self.db, "accepted0", "ACCEPTED")
+        submit(self.db, "rejected0", "REJECTED")
+
+        self.area = QScrollArea()
+        self.area.resize(1000, 700)
+
+    def show_pending(self):
+        store = application_store(self.db)
+        store.ensure_loaded()
+        return show_applications(self.area, store.model("PENDING"), pending_card_style(), review_application)
+
+    def count_queries(self):
+        calls = []
+        original = self.db.get_user_info_for_admin
+        self.db.get_user_info_for_admin = lambda: calls.append(1) or original()
+        return calls
+
+    def teardown_method(self):
+        self.area.deleteLater()
+        self.db.close()
+
+    def click_action(self, view, row, action):
+        view.show()
+        QApplication.processEvents()
+        rect = view.visualRect(view.model().index(row, 0))
+        _, _, _, boxes = view.delegate.layout_card(rect)
+        QTest.mouseClick(view.viewport(), Qt.LeftButton, pos=boxes[action].center())
+
+    ######################### records are filtered per list
+    def test_lists(self):
+        view = self.show_pending()
+        assert view.model().rowCount() == 3
+
+        display_accepted_scholarships_admin(self.area, self.db)
+        assert self.area.widget() is view
+        assert view.model().rowCount() == 1
+
+        display_rejected_scholarships_admin(self.area, self.db)
+        assert view.model().rowCount() == 1
+        assert view.delegate.card_style["actions"] == []
+
+    ######################### only the shown model drives the view
+    def test_model_swap(self):
+        view = self.show_pending()
+        store = application_store(self.db)
+        pending, accepted = store.model("PENDING"), store.model("ACCEPTED")
+        receivers = pending.receivers(pending.rowsInserted)
+
+        view.setModel(accepted)
+        view.setModel(pending)
+        view.setModel(accepted)
+        assert pending.receivers(pending.rowsInserted) < receivers
+
+        view.delegate._hover = 1
+        submit(self.db, "pending3", "PENDING")
+        store.reload()
+        assert pending.rowCount() == 4
+        assert view.delegate._hover == 1  # a hidden model's inserts leave the view alone
+
+        view.setModel(pending)
+        assert pending.receivers(pending.rowsInserted) == receivers
+        assert accepted.receivers(accepted.rowsRemoved) < pending.receivers(pending.rowsRemoved)
+
+    ######################### only visible rows are painted (uniform row sizes)
+    def test_row_geometry(self):
+        view = self.show_pending()
+        assert view.uniformItemSizes()
+        rect = view.visualRect(view.model().index(1, 0))
+        assert rect.height() == 220 + 15
+
+    ######################### Accept button updates the database and removes the row
+    def test_accept(self):
+        view = self.show_pending()
+        scholar_id = view.model().record(0)[0]
+
+        self.click_action(view, 0, action=0)
+
+        assert view.model().rowCount() == 2
+        statuses = {rec[0]: rec[11] for rec in self.db.get_user_info_for_admin()}
+        assert statuses[scholar_id] == "ACCEPTED"
+
+    ######################### Drop button on the accepted list
+    def test_drop(self):
+        display_accepted_scholarships_admin(self.area, self.db)
+        view = self.area.widget()
+        scholar_id = view.model().record(0)[0]
+
+        self.click_action(view, 0, action=0)
+
+        assert view.model().rowCount() == 0
+        statuses = {rec[0]: rec[11] for rec in self.db.get_user_info_for_admin()}
+        assert statuses[scholar_id] == "DROPPED"
+
+    ######################### tabs share one snapshot and actions only move the affected row
+    def test_shared_snapshot(self):
+        calls = self.count_queries()
+        view = self.show_pending()
+        accepted = application_store(self.db).model("ACCEPTED")
+        removed, inserted = [], []
+        view.model().rowsRemoved.connect(lambda parent, first, last: removed.append((first, last)))
+        accepted.rowsInserted.connect(lambda parent, first, last: inserted.append((first, last)))
+
+        self.click_action(view, 1, action=0)
+        display_accepted_scholarships_admin(self.area, self.db)
+        display_rejected_scholarships_admin(self.area, self.db)
+        display_dropped_scholarships_admin(self.area, self.db)
+
+        assert calls == [1]
+        assert removed == [(1, 1)]
+        assert inserted == [(0, 0)]
+        assert accepted.rowCount() == 2
+
+    ######################### reload applies only the differences
+    def test_reload(self):
+        store = application_store(self.db)
+        store.ensure_loaded()
+        pending = store.model("PENDING")
+        resets = []
+        pending.modelReset.connect(lambda: resets.append(1))
+
+        submit(self.db, "pending3", "PENDING")
+        with self.db.connect() as conn:
+            conn.execute("UPDATE scholarships SET status = 'ACCEPTED' WHERE username = 'pending0'")
+        store.reload()
+
+        assert resets == []
+        assert [pending.record(row)[1] for row in range(pending.rowCount())] == ["pending1", "pending2", "pending3"]
+        assert store.model("ACCEPTED").rowCount() == 2
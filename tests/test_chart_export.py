@@ -0,0 +1,64 @@
+# pytest -v tests/test_chart_export.py
+import sys
+from pathlib import Path
+import pytest
+from PyQt5.QtWidgets import QApplication
+from PyQt5.QtGui import QImage
+
+######################### path setup
+project_root = Path(__file__).resolve().parent.parent
+sys.path.append(str(project_root))
+
+from app.utils.chart_export import build_chart, render_chart, render_batch, report_jobs
+from app.utils.animation_clock import animation_clock
+
+######################### mock app
+app = QApplication.instance() or QApplication([])
+
+BY_MUNICIPALITY = {"Lipa": {"SCHOLAR": 4, "NON-SCHOLAR": 2}, "Rosario": {"SCHOLAR": 1, "NON-SCHOLAR": 3}}
+
+
+class FakeDatabase:
+    def get_all_scholars(self):
+        return {"SCHOLAR": 5, "NON-SCHOLAR": 6}, (11,), BY_MUNICIPALITY
+
+    def get_scholarship_program_stats(self):
+        return {"BCD SCHOLARSHIP": 3}, (3,), {"Lipa": {"BCD SCHOLARSHIP": 2}, "Tuy": {}}
+
+    def filter_by_scholarship(self, scholarship_name):
+        return {"CICS": 2, "CTE": 1}
+
+
+class TestChartExport:
+
+    ######################### charts are rendered on their last frame
+    def test_no_animation(self):
+        chart = build_chart("bar", BY_MUNICIPALITY, size=(600, 400))
+        assert chart._current_height_scale == 1.0
+        assert not animation_clock.is_running(chart)
+
+    ######################### every format is written; PNGs at the requested density
+    def test_formats(self, tmp_path):
+        png = render_chart("donut", {"SCHOLAR": 5, "NON-SCHOLAR": 6}, tmp_path / "donut.png", size=(400, 300))
+        assert QImage(str(png)).size().width() == 800
+
+        svg = render_chart("single", {"CICS": 2, "CTE": 1}, tmp_path / "bars.svg", title="BY COLLEGE")
+        assert "BY COLLEGE" in svg.read_text() and "<image" not in svg.read_text()
+
+        pdf = render_chart("bar", BY_MUNICIPALITY, tmp_path / "sub" / "towns.pdf")
+        assert pdf.read_bytes().startswith(b"%PDF")
+
+        with pytest.raises(ValueError):
+            render_chart("bar", BY_MUNICIPALITY, tmp_path / "towns.jpg")
+
+    ######################### batches run in worker processes and report failures
+    def test_batch(self, tmp_path):
+        jobs = report_jobs(FakeDatabase(), tmp_path, "png")
+        assert [job["path"].name for job in jobs] == [
+            "all_scholars.png", "municipality.png", "accounts_per_municipality.png", "scholarships.png",
+            "lipa_scholarships.png", "bcd_scholarship_by_college.png"]
+
+        jobs.append(dict(kind="pie", data={"A": 1}, path=tmp_path / "pie.png"))
+        written = render_batch(jobs, workers=2)
+        assert written[-1] is None
+        assert all(path.exists() for path in written[:-1])
@@ -0,0 +1,351 @@
+# pytest -v tests/test_charts.py
+import sys
+from pathlib import Path
+import pytest
+from PyQt5.QtWidgets import QApplication
+from PyQt5.QtCore import QObject, QEvent, QPoint, Qt
+from PyQt5.QtCore import QPointF
+from PyQt5.QtGui import QMouseEvent, QWheelEvent
+
+######################### path setup
+project_root = Path(__file__).resolve().parent.parent
+sys.path.append(str(project_root))
+
+from app.utils.BarGraph import AnimatedBarChartWidget
+from app.utils.BarGraph2 import SingleSeriesBarChartWidget
+from app.utils.DonutChart import DonutChartWidget
+from app.utils.animation_clock import AnimationClock, animation_clock
+from app.utils.hit_index import IntervalIndex
+from app.utils.chart_density import top_n_with_other
+
+######################### mock app
+app = QApplication.instance() or QApplication([])
+
+
+class PaintCounter(QObject):
+    """Counts paint events on a widget and the area they repaint."""
+
+    def __init__(self, widget):
+        super().__init__()
+        self.paints, self.area = 0, 0
+        widget.installEventFilter(self)
+
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.Paint:
+            self.paints += 1
+            self.area += sum(r.width() * r.height() for r in event.region().rects())
+        return False
+
+
+def hover(chart, x, y):
+    chart.mouseMoveEvent(QMouseEvent(QEvent.MouseMove, QPoint(x, y), Qt.NoButton, Qt.NoButton, Qt.NoModifier))
+    QApplication.processEvents()
+
+
+def finish(chart):
+    """Run a chart's animation to the end without waiting for the clock."""
+    while chart.update_animation():
+        pass
+
+
+class TestChartRebinding:
+
+    ######################### multi-series bars animate from the old heights
+    def test_bar_chart_set_data(self):
+        chart = AnimatedBarChartWidget({"Lipa": {"SCHOLAR": 4, "NON-SCHOLAR": 2}})
+        finish(chart)
+
+        chart.set_data({"Lipa": {"SCHOLAR": 8, "NON-SCHOLAR": 2}, "Rosario": {"SCHOLAR": 1}}, title="NEW")
+
+        assert animation_clock.is_running(chart)
+        assert chart.title == "NEW"
+        assert chart._displayed_value("Lipa", "SCHOLAR") == 4
+        assert chart._displayed_value("Rosario", "SCHOLAR") == 0
+        finish(chart)
+        assert chart._displayed_value("Lipa", "SCHOLAR") == 8
+        assert chart.max_value == 8
+
+    ######################### single-series bars keep the title when none is given
+    def test_single_series_set_data(self):
+        chart = SingleSeriesBarChartWidget({"CICS": 3, "CTE": 5}, title="BY COLLEGE")
+        finish(chart)
+
+        chart.set_data({"CICS": 6})
+
+        assert chart.title == "BY COLLEGE"
+        assert chart._displayed_value("CICS") == 3
+        finish(chart)
+        assert chart._displayed_value("CICS") == 6
+        assert chart._displayed_value("CTE") == 0
+
+    ######################### donut slices are reused by label
+    def test_donut_set_data(self):
+        chart = DonutChartWidget({"SCHOLAR": 1, "NON-SCHOLAR": 1})
+        chart.start_animation()
+        chart.update_animation(chart.animation_duration)
+        scholar = chart.slices[0]
+        assert scholar.current_span_angle == 2880
+
+        chart.set_data({"SCHOLAR": 3, "NON-SCHOLAR": 1})
+
+        assert chart.slices[0] is scholar
+        assert scholar.from_angle == 2880
+        chart.update_animation(chart.animation_duration)
+        assert scholar.current_span_angle == 4320
+
+        chart.set_data({"SCHOLAR": 3})
+        assert [sl.label for sl in chart.slices] == ["SCHOLAR"]
+
+
+class TestStaticLayer:
+
+    ######################### static layer is rendered once per data/size, not per frame
+    def test_static_layer_cached(self):
+        chart = AnimatedBarChartWidget({"Lipa": {"SCHOLAR": 4, "NON-SCHOLAR": 2}})
+        chart.resize(600, 400)
+        for scale in (0.25, 0.5, 1.0):
+            chart._current_height_scale = scale
+            chart.grab()
+        assert chart._static_layer.renders == 1
+
+        chart.set_data({"Lipa": {"SCHOLAR": 5}})
+        chart.grab()
+        chart.resize(640, 400)
+        chart.grab()
+        assert chart._static_layer.renders == 3
+
+    ######################### donut legend is cached between animation frames
+    def test_donut_static_layer(self):
+        chart = DonutChartWidget({"SCHOLAR": 1, "NON-SCHOLAR": 1})
+        chart.resize(400, 300)
+        chart.start_animation()
+        for step in (100, 500, 700):
+            chart.update_animation(step)
+            chart.grab()
+        assert chart._static_layer.renders == 1
+
+
+class TestAnimationClock:
+
+    ######################### setup
+    def setup_method(self):
+        self.clock = AnimationClock()
+
+    ######################### hidden charts do not advance and keep no timer running
+    def test_hidden_chart_paused(self):
+        chart = SingleSeriesBarChartWidget({"CICS": 3})
+        steps = []
+        self.clock.start(chart, lambda ms: steps.append(ms) or True)
+
+        self.clock.tick(16)
+        assert steps == []
+        assert not self.clock.active
+
+        chart.show()
+        QApplication.processEvents()
+        assert self.clock.active
+        self.clock.tick(16)
+        assert steps == [16]
+
+        chart.hide()
+        self.clock.tick(16)
+        assert steps == [16]
+        assert not self.clock.active
+
+    ######################### finished animations unregister and the timer stops
+    def test_stops_when_idle(self):
+        chart = AnimatedBarChartWidget({"Lipa": {"SCHOLAR": 4}})
+        chart.show()
+        QApplication.processEvents()
+        self.clock.start(chart, chart.update_animation)
+        assert self.clock.active
+
+        for _ in range(100):
+            self.clock.tick(100)
+        assert chart._current_height_scale == 1.0
+        assert not self.clock.is_running(chart)
+        assert not self.clock.active
+        chart.hide()
+
+    ######################### one clock drives every chart
+    def test_shared_clock(self):
+        charts = [AnimatedBarChartWidget({"Lipa": {"SCHOLAR": 4}}),
+                  SingleSeriesBarChartWidget({"CICS": 3}),
+                  DonutChartWidget({"SCHOLAR": 1})]
+        charts[2].start_animation()
+        assert all(animation_clock.is_running(chart) for chart in charts)
+
+
+class TestDirtyRegions:
+
+    ######################### setup
+    def shown(self, chart):
+        chart.resize(600, 400)
+        chart.show()
+        finish(chart)
+        QApplication.processEvents()
+        return PaintCounter(chart)
+
+    ######################### hover repaints only the bars whose state changed
+    def test_bar_hover(self):
+        chart = SingleSeriesBarChartWidget({"CICS": 3, "CTE": 5, "CAS": 4, "CABE": 2})
+        counter = self.shown(chart)
+        chart_left, _, y0, unit, _, _ = chart._chart_geometry()
+        x = int(chart_left + unit / 2)
+
+        hover(chart, x, int(y0 - 5))
+        assert chart._hovered_bar_index == 0
+        assert counter.paints == 1
+        assert counter.area < chart.width() * chart.height() / 4
+
+        hover(chart, x + 2, int(y0 - 8))
+        assert counter.paints == 1
+        chart.hide()
+
+    ######################### animation frames repaint the moving bar tops, not the whole chart
+    def test_bar_animation(self):
+        chart = AnimatedBarChartWidget({"Lipa": {"SCHOLAR": 4, "NON-SCHOLAR": 2}, "Rosario": {"SCHOLAR": 3}})
+        counter = self.shown(chart)
+        chart.set_data({"Lipa": {"SCHOLAR": 5, "NON-SCHOLAR": 2}, "Rosario": {"SCHOLAR": 3}})
+        QApplication.processEvents()
+        counter.paints = counter.area = 0
+
+        chart.update_animation(100)
+        QApplication.processEvents()
+        assert counter.paints == 1
+        assert counter.area < chart.width() * chart.height() / 10
+        chart.hide()
+
+    ######################### donut hover and animation leave title and legend alone
+    def test_donut_regions(self):
+        chart = DonutChartWidget({"SCHOLAR": 1, "NON-SCHOLAR": 1})
+        counter = self.shown(chart)
+        ring = chart._ring_rect()
+        assert ring.bottom() < chart.height() - 25  # legend row stays clean
+
+        center = chart._chart_rect().center()
+        hover(chart, int(center.x() + chart._chart_rect().width() / 2), int(center.y()) + 20)
+        assert chart.hovered_slice is not None
+        assert counter.paints == 1
+        assert counter.area < ring.width() * ring.height()
+        chart.hide()
+
+
+class TestHitTesting:
+
+    ######################### touching intervals yield both neighbours
+    def test_interval_index(self):
+        index = IntervalIndex([(20, 29, "b"), (0, 9, "a"), (10, 20, "c")])
+        assert list(index.candidates(5)) == ["a"]
+        assert list(index.candidates(20)) == ["c", "b"]
+        assert list(index.candidates(35)) == []
+
+    ######################### bars are found by bisect; the index survives mouse moves
+    def test_bar_lookup(self):
+        chart = AnimatedBarChartWidget({f"Town {i}": {"SCHOLAR": i + 1, "NON-SCHOLAR": 3} for i in range(12)})
+        chart.resize(800, 400)
+        finish(chart)
+        geometry = chart._chart_geometry()
+        y0, bar_height_unit = geometry[2], geometry[5]
+
+        x = int(chart._bar_x(5, 1, geometry)) + 2
+        hover(chart, x, int(y0 - 5))
+        assert (chart._hovered_bar_index, chart._hovered_bar_type) == (5, "SCHOLAR")
+        index = chart._hit_index
+
+        hover(chart, x, int(y0 - 6 * bar_height_unit - 5))  # above the bar
+        assert chart._hovered_bar_index == -1
+        assert chart._hit_index is index
+
+        chart.resize(900, 400)
+        hover(chart, x, int(y0 - 5))
+        assert chart._hit_index is not index
+
+    ######################### donut hover follows the painted ring; empty slices are never hit
+    def test_donut_lookup(self):
+        chart = DonutChartWidget({"EMPTY": 0, "SCHOLAR": 1, "NON-SCHOLAR": 1})
+        chart.resize(400, 300)
+        finish(chart)
+        rect = chart._chart_rect()
+        center, radius = rect.center(), rect.width() / 2
+
+        hover(chart, int(center.x() - radius), int(center.y()))  # 9 o'clock: first half, CCW from the top
+        assert chart.hovered_slice.label == "SCHOLAR"
+        hover(chart, int(center.x() + radius), int(center.y()))
+        assert chart.hovered_slice.label == "NON-SCHOLAR"
+        hover(chart, int(center.x()), int(center.y()))
+        assert chart.hovered_slice is None
+
+
+class TestDonutSlices:
+
+    ######################### thin slices and slices past max_slices become "Other"
+    def test_small_slices_merged(self):
+        chart = DonutChartWidget({"A": 50, "B": 45, "C": 1, "D": 1, "E": 1})
+        assert [sl.label for sl in chart.slices] == ["A", "B", "Other (3)"]
+        assert chart.slices[2].value == 3
+
+        chart.set_data({f"Program {i}": i + 10 for i in range(20)})
+        assert len(chart.slices) == chart.max_slices
+        assert chart.slices[-1].label == "Other (13)"
+
+    ######################### slice outlines are reused until the angles or hover change
+    def test_slice_paths_cached(self):
+        chart = DonutChartWidget({"SCHOLAR": 1, "NON-SCHOLAR": 1})
+        chart.resize(400, 300)
+        finish(chart)
+        chart.grab()
+        paths = [sl.path for sl in chart.slices]
+        chart.grab()
+        assert [sl.path for sl in chart.slices] == paths
+
+        chart.hovered_slice = chart.slices[0]
+        chart.grab()
+        assert chart.slices[0].path is not paths[0]
+        assert chart.slices[1].path is paths[1]
+
+
+class TestHighCardinality:
+
+    ######################### top groups keep their order; the rest become "Other"
+    def test_top_n_with_other(self):
+        data = {"A": 5, "B": 1, "C": 9, "D": 2}
+        assert top_n_with_other(data, 2, lambda value: value, sum) == {"A": 5, "C": 9, "Other (2)": 3}
+        assert top_n_with_other(data, 4, lambda value: value, sum) is data
+
+    ######################### too many groups for the width switch modes automatically
+    def test_mode_follows_width(self):
+        data = {f"Program {i}": {"SCHOLAR": i + 1, "NON-SCHOLAR": 1} for i in range(60)}
+        chart = AnimatedBarChartWidget(data)
+        chart.resize(600, 400)
+        chart.show()
+        assert chart._dense and not chart._scrollable
+        assert len(chart.data) == chart.top_n + 1
+        assert chart.data["Other (30)"] == {"SCHOLAR": sum(range(1, 31)), "NON-SCHOLAR": 30}
+
+        chart.resize(2000, 400)
+        assert not chart._dense
+        assert chart.data is data
+        chart.hide()
+
+    ######################### scrolled charts paint only the visible groups
+    def test_scroll_paints_visible(self):
+        chart = SingleSeriesBarChartWidget({f"Course {i}": i % 7 + 1 for i in range(500)})
+        chart.top_n = None
+        chart.resize(600, 400)
+        chart.set_data(chart.source_data)
+        finish(chart)
+        assert chart._scrollable and len(chart.data) == 500
+
+        drawn = []
+        chart._draw_rounded_bar = lambda painter, x, *args: drawn.append(x)
+        chart.grab()
+        assert 0 < len(drawn) < 60
+
+        wheel = QWheelEvent(QPointF(300, 200), QPointF(300, 200), QPoint(), QPoint(0, -240),
+                            Qt.NoButton, Qt.NoModifier, Qt.NoScrollPhase, False)
+        chart.wheelEvent(wheel)
+        assert chart._scroll_x == 240 and wheel.isAccepted()
+        drawn.clear()
+        chart.grab()
+        assert min(drawn) >= chart.margin - chart._chart_geometry()[3]
@@ -0,0 +1,135 @@
+# pytest -v tests/test_database.py
+import sys
+from pathlib import Path
+import sqlite3
+import pytest
+
+######################### path setup
+project_root = Path(__file__).resolve().parent.parent
+sys.path.append(str(project_root))
+
+from app.database.database import Database, LazyDatabase, cancellable
+
+
+def signup(db, username, photo=""):
+    db.handle_signup("student", username, f"{username}@test.com", "password", "NON-SCHOLAR",
+                     photo, "Juan", "Dela Cruz", "M", "", "Single", "Male", "2000-01-01", 24,
+                     f"ID-{username}", "CICS", "1st Year", "BSIT", "Lipa", "09123456789")
+
+
+class TestDatabase:
+
+    ######################### setup
+    def setup_method(self):
+        self.db = Database(":memory:")
+
+    def teardown_method(self):
+        self.db.close()
+
+    ######################### in-memory databases are private and survive across connections
+    def test_memory_database_isolated(self):
+        signup(self.db, "student1")
+        other = Database(":memory:")
+        try:
+            assert self.db.handle_login("student1", "password")
+            assert not other.handle_login("student1", "password")
+        finally:
+            other.close()
+
+    ######################### file path is configurable
+    def test_custom_path(self, tmp_path):
+        db = Database(tmp_path / "nested" / "test.db")
+        signup(db, "student1")
+        assert (tmp_path / "nested" / "test.db").exists()
+        assert Database(tmp_path / "nested" / "test.db").handle_login("student1", "password")
+
+    ######################### photo blobs round-trip through the incremental blob I/O
+    def test_photo_blob_round_trip(self):
+        signup(self.db, "student1")
+        data = bytes(range(256)) * 1000
+        with self.db.connect() as conn:
+            user_id = conn.execute("SELECT id FROM usersInfo WHERE username = ?", ("student1",)).fetchone()[0]
+            self.db._write_photo_blob(conn, user_id, data)
+            assert bytes(self.db._read_photo_blob(conn, user_id)) == data
+            self.db._write_photo_blob(conn, user_id, b"")
+            assert self.db._read_photo_blob(conn, user_id) is None
+
+    ######################### stored photos are streamed one at a time and shrunk in place
+    def test_shrink_profile_photos(self):
+        from io import BytesIO
+        from PIL import Image
+        from app.utils.image_ingest import PROFILE_PHOTO_MAX_SIDE
+
+        def jpeg(size):
+            buffer = BytesIO()
+            Image.effect_noise(size, 60).convert("RGB").save(buffer, format="JPEG", quality=95)
+            return buffer.getvalue()
+
+        photos = {"large": jpeg((2000, 1500)), "small": jpeg((100, 100)), "none": b""}
+        for username in photos:
+            signup(self.db, username)
+        with self.db.connect() as conn:
+            for username, photo in photos.items():
+                user_id = conn.execute("SELECT id FROM usersInfo WHERE username = ?", (username,)).fetchone()[0]
+                self.db._write_photo_blob(conn, user_id, photo)
+            conn.commit()
+
+        reads = []
+        read_photo_blob = self.db._read_photo_blob
+        self.db._read_photo_blob = lambda conn, user_id: reads.append(user_id) or read_photo_blob(conn, user_id)
+        checked, shrunk, saved = self.db.shrink_profile_photos(batch_size=1)
+        assert (checked, shrunk, len(reads)) == (2, 1, 2)
+
+        with self.db.connect() as conn:
+            large, small = (bytes(read_photo_blob(conn, user_id)) for user_id in (1, 2))
+        assert saved == len(photos["large"]) - len(large)
+        assert max(Image.open(BytesIO(large)).size) == PROFILE_PHOTO_MAX_SIDE
+        assert small == photos["small"]
+
+    ######################### queries stop once their caller is cancelled
+    def test_cancellable(self):
+        endless = "WITH RECURSIVE n(i) AS (SELECT 1 UNION ALL SELECT i + 1 FROM n) SELECT COUNT(*) FROM n"
+        with cancellable(lambda: True):
+            with pytest.raises(sqlite3.OperationalError, match="interrupted"):
+                self.db.connect().execute(endless).fetchone()
+        assert self.db.connect().execute("SELECT 1").fetchone() == (1,)
+
+    ######################### committed writes are reported by table
+    def test_change_listeners(self):
+        changes = []
+        self.db.add_change_listener(changes.append)
+        signup(self.db, "student1")
+        self.db.sumbitScholarship("student1", "Juan", "Dela Cruz", "M", "", "student1@test.com", "Lipa",
+                                  "CICS", "BSIT", "1st Year", "BCD SCHOLARSHIP", "PENDING", 1.5)
+        self.db.update_scholarship_status(1, "ACCEPTED")
+        self.db.get_all_scholars()  # reads (and the scholar_stat upkeep they run) are not reported
+        assert changes == [{"usersInfo"}, {"scholarships"}, {"scholarships", "usersInfo"}]
+
+        self.db.remove_change_listener(changes.append)
+        self.db.update_scholarship_status(1, "REJECTED")
+        assert len(changes) == 3
+
+
+class TestLazyDatabase:
+
+    ######################### nothing is created until first use
+    def test_created_on_first_use(self):
+        created = []
+
+        def factory():
+            created.append(Database(":memory:"))
+            return created[-1]
+
+        lazy = LazyDatabase(factory)
+        assert not lazy.is_ready() and not created
+        assert lazy.acc_validation("nobody", "nobody@test.com")
+        assert lazy.get() is created[0] and len(created) == 1
+        created[0].close()
+
+    ######################### injected instances are used as-is
+    def test_set(self):
+        db = Database(":memory:")
+        lazy = LazyDatabase(lambda: pytest.fail("factory should not run"))
+        lazy.set(db)
+        assert lazy.get() is db
+        db.close()
@@ -0,0 +1,50 @@
+# pytest -v tests/test_fonts.py
+import os
+import sys
+from pathlib import Path
+from PyQt5.QtGui import QFont
+from PyQt5.QtWidgets import QApplication
+
+######################### QApplication
+app = QApplication.instance() or QApplication([])
+
+project_root = Path(__file__).resolve().parent.parent
+sys.path.append(str(project_root))
+from app.utils import util
+
+FONT = project_root / "app" / "assets" / "InclusiveSans-Bold.ttf"
+
+
+######################### each TTF is registered with Qt once per process
+class TestFonts:
+    def setup_method(self):
+        self.saved = dict(util._font_families), dict(util._font_cache)
+        util._font_families.clear()
+        util._font_cache.clear()
+
+    def teardown_method(self):
+        util._font_families.update(self.saved[0])
+        util._font_cache.update(self.saved[1])
+
+    def test_registered_once(self, monkeypatch):
+        calls = []
+        add_font = util.QFontDatabase.addApplicationFont
+
+        class CountingFontDatabase(util.QFontDatabase):
+            @staticmethod
+            def addApplicationFont(path):
+                calls.append(path)
+                return add_font(path)
+
+        monkeypatch.setattr(util, "QFontDatabase", CountingFontDatabase)
+        families = util.register_font(FONT)
+        assert families
+        # Relative and absolute paths of the same file share the registration
+        assert util.register_font(os.path.relpath(FONT)) == families
+        fonts = [util.load_font(FONT, 14, bold=True), util.load_font(str(FONT), 10)]
+        assert calls == [str(FONT.resolve())]
+        assert fonts[0].family() == families[0] and fonts[0].weight() == QFont.Bold
+
+    def test_missing_font(self):
+        assert util.register_font(project_root / "missing.ttf") == []
+        assert util.load_font(project_root / "missing.ttf") == QFont()
@@ -0,0 +1,63 @@
+# pytest -v tests/test_image_ingest.py
+import sys
+from io import BytesIO
+from pathlib import Path
+import pytest
+from PIL import Image
+
+######################### path setup
+project_root = Path(__file__).resolve().parent.parent
+sys.path.append(str(project_root))
+
+from app.utils.image_ingest import (prepare_profile_photo, needs_ingest, PROFILE_PHOTO_MAX_SIDE,
+                                    PROFILE_PHOTO_BUDGET)
+
+
+def make_jpeg(size, orientation=None):
+    image = Image.effect_noise(size, 60).convert("RGB")
+    exif = image.getexif()
+    if orientation:
+        exif[0x0112] = orientation
+    buffer = BytesIO()
+    image.save(buffer, format="JPEG", quality=95, exif=exif.tobytes())
+    return buffer.getvalue()
+
+
+class TestImageIngest:
+
+    ######################### large photos are capped and fit the budget
+    def test_downscale_and_budget(self):
+        blob = prepare_profile_photo(make_jpeg((3000, 2000)))
+        image = Image.open(BytesIO(blob))
+        assert max(image.size) == PROFILE_PHOTO_MAX_SIDE
+        assert len(blob) <= PROFILE_PHOTO_BUDGET
+
+    ######################### EXIF orientation is applied and metadata dropped
+    def test_orientation_and_metadata(self):
+        blob = prepare_profile_photo(make_jpeg((1200, 800), orientation=6))
+        image = Image.open(BytesIO(blob))
+        assert image.size == (400, PROFILE_PHOTO_MAX_SIDE)
+        assert not image.getexif()
+
+    ######################### transparent photos keep their alpha and are downscaled to the budget
+    def test_transparent_budget(self):
+        image = Image.merge("RGBA", [Image.effect_noise((1500, 1500), 90).convert("L") for _ in range(4)])
+        buffer = BytesIO()
+        image.save(buffer, format="PNG")
+        assert len(buffer.getvalue()) > PROFILE_PHOTO_BUDGET
+
+        blob = prepare_profile_photo(buffer.getvalue())
+        result = Image.open(BytesIO(blob))
+        assert result.format == "PNG" and result.mode == "RGBA"
+        assert len(blob) <= PROFILE_PHOTO_BUDGET
+        assert max(result.size) < PROFILE_PHOTO_MAX_SIDE
+        assert not needs_ingest(blob)
+
+    ######################### ingested photos are not processed again
+    def test_needs_ingest(self):
+        assert needs_ingest(make_jpeg((3000, 2000)))
+        assert not needs_ingest(prepare_profile_photo(make_jpeg((3000, 2000))))
+
+    ######################### invalid data
+    def test_invalid_image(self):
+        assert prepare_profile_photo(b"not an image") == b""
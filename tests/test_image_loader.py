@@ -0,0 +1,77 @@
+# pytest -v tests/test_image_loader.py
+import sys
+from pathlib import Path
+from PyQt5 import sip
+from PyQt5.QtCore import QBuffer, QByteArray, QIODevice
+from PyQt5.QtGui import QColor, QImage
+from PyQt5.QtWidgets import QApplication, QLabel
+
+######################### path setup
+project_root = Path(__file__).resolve().parent.parent
+sys.path.append(str(project_root))
+
+from app.utils.image_loader import AsyncImageLoader, decode_image
+
+######################### mock app
+app = QApplication.instance() or QApplication([])
+
+
+def make_png(width, height, color="#2ECC71"):
+    image = QImage(width, height, QImage.Format_RGB32)
+    image.fill(QColor(color))
+    data = QByteArray()
+    buffer = QBuffer(data)
+    buffer.open(QIODevice.WriteOnly)
+    image.save(buffer, "PNG")
+    return bytes(data)
+
+
+class TestImageLoader:
+
+    def setup_method(self):
+        self.loader = AsyncImageLoader()
+        self.target = QLabel()
+        self.delivered = []
+
+    def teardown_method(self):
+        self.loader.thread_pool.waitForDone()
+        if not sip.isdeleted(self.target):
+            self.target.deleteLater()
+
+    def finish(self):
+        # Decodes finish on the pool; their results are queued to the GUI thread
+        self.loader.thread_pool.waitForDone()
+        QApplication.processEvents()
+
+    ######################### blobs decode straight from their buffer, at the target size
+    def test_decode_image(self):
+        blob = b"header" + make_png(80, 40)
+        image = decode_image(memoryview(blob)[6:], (20, 20))
+        assert (image.width(), image.height()) == (20, 10)
+        circle = decode_image(blob[6:], (20, 20), shape="circle")
+        assert circle.width() == circle.height() == 10
+
+    ######################### a reload supersedes a result that finished but was not delivered
+    def test_stale_result_dropped_on_reload(self):
+        self.loader.load(self.target, make_png(30, 30), None, self.delivered.append)
+        self.loader.thread_pool.waitForDone()
+        self.loader.load(self.target, make_png(50, 50), None, self.delivered.append)
+        self.finish()
+        assert [pixmap.width() for pixmap in self.delivered] == [50]
+
+    ######################### a destroyed target gets nothing
+    def test_destroyed_target(self):
+        self.loader.load(self.target, make_png(30, 30), None, self.delivered.append)
+        self.loader.thread_pool.waitForDone()
+        sip.delete(self.target)
+        self.finish()
+        assert self.delivered == []
+        assert not self.loader._tasks and not self.loader._current and not self.loader._watched
+
+    ######################### undecodable data is reported, not delivered
+    def test_decode_failure(self, capsys):
+        self.loader.load(self.target, b"not an image", (20, 20), self.delivered.append)
+        self.finish()
+        assert self.delivered == []
+        assert not self.loader._tasks and not self.loader._current
+        assert "Invalid image" in capsys.readouterr().out
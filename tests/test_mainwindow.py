@@ -0,0 +1,165 @@
+# pytest -v tests/test_mainwindow.py
+import sys
+from pathlib import Path
+from PyQt5.QtCore import QEvent
+from PyQt5.QtWidgets import QApplication
+from PyQt5.QtTest import QTest
+
+######################### QApplication
+app = QApplication.instance() or QApplication([])
+
+project_root = Path(__file__).resolve().parent.parent
+sys.path.append(str(project_root))
+from app.database.database import Database, database
+from app.gui.MainWindow import MainWindow
+
+
+def settle():
+    # Outside exec_() deleteLater() only runs when the deferred deletes are sent explicitly
+    for _ in range(3):
+        app.processEvents()
+        app.sendPostedEvents(None, QEvent.DeferredDelete)
+
+
+######################### MainWindow bound to an in-memory database
+class TestMainWindow:
+    def setup_method(self):
+        self.previous = database._instance
+        self.db = Database(":memory:")
+        database.set(self.db)
+        for username, acctype in (("stud", "STUDENT"), ("boss", "ADMIN")):
+            self.db.handle_signup(acctype, username, f"{username}@test.com", "pw", "NON-SCHOLAR", "",
+                                  "Juan", "Cruz", "M", "", "Single", "Male", "2000-01-01", 24, f"ID-{username}",
+                                  "CICS", "1st Year", "BSIT", "Lipa", "0912")
+        self.window = MainWindow(username="stud")
+        self.window.show()
+        settle()
+
+    def teardown_method(self):
+        self.window.unbind_user()
+        self.window.close()
+        self.window.deleteLater()
+        settle()
+        database.set(self.previous)
+
+    def count_builds(self):
+        builds = []
+        original = self.window.page_builders
+
+        def page_builders():
+            return {page: (lambda page=page, build=build: builds.append(page) or build())
+                    for page, build in original().items()}
+        self.window.page_builders = page_builders
+        return builds
+
+    def visit(self, *pages):
+        for page in pages:
+            self.window.stacks.setCurrentIndex(page)
+            self.window._prefetch_timer.stop()  # only visits build pages here
+            settle()
+
+    ######################### pages are built on their first visit, once
+    def test_lazy_pages(self):
+        builds = self.count_builds()
+        assert builds == [] and self.window._charts == {}
+
+        self.visit(MainWindow.PROFILE_PAGE)
+        assert builds == [MainWindow.PROFILE_PAGE]
+
+        self.visit(MainWindow.HOME_PAGE, MainWindow.DASHBOARD_PAGE, MainWindow.PROFILE_PAGE,
+                   MainWindow.DASHBOARD_PAGE, MainWindow.HOME_PAGE)
+        assert builds == [MainWindow.PROFILE_PAGE, MainWindow.DASHBOARD_PAGE]
+        assert self.window._built_pages == {MainWindow.PROFILE_PAGE, MainWindow.DASHBOARD_PAGE}
+
+        # A new user starts over with nothing built
+        self.window.bind_user("boss")
+        assert self.window._built_pages == set()
+        self.visit(MainWindow.SCHOLAR_PAGE, MainWindow.HOME_PAGE, MainWindow.SCHOLAR_PAGE)
+        assert builds[2:] == [MainWindow.SCHOLAR_PAGE]
+
+    ######################### an idle window warms only the most likely next page
+    def test_idle_prefetch(self):
+        self.window.bind_user("boss")
+        builds = self.count_builds()
+        QTest.qWait(MainWindow.PREFETCH_DELAY_MS * 4)
+        settle()
+        assert builds == [MainWindow.SCHOLAR_PAGE]
+        assert self.window._built_pages == {MainWindow.SCHOLAR_PAGE} and self.window._charts == {}
+
+    ######################### a write dirties the pages built from its tables; they rebuild when shown
+    def test_change_events(self):
+        builds = self.count_builds()
+        self.visit(MainWindow.PROFILE_PAGE, MainWindow.DASHBOARD_PAGE, MainWindow.HOME_PAGE)
+        del builds[:]
+
+        self.db.handle_signup("STUDENT", "other", "other@test.com", "pw", "NON-SCHOLAR", "", "Ana", "Reyes", "B",
+                              "", "Single", "Female", "2001-01-01", 23, "ID-other", "CTE", "2nd Year", "BSED",
+                              "Lipa", "0913")
+        assert self.window._dirty_pages == {MainWindow.DASHBOARD_PAGE}  # usersInfo only
+
+        self.db.sumbitScholarship("stud", "Juan", "Cruz", "M", "", "stud@test.com", "Lipa", "CICS", "BSIT",
+                                  "1st Year", "BCD SCHOLARSHIP", "PENDING", 1.5)
+        assert self.window._dirty_pages == {MainWindow.DASHBOARD_PAGE, MainWindow.PROFILE_PAGE}
+        assert builds == []  # nothing is rebuilt behind the home page
+
+        self.visit(MainWindow.PROFILE_PAGE)
+        assert builds == [MainWindow.PROFILE_PAGE]
+        assert self.window._dirty_pages == {MainWindow.DASHBOARD_PAGE}
+        assert self.window.StudentStatusArea.widget().layout().count() == 1
+
+        # The page on screen is rebuilt at once
+        self.db.sumbitScholarship("stud", "Juan", "Cruz", "M", "", "stud@test.com", "Lipa", "CICS", "BSIT",
+                                  "1st Year", "DSWD SCHOLARSHIP", "PENDING", 1.5)
+        assert builds == [MainWindow.PROFILE_PAGE, MainWindow.PROFILE_PAGE]
+        settle()
+        assert self.window.StudentStatusArea.widget().layout().count() == 2
+        self.visit(MainWindow.HOME_PAGE, MainWindow.DASHBOARD_PAGE, MainWindow.DASHBOARD_PAGE)
+        assert builds[2:] == [MainWindow.DASHBOARD_PAGE] and not self.window._dirty_pages
+
+    ######################### a student's window can be rebound to an admin
+    def test_rebind_student_to_admin(self):
+        self.window.stacks.setCurrentIndex(MainWindow.PROFILE_PAGE)
+        settle()
+        assert self.window.StudentStatusArea.widget().layout().count() > 0
+
+        self.window.bind_user("boss")
+        assert self.window.is_admin and self.window.is_reusable()
+        for page in (MainWindow.PROFILE_PAGE, MainWindow.DASHBOARD_PAGE, MainWindow.SCHOLAR_PAGE,
+                     MainWindow.PROFILE_PAGE):
+            self.window.stacks.setCurrentIndex(page)
+            settle()
+        assert self.window.widget_76.isVisible()
+        assert not self.window.StudentStatusArea.isVisible()
+
+    ######################### a window that lost its role widgets is replaced, not reused
+    def test_show_mainwindow_replaces_unusable_window(self):
+        from app_manager import ApplicationManager
+
+        class Stub:
+            def stop(self):
+                pass
+
+            def isVisible(self):
+                return False
+
+        class Manager:
+            def __init__(self, window):
+                self.mainwindow = window
+                self._prewarm_timer = self.logandsign = Stub()
+                self.shown = None
+
+            def _show_window(self, window, maximized=False):
+                self.shown = window
+
+        self.window.AdminArea.deleteLater()
+        settle()
+        assert not self.window.is_reusable()
+
+        manager = Manager(self.window)
+        ApplicationManager.show_mainwindow(manager, "boss")
+        try:
+            assert manager.mainwindow is not self.window
+            assert manager.shown is manager.mainwindow and manager.mainwindow.is_admin
+        finally:
+            manager.mainwindow.unbind_user()
+            manager.mainwindow.deleteLater()
@@ -0,0 +1,73 @@
+# pytest -v tests/test_perf_hud.py
+import sys
+from pathlib import Path
+from PyQt5.QtWidgets import QApplication, QWidget, QVBoxLayout
+
+######################### path setup
+project_root = Path(__file__).resolve().parent.parent
+sys.path.append(str(project_root))
+
+from app.database.database import Database, database
+from app.utils.perf_hud import install_perf_hud
+from app.utils.BarGraph2 import SingleSeriesBarChartWidget
+from app.utils.animation_clock import animation_clock
+
+######################### mock app
+app = QApplication.instance() or QApplication([])
+
+
+class TestPerfHud:
+
+    ######################### setup
+    def setup_method(self):
+        self.previous = database._instance
+        self.db = Database(":memory:")
+        database.set(self.db)
+        self.window = QWidget()
+        self.window.resize(900, 600)
+        self.chart = SingleSeriesBarChartWidget({"CICS": 2, "CTE": 1}, title="BY COLLEGE")
+        QVBoxLayout(self.window).addWidget(self.chart)
+        self.hud = install_perf_hud(self.window)
+        self.window.show()
+        QApplication.processEvents()
+
+    def teardown_method(self):
+        if self.hud.isVisible():
+            self.hud.toggle()
+        self.window.deleteLater()
+        database.set(self.previous)
+        self.db.close()
+
+    ######################### probes are only installed while the HUD is shown
+    def test_instrumentation_removed(self):
+        paint = SingleSeriesBarChartWidget.__dict__["paintEvent"]
+        self.hud.toggle()
+        assert SingleSeriesBarChartWidget.__dict__["paintEvent"] is not paint
+        assert "filter_by_scholarship" in vars(self.db)
+
+        self.hud.toggle()
+        assert not self.hud.isVisible()
+        assert SingleSeriesBarChartWidget.__dict__["paintEvent"] is paint
+        assert "filter_by_scholarship" not in vars(self.db)
+
+    ######################### frames, chart paints and database calls are reported
+    def test_report(self):
+        self.hud.toggle()
+        database.filter_by_scholarship("BCD SCHOLARSHIP")
+        self.chart.start_animation()
+        for _ in range(5):
+            animation_clock.tick(16)
+            QApplication.processEvents()
+        self.hud.refresh()
+
+        monitor = self.hud.monitor
+        assert monitor.frame_ms and monitor.chart_paints
+        assert [call[0] for call in monitor.db_calls] == ["filter_by_scholarship"]
+        assert any(line.strip().startswith("BY COLLEGE") for line in self.hud.lines)
+        assert self.hud.geometry().right() < self.window.width()
+
+        app.first_window_ms = 412.0
+        try:
+            assert "startup     412 ms to the login window" in monitor.report()
+        finally:
+            del app.first_window_ms
@@ -0,0 +1,77 @@
+# pytest -v tests/test_pixmap_cache.py
+import sys
+from pathlib import Path
+from PyQt5.QtGui import QColor, QImage, QPixmap
+from PyQt5.QtWidgets import QApplication
+
+######################### path setup
+project_root = Path(__file__).resolve().parent.parent
+sys.path.append(str(project_root))
+
+from app.utils.pixmap_cache import PixmapCache, blob_key, resource_pixmap, pixmap_cache
+
+######################### mock app
+app = QApplication.instance() or QApplication([])
+
+
+def make_pixmap(width, height):
+    pixmap = QPixmap(width, height)
+    pixmap.fill(QColor("#3498DB"))
+    return pixmap
+
+
+class TestPixmapCache:
+
+    def setup_method(self):
+        self.cost = PixmapCache._cost(make_pixmap(10, 10))
+        self.cache = PixmapCache(budget_bytes=3 * self.cost)
+
+    ######################### least recently used entries go first
+    def test_lru_eviction(self):
+        for name in "abc":
+            self.cache.put((name, None, "plain"), make_pixmap(10, 10))
+        assert self.cache.get(("a", None, "plain")) is not None  # a is now the most recent
+        self.cache.put(("d", None, "plain"), make_pixmap(10, 10))
+
+        assert self.cache.get(("b", None, "plain")) is None
+        for name in "acd":
+            assert self.cache.get((name, None, "plain")) is not None
+        assert (self.cache.hits, self.cache.misses) == (4, 1)
+
+    ######################### the byte budget bounds the cache, not the entry count
+    def test_byte_budget(self):
+        self.cache.put(("small", None, "plain"), make_pixmap(10, 10))
+        self.cache.put(("wide", None, "plain"), make_pixmap(20, 10))
+        assert self.cache.used_bytes == 3 * self.cost
+
+        self.cache.put(("wide", None, "plain"), make_pixmap(10, 10))  # replacing an entry refunds its cost
+        assert self.cache.used_bytes == 2 * self.cost
+
+        huge = make_pixmap(40, 40)
+        assert self.cache.put(("huge", None, "plain"), huge) is huge  # returned, but never cached
+        assert self.cache.get(("huge", None, "plain")) is None
+        assert self.cache.used_bytes == 2 * self.cost
+
+        self.cache.clear()
+        assert self.cache.used_bytes == 0 and self.cache.get(("small", None, "plain")) is None
+
+    ######################### every size and shape of a source is its own entry
+    def test_keyed_by_size(self, tmp_path):
+        path = str(tmp_path / "logo.png")
+        image = QImage(40, 20, QImage.Format_RGB32)
+        image.fill(QColor("#2ECC71"))
+        image.save(path)
+
+        natural = resource_pixmap(path)
+        small = resource_pixmap(path, (20, 20))
+        assert (natural.width(), natural.height()) == (40, 20)
+        assert (small.width(), small.height()) == (20, 10)
+        assert resource_pixmap(path, (20, 20)) is small
+        assert pixmap_cache.get((path, (20, 20), "circle")) is None
+
+        created = []
+        key = (blob_key(b"photo"), (20, 20), "circle")
+        self.cache.get_or_create(key, lambda: created.append(1) or make_pixmap(10, 10))
+        self.cache.get_or_create(key, lambda: created.append(1) or make_pixmap(10, 10))
+        assert created == [1]
+        assert blob_key(b"photo") == blob_key(memoryview(b"photo")) != blob_key(b"photo2")
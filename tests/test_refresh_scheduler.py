@@ -0,0 +1,73 @@
+# pytest -v tests/test_refresh_scheduler.py
+import sys
+import threading
+from pathlib import Path
+from PyQt5.QtWidgets import QApplication
+
+######################### path setup
+project_root = Path(__file__).resolve().parent.parent
+sys.path.append(str(project_root))
+
+from app.utils.refresh_scheduler import RefreshScheduler
+
+######################### mock app
+app = QApplication.instance() or QApplication([])
+
+
+class TestRefreshScheduler:
+
+    ######################### setup
+    def setup_method(self):
+        self.scheduler = RefreshScheduler()
+        self.queries = []
+        self.applied = []
+
+    def query(self, value):
+        def run():
+            self.queries.append(value)
+            return value
+        return run
+
+    def settle(self):
+        for _ in range(3):
+            app.processEvents()
+            self.scheduler.thread_pool.waitForDone()
+        app.processEvents()
+
+    ######################### a burst runs once, with the last request
+    def test_coalesce(self):
+        for value in ("SBCD", "SNone", "SBSU"):
+            self.scheduler.request("filter", self.query(value), self.applied.append)
+        self.scheduler.request("dashboard", self.query("all"), self.applied.append)
+        assert self.queries == [] and self.scheduler.is_busy("filter")
+
+        self.settle()
+        assert sorted(self.queries) == ["SBSU", "all"]
+        assert sorted(self.applied) == ["SBSU", "all"]
+        assert not self.scheduler.is_busy("filter")
+
+    ######################### a newer request cancels the running query and drops its result
+    def test_stale_result_dropped(self):
+        started, release = threading.Event(), threading.Event()
+
+        def slow():
+            started.set()
+            release.wait(5)
+            return "stale"
+
+        self.scheduler.request("filter", slow, self.applied.append)
+        self.scheduler.flush()
+        assert started.wait(5)
+        self.scheduler.request("filter", self.query("fresh"), self.applied.append)
+        release.set()
+
+        self.settle()
+        assert self.applied == ["fresh"]
+        assert self.scheduler.dropped == 1
+
+    ######################### cancel() forgets pending requests
+    def test_cancel(self):
+        self.scheduler.request("filter", self.query("SBCD"), self.applied.append, delay_ms=50)
+        self.scheduler.cancel()
+        self.settle()
+        assert self.queries == [] and self.applied == []
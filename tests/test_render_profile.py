@@ -0,0 +1,60 @@
+# pytest -v tests/test_render_profile.py
+import sys
+from pathlib import Path
+import pytest
+from PyQt5.QtWidgets import QApplication, QWidget
+from PyQt5.QtGui import QPainter
+
+######################### path setup
+project_root = Path(__file__).resolve().parent.parent
+sys.path.append(str(project_root))
+
+from app.utils.render_profile import render_profile, RENDER_PROFILE_ENV
+from app.utils.animation_clock import animation_clock
+from app.utils.BarGraph2 import SingleSeriesBarChartWidget
+from app.utils.DonutChart import create_donut_chart_widget
+
+######################### mock app
+app = QApplication.instance() or QApplication([])
+
+
+class TestRenderProfile:
+
+    def teardown_method(self):
+        render_profile.select("normal")
+
+    ######################### setting, environment or benchmark
+    def test_configure(self, monkeypatch):
+        render_profile.frame_ms.clear()
+        monkeypatch.setenv(RENDER_PROFILE_ENV, "low")
+        assert render_profile.configure() == "low"
+        assert render_profile.configure("Normal") == "normal"
+        assert render_profile.frame_ms == {}  # a forced profile costs no benchmark
+
+        monkeypatch.setenv(RENDER_PROFILE_ENV, "auto")
+        monkeypatch.setattr(render_profile, "LOW_END_FRAME_MS", 0.0)
+        assert render_profile.configure() == "low"
+        assert render_profile.frame_ms["normal"] > 0
+        assert "Render profile: low" in render_profile.report()
+
+        with pytest.raises(ValueError):
+            render_profile.configure("fast")
+
+    ######################### charts skip their animation, shadows and antialiasing
+    def test_low_profile(self):
+        render_profile.select("low")
+        assert not render_profile.render_hints() & QPainter.Antialiasing
+
+        chart = SingleSeriesBarChartWidget({"CICS": 2, "CTE": 1})
+        assert chart._current_height_scale == 1.0
+        assert not animation_clock.is_running(chart)
+
+        root = QWidget()
+        donut = create_donut_chart_widget({"SCHOLAR": 5, "NON-SCHOLAR": 6}, parent=root)
+        assert donut.animation_elapsed == donut.animation_duration
+        assert len(root.children()) == 1  # no shadow underlay next to it
+
+        render_profile.select("normal")
+        chart.start_animation()
+        assert animation_clock.is_running(chart)
+        animation_clock.stop(chart)
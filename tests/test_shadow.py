@@ -0,0 +1,74 @@
+# pytest -v tests/test_shadow.py
+import sys
+from pathlib import Path
+import pytest
+from PyQt5.QtWidgets import QApplication, QWidget, QGraphicsDropShadowEffect
+from PyQt5.QtGui import QColor, QImage
+
+######################### path setup
+project_root = Path(__file__).resolve().parent.parent
+sys.path.append(str(project_root))
+
+from app.utils.shadow import CachedShadow, shadow_patch, border_radius
+
+######################### mock app
+app = QApplication.instance() or QApplication([])
+
+
+class TestCachedShadow:
+
+    ######################### setup
+    def setup_method(self):
+        self.root = QWidget()
+        self.root.resize(500, 360)
+        self.root.setStyleSheet("background: #dbefe1;")
+        self.card = QWidget(self.root)
+        self.card.setObjectName("card")
+        self.card.setGeometry(120, 90, 260, 150)
+        self.card.setStyleSheet("#card { background: white; border-radius: 18px; }")
+
+    def teardown_method(self):
+        self.root.deleteLater()
+
+    def render(self):
+        self.root.show()
+        QApplication.processEvents()
+        return self.root.grab().toImage().convertToFormat(QImage.Format_RGB32)
+
+    ######################### radius is read from the stylesheet
+    def test_border_radius(self):
+        assert border_radius(self.card) == 18
+
+    ######################### looks like QGraphicsDropShadowEffect
+    def test_matches_effect(self):
+        effect = QGraphicsDropShadowEffect(self.card)
+        effect.setBlurRadius(25)
+        effect.setOffset(0, 15)
+        effect.setColor(QColor(0, 0, 0, 180))
+        self.card.setGraphicsEffect(effect)
+        expected = self.render()
+
+        CachedShadow(self.card, 25, (0, 15), QColor(0, 0, 0, 180))
+        assert self.card.graphicsEffect() is None
+        actual = self.render()
+
+        worst = max(abs(((expected.pixel(x, y) >> shift) & 255) - ((actual.pixel(x, y) >> shift) & 255))
+                    for y in range(0, expected.height(), 2) for x in range(0, expected.width(), 2)
+                    for shift in (0, 8, 16))
+        assert worst <= 8
+
+    ######################### one blurred patch per (radius, blur, color)
+    def test_patch_cached(self):
+        first, _ = shadow_patch(18, 25, QColor(0, 0, 0, 180))
+        second, _ = shadow_patch(18, 25, QColor(0, 0, 0, 180))
+        assert first.cacheKey() == second.cacheKey()
+
+    ######################### underlay follows the widget
+    def test_follows_widget(self):
+        shadow = CachedShadow(self.card, 20, (0, 0), QColor(0, 0, 0, 180))
+        self.render()
+        self.card.setGeometry(40, 30, 200, 100)
+        assert shadow.underlay.geometry() == self.card.geometry().adjusted(-20, -20, 20, 20)
+
+        self.card.hide()
+        assert shadow.underlay.isHidden()
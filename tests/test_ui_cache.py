@@ -0,0 +1,86 @@
+# pytest -v tests/test_ui_cache.py
+import sys
+from pathlib import Path
+import pytest
+from PyQt5.QtWidgets import QApplication, QWidget
+
+######################### path setup
+project_root = Path(__file__).resolve().parent.parent
+sys.path.append(str(project_root))
+
+from app.utils import ui_cache
+
+######################### mock app
+app = QApplication.instance() or QApplication([])
+
+FORM = """<?xml version="1.0" encoding="UTF-8"?>
+<ui version="4.0">
+ <class>Form</class>
+ <widget class="QWidget" name="Form">
+  <layout class="QVBoxLayout" name="layout">
+   <item>
+    <widget class="QLabel" name="{name}">
+     <property name="text"><string>{text}</string></property>
+    </widget>
+   </item>
+  </layout>
+ </widget>
+</ui>
+"""
+
+
+class TestUiCache:
+
+    @pytest.fixture(autouse=True)
+    def cache_dir(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(ui_cache, "UI_CACHE_DIR", tmp_path / "__uicache__")
+        self.ui_path = tmp_path / "Form.ui"
+        self.ui_path.write_text(FORM.format(name="title", text="First"), encoding="utf-8")
+
+    def load(self):
+        return ui_cache.load_ui(self.ui_path, QWidget())
+
+    def cached_modules(self):
+        return sorted(ui_cache.UI_CACHE_DIR.glob("ui_Form_*.py"))
+
+    ######################### compiled on first use, imported afterwards
+    def test_compiled_then_reused(self, monkeypatch):
+        assert self.load().title.text() == "First"
+        assert len(self.cached_modules()) == 1
+
+        monkeypatch.setattr(ui_cache.uic, "loadUi", None)  # must not be needed any more
+        assert self.load().title.text() == "First"
+        assert self.load().title.text() == "First"
+
+    ######################### an edited .ui gets a new hash and replaces the old module
+    def test_changed_ui_invalidates(self):
+        self.load()
+        old = self.cached_modules()
+
+        self.ui_path.write_text(FORM.format(name="heading", text="Second"), encoding="utf-8")
+        widget = self.load()
+        assert widget.heading.text() == "Second" and not hasattr(widget, "title")
+        new = self.cached_modules()
+        assert len(new) == 1 and new != old
+        assert self.load().heading.text() == "Second"
+
+    ######################### failures fall back to uic.loadUi
+    def test_compile_failure_falls_back(self, monkeypatch, capsys):
+        def broken(*args, **kwargs):
+            raise RuntimeError("no compiler")
+
+        monkeypatch.setattr(ui_cache.uic, "compileUi", broken)
+        assert self.load().title.text() == "First"
+        assert self.cached_modules() == []
+        assert "Could not compile Form.ui" in capsys.readouterr().out
+        assert self.load().title.text() == "First"
+
+    def test_import_failure_falls_back(self, capsys):
+        self.load()
+        module_path, = self.cached_modules()
+        module_path.write_text("raise ImportError('damaged')\n", encoding="utf-8")
+
+        assert self.load().title.text() == "First"
+        assert "is unusable, using loadUi" in capsys.readouterr().out
+        assert self.load().title.text() == "First"  # not retried in this process
+        assert capsys.readouterr().out == ""